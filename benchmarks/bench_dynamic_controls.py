@@ -0,0 +1,89 @@
+"""
+Before/after benchmark of the wait strategy on the Dynamic Controls flow.
+
+    before:   implicit wait of 2 s + WebDriverWait's default 0.5 s polling
+    after:    implicit waits off + WaitEngine polling from config.json
+    observer: implicit waits off + in-browser MutationObserver waits
+
+Both modes run the same DynamicControlsPage flow as
+tests/test_dynamic_controls.py against the configured browser.
+
+Usage:
+    python benchmarks/bench_dynamic_controls.py [--runs N]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import DRIVER_SERVICES, _create_driver  # noqa: E402
+from pages.dynamic_controls_page import DynamicControlsPage  # noqa: E402
+from utils.config_loader import CONFIG  # noqa: E402
+from utils.wait_engine import DEFAULT_POLL_FREQUENCY, OBSERVER_MODE, POLL_MODE, WaitEngine  # noqa: E402
+
+POLL_FREQUENCY = float(CONFIG.get("poll_frequency", DEFAULT_POLL_FREQUENCY))
+MODES = {
+    "before": {"implicit_wait": 2, "poll_frequency": 0.5, "mode": POLL_MODE},
+    "after": {"implicit_wait": 0, "poll_frequency": POLL_FREQUENCY, "mode": POLL_MODE},
+    "observer": {"implicit_wait": 0, "poll_frequency": POLL_FREQUENCY, "mode": OBSERVER_MODE},
+}
+
+
+def run_flow(driver, wait: WaitEngine) -> float:
+    """
+    Run the dynamic controls flow once.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    start = time.perf_counter()
+    page = DynamicControlsPage(driver, wait)
+    page.open()
+    page.remove_checkbox()
+    assert not page.is_checkbox_present()
+    page.add_checkbox()
+    assert page.is_checkbox_present()
+    page.enable_input()
+    assert page.is_input_enabled()
+    page.type_in_input("Testing dynamic controls")
+    page.disable_input()
+    assert not page.is_input_enabled()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode (default: 3)")
+    args = parser.parse_args()
+
+    timeout = CONFIG.get("timeout", 10)
+    driver = _create_driver()
+    driver.set_script_timeout(timeout + 5)
+    results = {}
+    try:
+        for mode, settings in MODES.items():
+            driver.implicitly_wait(settings["implicit_wait"])
+            wait = WaitEngine(driver, timeout, poll_frequency=settings["poll_frequency"], mode=settings["mode"])
+            results[mode] = [run_flow(driver, wait) for _ in range(args.runs)]
+    finally:
+        driver.quit()
+        # _create_driver() starts the shared driver service; stop it with the session
+        DRIVER_SERVICES.close()
+
+    print(f"{'mode':<10}{'implicit':>10}{'poll':>8}{'mean':>10}{'min':>10}")
+    for mode, samples in results.items():
+        settings = MODES[mode]
+        print(f"{mode:<10}{settings['implicit_wait']:>9}s{settings['poll_frequency']:>7}s"
+              f"{statistics.mean(samples):>9.2f}s{min(samples):>9.2f}s")
+    baseline = statistics.mean(results["before"])
+    for mode in ("after", "observer"):
+        print(f"saved per run ({mode}): {baseline - statistics.mean(results[mode]):.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Benchmark every class-level locator of the page objects under pages/.
+
+For each page class with a URL, the page is opened and each locator
+(`NAME = (By.X, "...")`) is resolved `--repeat` times with find_elements().
+The median is compared with a trivial lookup (`body` by tag name) on the
+same page, which is the WebDriver round-trip floor.
+
+Flags:
+    slow       median above --slow-factor x the round-trip floor
+    text-xpath XPath matching on text(), which needs a full document scan
+    ambiguous  more than one match (expected for plural names such as OPTIONS)
+    not found  not on the page as first loaded (appears after an interaction)
+
+For flagged locators the tool suggests faster equivalents (see
+utils.locator_optimizer); a suggestion is only printed once it resolves to
+the same element(s) as the original.
+
+Usage:
+    python benchmarks/bench_locators.py [--repeat N] [--slow-factor F] [--page NAME]
+"""
+import argparse
+import importlib
+import inspect
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from selenium.webdriver.common.by import By  # noqa: E402
+
+from conftest import DRIVER_SERVICES, _create_driver  # noqa: E402
+from utils.locator_optimizer import suggest_locators  # noqa: E402
+
+STRATEGIES = {value for name, value in vars(By).items() if name.isupper()}
+FLOOR_LOCATOR = (By.TAG_NAME, "body")
+
+
+def discover_pages() -> List[type]:
+    """
+    Import every module under pages/ and return the page classes that have a URL.
+
+    Returns:
+        List[type]: Page object classes, sorted by name.
+    """
+    pages = []
+    for path in sorted((PROJECT_ROOT / "pages").glob("*_page.py")):
+        module = importlib.import_module(f"pages.{path.stem}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and isinstance(getattr(cls, "URL", None), str) and cls.URL:
+                pages.append(cls)
+    return sorted(pages, key=lambda cls: cls.__name__)
+
+
+def class_locators(cls: type) -> Dict[str, Tuple[str, str]]:
+    """
+    Return the class-level locators of a page class.
+
+    Args:
+        cls (type): Page object class.
+
+    Returns:
+        Dict[str, Tuple[str, str]]: Locators by attribute name, in definition order.
+    """
+    return {
+        name: value
+        for name, value in vars(cls).items()
+        if isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES
+    }
+
+
+def time_locator(driver, locator: Tuple[str, str], repeat: int) -> Tuple[float, int]:
+    """
+    Resolve a locator `repeat` times.
+
+    Returns:
+        Tuple[float, int]: Median milliseconds and number of matched elements.
+    """
+    samples, count = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(driver.find_elements(*locator))
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), count
+
+
+def flags_for(name: str, locator: Tuple[str, str], median: float, count: int, floor: float, slow_factor: float) -> List[str]:
+    """Return the flags of one measured locator."""
+    flags = []
+    if count == 0:
+        flags.append("not found")
+    if median > floor * slow_factor:
+        flags.append("slow")
+    if locator[0] == By.XPATH and "text()" in locator[1]:
+        flags.append("text-xpath")
+    if count > 1 and not any(word.endswith("S") for word in name.split("_")):
+        flags.append("ambiguous")
+    return flags
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Lookups per locator (default: 20)")
+    parser.add_argument("--slow-factor", type=float, default=1.5,
+                        help="Flag locators slower than this multiple of the round-trip floor (default: 1.5)")
+    parser.add_argument("--page", action="append", default=[],
+                        help="Only benchmark this page class (repeatable), e.g. AlertsPage")
+    args = parser.parse_args()
+
+    pages = [cls for cls in discover_pages() if not args.page or cls.__name__ in args.page]
+    driver = _create_driver()
+    flagged = 0
+    try:
+        for cls in pages:
+            driver.get(cls.URL)
+            floor, _ = time_locator(driver, FLOOR_LOCATOR, args.repeat)
+            print(f"\n{cls.__name__}  {cls.URL}  (round-trip floor {floor:.2f} ms)")
+            print(f"  {'locator':<22}{'strategy':<18}{'median':>10}{'matches':>9}  flags")
+            for name, locator in class_locators(cls).items():
+                median, count = time_locator(driver, locator, args.repeat)
+                flags = flags_for(name, locator, median, count, floor, args.slow_factor)
+                print(f"  {name:<22}{locator[0]:<18}{median:>8.2f}ms{count:>9}  {', '.join(flags)}")
+                if not flags or flags == ["not found"]:
+                    continue
+                flagged += 1
+                for suggestion in suggest_locators(driver, locator):
+                    suggested_median, _ = time_locator(driver, suggestion, args.repeat)
+                    print(f"    -> {suggestion!r}  {suggested_median:.2f} ms "
+                          f"({median - suggested_median:+.2f} ms saved per lookup)")
+    finally:
+        driver.quit()
+        # _create_driver() starts the shared driver service; stop it with the session
+        DRIVER_SERVICES.close()
+
+    print(f"\n{flagged} locator(s) flagged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Microbenchmark of the logging cost paid by page-object actions.
+
+Measures what a log call costs the test thread (formatting and file I/O
+happen later in the logging listener, see utils.logger) for each logger
+level, with and without an `isEnabledFor()` guard:
+
+    single debug   one `logger.debug("Typed char: %s", key)`
+    single info    one `logger.info(...)`
+    type_each_char the logging of InputsPage.type_each_char() for --chars
+                   characters: one debug per character plus one info
+
+No browser is needed. Records are prepared by the same queue handler as
+get_logger()'s and then discarded, so nothing reaches the console or
+logs/run.log.
+
+Usage:
+    python benchmarks/bench_logging.py [--chars N] [--repeat N] [--number N]
+"""
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.logger import _ListenerQueueHandler  # noqa: E402
+
+LEVELS = ("DEBUG", "INFO", "WARNING")
+
+
+class _Discard:
+    """Queue stand-in that drops records (keeps memory flat across millions of calls)."""
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        pass
+
+
+def make_logger(level: str) -> logging.Logger:
+    """Return a logger set up like get_logger()'s whose records are discarded."""
+    logger = logging.getLogger(f"bench_logging.{level}")
+    logger.handlers.clear()
+    logger.addHandler(_ListenerQueueHandler(_Discard()))
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def per_call_us(action: Callable[[], None], number: int, repeat: int) -> float:
+    """Median microseconds per `action()` call over `repeat` rounds of `number` calls."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            action()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return statistics.median(samples)
+
+
+def type_each_char(logger: logging.Logger, value: str, guarded: bool) -> None:
+    """The logging done by InputsPage.type_each_char(), without the WebDriver calls."""
+    debug = logger.isEnabledFor(logging.DEBUG) if guarded else True
+    for key in value:
+        if debug:
+            logger.debug("Typed char: %s", key)
+    logger.info("Finished typing sequence: %s", value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chars", type=int, default=24, help="Characters typed per action (default: 24)")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per measurement (default: 5)")
+    parser.add_argument("--number", type=int, default=20000, help="Calls per round (default: 20000)")
+    args = parser.parse_args()
+
+    value = "x" * args.chars
+    print(f"{'level':<9}{'variant':<11}{'single debug':>14}{'single info':>13}{'type_each_char':>16}")
+    for level in LEVELS:
+        logger = make_logger(level)
+        for guarded in (False, True):
+            def debug_call(logger=logger, guarded=guarded) -> None:
+                if not guarded or logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Typed char: %s", "x")
+
+            debug_us = per_call_us(debug_call, args.number, args.repeat)
+            info_us = per_call_us(lambda: logger.info("Finished typing sequence: %s", value), args.number, args.repeat)
+            action_us = per_call_us(
+                lambda: type_each_char(logger, value, guarded), max(1, args.number // args.chars), args.repeat
+            )
+            variant = "guarded" if guarded else "unguarded"
+            print(f"{level:<9}{variant:<11}{debug_us:>12.2f}us{info_us:>11.2f}us{action_us:>14.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
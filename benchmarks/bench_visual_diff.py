@@ -0,0 +1,125 @@
+"""
+Microbenchmark of the visual regression comparison (utils.visual_regression).
+
+Compares synthetic page-like screenshots of --size pixels (default
+1366x768, the configured window size) that differ in one small rectangle:
+
+    compare_png same    end to end, screenshot byte-identical to the baseline
+    compare_png diff    end to end, changed screenshot: PNG decode + diff
+    decode              decoding the screenshot PNG alone
+    compare             the vectorized diff alone (tolerance, changed pixels, bbox)
+    compare+mask        the same with an ignore region
+    dhash               perceptual hash of one image (the optional pre-filter)
+    heatmap             drawing the diff image of a failed check
+
+The baseline is decoded once and cached, as in a test session, so the
+end-to-end time of a changed screenshot is its PNG decode plus the diff.
+PNGs are encoded with Pillow when installed, which filters rows like
+browsers do; `--screenshot` benchmarks a real capture instead (e.g. one of
+screenshots/). The decoder in use is printed first: the built-in fallback
+takes most of a second on filtered PNGs.
+
+No browser is needed. Requires NumPy.
+
+Usage:
+    python benchmarks/bench_visual_diff.py [--size WxH | --screenshot PNG] [--repeat N] [--number N]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.visual_regression import (  # noqa: E402
+    Image, VisualRegression, compare, decode, dhash, encode_png, heatmap, ignore_mask, np
+)
+
+
+def per_call_ms(action: Callable[[], object], number: int, repeat: int) -> float:
+    """Median milliseconds per `action()` call over `repeat` rounds of `number` calls."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            action()
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return statistics.median(samples)
+
+
+def to_png(image: "np.ndarray") -> bytes:
+    """Encode like a browser would (Pillow's adaptive row filters), else unfiltered."""
+    if Image is None:
+        return encode_png(image)
+    import io
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def page_like(width: int, height: int) -> "np.ndarray":
+    """A white page with a header bar and rows of dark 'text' blocks (compresses like a screenshot)."""
+    rng = np.random.default_rng(0)
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    image[:60] = (34, 34, 34)
+    for top in range(90, height - 20, 24):
+        left = 40
+        while left < width - 200:
+            word = int(rng.integers(20, 90))
+            image[top:top + 12, left:left + word] = int(rng.integers(0, 80))
+            left += word + 8
+    return image
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="1366x768", help="Screenshot size WxH (default: 1366x768)")
+    parser.add_argument("--screenshot", type=Path, help="Real screenshot to use instead of a synthetic page")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per measurement (default: 5)")
+    parser.add_argument("--number", type=int, default=20, help="Calls per round (default: 20)")
+    args = parser.parse_args()
+    if np is None:
+        print("NumPy is not installed")
+        return 1
+
+    if args.screenshot:
+        expected = decode(args.screenshot.read_bytes())
+        height, width = expected.shape[:2]
+    else:
+        width, height = (int(value) for value in args.size.lower().split("x"))
+        expected = page_like(width, height)
+    actual = expected.copy()
+    actual[100:140, 200:400] = 0
+    mask = ignore_mask((height, width), [(0, 0, width, 50)])
+    result = compare(actual, expected, keep_delta=True)
+
+    baseline_dir = Path(tempfile.mkdtemp())
+    baseline = baseline_dir / "baseline.png"
+    baseline_png = to_png(expected)
+    baseline.write_bytes(baseline_png)
+    actual_png = to_png(actual)
+    checker = VisualRegression(baseline_dir, baseline_dir)
+    checker.compare_png(baseline_png, baseline)
+
+    measurements = {
+        "compare_png same": lambda: checker.compare_png(baseline_png, baseline),
+        "compare_png diff": lambda: checker.compare_png(actual_png, baseline),
+        "decode": lambda: decode(actual_png),
+        "compare": lambda: compare(actual, expected),
+        "compare+mask": lambda: compare(actual, expected, mask=mask),
+        "dhash": lambda: dhash(actual),
+        "heatmap": lambda: heatmap(expected, result["_delta"], result["_changed"]),
+    }
+    print(f"{width}x{height}, {result['changed_pixels']} changed pixels, "
+          f"PNG decoder: {'Pillow' if Image is not None else 'built-in (install Pillow)'}")
+    for name, action in measurements.items():
+        print(f"{name:<18}{per_call_ms(action, args.number, args.repeat):>8.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
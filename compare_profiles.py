@@ -0,0 +1,63 @@
+"""
+Run the test suite once per browser profile and compare wall-clock time.
+
+Usage:
+    python compare_profiles.py                      # every profile in config.json
+    python compare_profiles.py default fast         # selected profiles, first is the baseline
+    python compare_profiles.py fast -- tests/test_login.py -k negative
+
+Arguments after '--' are passed to pytest unchanged.
+"""
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from utils.config_loader import CONFIG
+
+
+def run_suite(profile: str, pytest_args: List[str]) -> Tuple[float, int]:
+    """
+    Run pytest under a browser profile.
+
+    Args:
+        profile (str): Profile name from config.json 'browser_profiles'.
+        pytest_args (List[str]): Extra arguments passed to pytest.
+
+    Returns:
+        Tuple[float, int]: Wall-clock seconds and pytest exit code.
+    """
+    cmd = [sys.executable, "-m", "pytest", "-q", f"--browser-profile={profile}", *pytest_args]
+    print(f"\n=== Running suite with profile '{profile}' ===")
+    start = time.perf_counter()
+    exit_code = subprocess.call(cmd)
+    return time.perf_counter() - start, exit_code
+
+
+def main(argv: List[str]) -> int:
+    if "--" in argv:
+        split = argv.index("--")
+        profiles, pytest_args = argv[:split], argv[split + 1:]
+    else:
+        profiles, pytest_args = argv, []
+
+    profiles = profiles or list(CONFIG.get("browser_profiles", {}))
+    if not profiles:
+        print("No browser profiles defined in config.json under 'browser_profiles'")
+        return 1
+
+    results = [(profile, *run_suite(profile, pytest_args)) for profile in profiles]
+
+    baseline = results[0][1]
+    print("\n=== Browser profile comparison ===")
+    print(f"{'profile':<15}{'wall clock':>12}{'vs ' + results[0][0]:>18}{'exit code':>11}")
+    for profile, seconds, exit_code in results:
+        diff = seconds - baseline
+        pct = (diff / baseline * 100) if baseline else 0.0
+        print(f"{profile:<15}{seconds:>11.2f}s{diff:>+10.2f}s ({pct:+.1f}%){exit_code:>9}")
+
+    return max(exit_code for _, _, exit_code in results)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
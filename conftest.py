@@ -1,12 +1,13 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 from datetime import datetime
 import pytest
 from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from _pytest.nodes import Item
 from _pytest.runner import CallInfo
 
@@ -24,8 +25,27 @@ try:
 except ImportError:
     FirefoxService = FirefoxOptions = None
 
+from utils.browser_profiles import (
+    apply_chromium_profile, apply_firefox_profile, apply_session_profile, get_profile
+)
+from utils.command_timing import CommandRecorder
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
+from utils.driver_pool import DriverPool
+from utils.driver_prewarmer import DriverPrewarmer
+from utils.driver_reaper import DriverReaper
+from utils.driver_service import DriverServiceManager
+from utils.element_cache import CACHE_STATS, ElementCacheStats
+from utils.failure_artifacts import FailureArtifacts
+from utils.http_archive import PROXY_URL_ENV, RecordReplayProxy, proxy_from_config
+from utils.local_site import LocalSite
+from utils.log_aggregator import LogAggregator
+from utils.logger import (
+    configure_levels, get_logger, log_segments, set_test_context, stop_logging, use_aggregator
+)
+from utils.screenshot_store import ScreenshotStore
+from utils.startup_profile import StartupProfile, aggregate, attach_profile, take_profile
+from utils.visual_regression import VisualRegression
+from utils.wait_engine import WaitEngine
 
 # ----------------------------
 # Directories for reports/screenshots
@@ -36,6 +56,22 @@ SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR = PROJECT_ROOT / "reports"
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
+PREWARMER_KEY = pytest.StashKey[DriverPrewarmer]()
+LOCAL_SITE_KEY = pytest.StashKey[LocalSite]()
+HTTP_ARCHIVE_KEY = pytest.StashKey[RecordReplayProxy]()
+
+# Controller-side collector of worker logs in parallel runs; set in pytest_configure
+LOG_AGGREGATOR: LogAggregator | None = None
+
+# WebDriver command timing (--command-timing); set in pytest_configure when enabled
+COMMAND_RECORDER: CommandRecorder | None = None
+
+# Driver services shared by all sessions of this worker (see 'shared_driver_service')
+DRIVER_SERVICES = DriverServiceManager()
+
+# Duration-aware parallel scheduling (--duration-schedule)
+pytest_plugins = ["utils.duration_scheduler"]
+
 
 def _create_driver():
     """
@@ -44,101 +80,287 @@ def _create_driver():
 
     Supports Edge, Chrome, Firefox.
     Handles headless mode, window size, and page load timeout.
+
+    With 'shared_driver_service' enabled, Edge and Chrome sessions are opened
+    against a driver service started once per worker instead of spawning a
+    new driver process per session. Firefox always gets its own geckodriver,
+    which only accepts one session at a time.
     
+    Each phase of the startup is timed (see utils.startup_profile); the
+    profile is stored on the session and reported by the first test using it.
+
     Returns:
         WebDriver: Configured WebDriver instance.
     """
     logger = get_logger("driver_factory")
+    startup = StartupProfile(str(CONFIG.get("browser", "edge")).lower())
 
-    # Read browser settings from config
-    browser = str(CONFIG.get("browser", "edge")).lower()
-    timeout = int(CONFIG.get("timeout", 10))
-    headless = bool(CONFIG.get("headless", False))
-    window_size = str(CONFIG.get("window_size", "1920,1080"))
+    with startup.phase("config"):
+        # Read browser settings from config
+        browser = str(CONFIG.get("browser", "edge")).lower()
+        timeout = int(CONFIG.get("timeout", 10))
+        headless = bool(CONFIG.get("headless", False))
+        window_size = str(CONFIG.get("window_size", "1920,1080"))
+        shared_service = bool(CONFIG.get("shared_driver_service", False))
+        profile = get_profile()
 
-    # Parse window size
-    try:
-        width, height = map(int, CONFIG.get("window_size", "1920,1080").split(","))
-    except Exception as exc:
-        raise RuntimeError(
-            "config.json: 'window_size' must be 'WIDTH,HEIGHT' (e.g. '1920,1080')"
-            ) from exc
+        # Parse window size
+        try:
+            width, height = map(int, CONFIG.get("window_size", "1920,1080").split(","))
+        except Exception as exc:
+            raise RuntimeError(
+                "config.json: 'window_size' must be 'WIDTH,HEIGHT' (e.g. '1920,1080')"
+                ) from exc
 
     logger.info(
-        "Initializing WebDriver | browser=%s headless=%s window_size =%s timeout=%s",
-                browser, headless, window_size, timeout
+        "Initializing WebDriver | browser=%s headless=%s window_size =%s timeout=%s profile=%s",
+                browser, headless, window_size, timeout, CONFIG.get("browser_profile")
                 )
 
     # ----------------------------
     # Edge driver setup
     # ----------------------------
     if browser == "edge":
-        edge_path = CONFIG.get("drivers", {}).get("edge", {}).get("path")
-        if not edge_path:
-            raise RuntimeError("Edge driver path not defined in config.json under drivers.edge.path")
-        if not Path(edge_path).exists():
-            raise FileNotFoundError(f"Edge driver not found at: {edge_path}")
+        with startup.phase("driver_resolution"):
+            edge_path = CONFIG.get("drivers", {}).get("edge", {}).get("path")
+            if not edge_path:
+                raise RuntimeError("Edge driver path not defined in config.json under drivers.edge.path")
+            if not Path(edge_path).exists():
+                raise FileNotFoundError(f"Edge driver not found at: {edge_path}")
         
-        options = EdgeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument(f"--window-size={width},{height}")
+        with startup.phase("options"):
+            options = EdgeOptions()
+            if headless:
+                options.add_argument("--headless=new")
+            options.add_argument(f"--window-size={width},{height}")
+            apply_chromium_profile(options, profile)
 
-        service = EdgeService(executable_path=edge_path)
-        drv = webdriver.Edge(service=service, options=options)
+        # The service only starts here if it is not running yet (cold start)
+        with startup.phase("new_session"):
+            if shared_service:
+                drv = DRIVER_SERVICES.new_session(
+                    "edge",
+                    lambda: startup.timed_service(EdgeService(executable_path=edge_path)),
+                    lambda url: ChromiumRemoteConnection(
+                        remote_server_addr=url, vendor_prefix="ms", browser_name="MicrosoftEdge", keep_alive=True
+                        ),
+                    options,
+                    )
+            else:
+                service = startup.timed_service(EdgeService(executable_path=edge_path))
+                drv = webdriver.Edge(service=service, options=options)
     
     # ----------------------------
     # Chrome driver setup
     # ----------------------------
     elif browser == "chrome" and ChromeService and ChromeOptions:
-        chrome_path = CONFIG.get("drivers", {}).get("chrome", {}).get("path")
-        if not chrome_path:
-            raise RuntimeError("Chrome path driver not defined in config.json under drivers.chrome.path")
-        if not Path(chrome_path).exists():
-            raise FileNotFoundError(f"Chrome driver not found at: {chrome_path}")
+        with startup.phase("driver_resolution"):
+            chrome_path = CONFIG.get("drivers", {}).get("chrome", {}).get("path")
+            if not chrome_path:
+                raise RuntimeError("Chrome path driver not defined in config.json under drivers.chrome.path")
+            if not Path(chrome_path).exists():
+                raise FileNotFoundError(f"Chrome driver not found at: {chrome_path}")
         
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument(f"--window-size={width},{height}")
+        with startup.phase("options"):
+            options = ChromeOptions()
+            if headless:
+                options.add_argument("--headless=new")
+            options.add_argument(f"--window-size={width},{height}")
+            apply_chromium_profile(options, profile)
 
-        service = ChromeService(executable_path=chrome_path)
-        drv = webdriver.Chrome(service=service, options=options)
+        # The service only starts here if it is not running yet (cold start)
+        with startup.phase("new_session"):
+            if shared_service:
+                drv = DRIVER_SERVICES.new_session(
+                    "chrome",
+                    lambda: startup.timed_service(ChromeService(executable_path=chrome_path)),
+                    lambda url: ChromiumRemoteConnection(
+                        remote_server_addr=url, vendor_prefix="goog", browser_name="chrome", keep_alive=True
+                        ),
+                    options,
+                    )
+            else:
+                service = startup.timed_service(ChromeService(executable_path=chrome_path))
+                drv = webdriver.Chrome(service=service, options=options)
     
     # ----------------------------
     # Firefox driver setup
     # ----------------------------
     elif browser == "firefox" and FirefoxService and FirefoxOptions:
-        gecko_path = CONFIG.get("drivers", {}).get("firefox", {}).get("path")
-        if not gecko_path:
-            raise RuntimeError("Firefox driver path not defined in config.json under drivers.firefox.path")     
-        if not Path(gecko_path).exists():
-            raise FileNotFoundError(f"Gecko driver not found at: {gecko_path}")
+        with startup.phase("driver_resolution"):
+            gecko_path = CONFIG.get("drivers", {}).get("firefox", {}).get("path")
+            if not gecko_path:
+                raise RuntimeError("Firefox driver path not defined in config.json under drivers.firefox.path")     
+            if not Path(gecko_path).exists():
+                raise FileNotFoundError(f"Gecko driver not found at: {gecko_path}")
         
-        options = FirefoxOptions()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument(f"--width={width}")
-        options.add_argument(f"--height={height}")
+        with startup.phase("options"):
+            options = FirefoxOptions()
+            if headless:
+                options.add_argument("--headless")
+            options.add_argument(f"--width={width}")
+            options.add_argument(f"--height={height}")
+            apply_firefox_profile(options, profile)
 
-        service = FirefoxService(executable_path=gecko_path)
-        drv = webdriver.Firefox(service=service, options=options)
+        with startup.phase("new_session"):
+            service = startup.timed_service(FirefoxService(executable_path=gecko_path))
+            drv = webdriver.Firefox(service=service, options=options)
 
-        drv.set_window_size(width, height)
+        with startup.phase("set_window_size"):
+            drv.set_window_size(width, height)
     
     else:
         raise ValueError(f"Unsupported or misconfigured browser in config.json: {browser}")
     
+    # Profile settings that need a live session
+    with startup.phase("session_profile"):
+        apply_session_profile(drv, browser, profile)
+
     # Set timeouts and implicit wait
-    try:
-        drv.set_page_load_timeout(timeout)
-    except (ValueError, WebDriverException):
-        logger.debug("Driver did not accept set_page_load_timeout(%s)", timeout, exc_info=True)
+    with startup.phase("set_page_load_timeout"):
+        try:
+            drv.set_page_load_timeout(timeout)
+        except (ValueError, WebDriverException):
+            logger.debug("Driver did not accept set_page_load_timeout(%s)", timeout, exc_info=True)
+
+    # Observer waits run as async scripts and must be allowed to outlive 'timeout'
+    if str(CONFIG.get("wait_mode", "poll")).lower() == "observer":
+        with startup.phase("set_script_timeout"):
+            drv.set_script_timeout(timeout + 5)
     
-    drv.implicitly_wait(2)
+    # Implicit waits stay off: page objects synchronize through WaitEngine
+    with startup.phase("implicitly_wait"):
+        drv.implicitly_wait(float(CONFIG.get("implicit_wait", 0)))
+
+    attach_profile(drv, startup)
+    logger.info("WebDriver startup profile: %s", startup.as_dict())
+
+    if COMMAND_RECORDER is not None:
+        COMMAND_RECORDER.instrument(drv)
     return drv
 
 
+# ----------------------------
+# Command-line options
+# ----------------------------
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        help="Browser performance profile from config.json 'browser_profiles', "
+             "e.g. 'fast' (overrides 'browser_profile', which is 'default': no tuning).",
+    )
+    parser.addoption(
+        "--local-site",
+        action="store_true",
+        default=False,
+        help="Run against the bundled offline copy of the site (local_site/) "
+             "instead of 'base_url'; also enabled by 'local_site.enabled' in config.json.",
+    )
+    parser.addoption(
+        "--http-archive",
+        action="store",
+        default=None,
+        choices=("off", "record", "replay"),
+        help="Route base_url through the record/replay proxy (overrides 'http_archive.mode').",
+    )
+    parser.addoption(
+        "--logger-level",
+        action="append",
+        default=[],
+        metavar="[NAME=]LEVEL",
+        help="Override config.json 'logging' levels: 'DEBUG' sets the default, "
+             "'InputsPage=WARNING' one logger (and its children). Repeatable.",
+    )
+    parser.addoption(
+        "--command-timing",
+        action="store_true",
+        default=False,
+        help="Time every WebDriver command per test (also 'command_timing.enabled' in config.json).",
+    )
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Record the screenshots of visual checks as new baselines instead of comparing.",
+    )
+
+
+def pytest_configure(config):
+    global COMMAND_RECORDER, LOG_AGGREGATOR
+    # Parallel run: workers (started after this hook) inherit the aggregator address
+    if not hasattr(config, "workerinput") and config.getoption("numprocesses", None):
+        LOG_AGGREGATOR = LogAggregator()
+        use_aggregator(LOG_AGGREGATOR.start())
+
+    profile = config.getoption("browser_profile")
+    if profile:
+        CONFIG["browser_profile"] = profile
+
+    for override in config.getoption("logger_level"):
+        name, _, level = override.rpartition("=")
+        try:
+            configure_levels(None if name else level, {name: level} if name else None)
+        except ValueError as exc:
+            raise pytest.UsageError(f"--logger-level {override}: {exc}") from exc
+
+    # The JSON report points at each test's lines in logs/ instead of copying captured stdout
+    json_report_omit = getattr(config.option, "json_report_omit", None)
+    if json_report_omit is not None and "streams" not in json_report_omit:
+        json_report_omit.append("streams")
+
+    timing = CONFIG.get("command_timing", {})
+    if config.getoption("command_timing") or timing.get("enabled", False):
+        COMMAND_RECORDER = CommandRecorder(top_n=int(timing.get("top_n", 10)))
+
+    # Must run before the page modules are imported: their URLs are built from base_url
+    use_local_site = config.getoption("local_site") or CONFIG.get("local_site", {}).get("enabled", False)
+    proxy = proxy_from_config(config.getoption("http_archive"))
+    if use_local_site and proxy is not None:
+        raise pytest.UsageError("--local-site and --http-archive cannot be combined")
+    if use_local_site:
+        site = LocalSite()
+        CONFIG["base_url"] = site.start()
+        config.stash[LOCAL_SITE_KEY] = site
+    elif proxy is not None and hasattr(config, "workerinput") and os.environ.get(PROXY_URL_ENV):
+        # Parallel run: the controller's proxy serves every worker
+        CONFIG["base_url"] = os.environ[PROXY_URL_ENV]
+    elif proxy is not None:
+        CONFIG["base_url"] = proxy.start()
+        config.stash[HTTP_ARCHIVE_KEY] = proxy
+        if not hasattr(config, "workerinput") and config.getoption("numprocesses", None):
+            os.environ[PROXY_URL_ENV] = proxy.url
+
+
+def pytest_unconfigure(config):
+    site = config.stash.get(LOCAL_SITE_KEY, None)
+    if site is not None:
+        site.stop()
+    proxy = config.stash.get(HTTP_ARCHIVE_KEY, None)
+    if proxy is not None:
+        proxy.stop()
+        os.environ.pop(PROXY_URL_ENV, None)
+
+    # Drain the log queue while pytest's output capture is still open
+    stop_logging()
+    if LOG_AGGREGATOR is not None:
+        LOG_AGGREGATOR.stop()
+        use_aggregator(None)
+
+
+# ----------------------------
+# Hook to tag log records with the running test
+# ----------------------------
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: Item, nextitem):
+    set_test_context(item.nodeid)
+    try:
+        yield
+    finally:
+        set_test_context()
+
+
 # ----------------------------
 # Hook to attach result to test item
 # ----------------------------
@@ -149,18 +371,290 @@ def pytest_runtest_makereport(item: Item, call: CallInfo):
     setattr(item, "rep_" + rep.when, rep)
 
 
+# ----------------------------
+# Hook to add WebDriver command timings to the JSON report (pytest-json-report)
+# ----------------------------
+@pytest.hookimpl(optionalhook=True)
+def pytest_json_runtest_metadata(item: Item, call: CallInfo):
+    if call.when != "teardown":
+        return {}
+    properties = dict(item.user_properties)
+    keys = ("driver_startup", "webdriver_commands", "visual")
+    return {key: properties[key] for key in keys if properties.get(key)}
+
+
+# ----------------------------
+# Hook to reference each test's log lines in the JSON report (pytest-json-report)
+# ----------------------------
+@pytest.hookimpl(optionalhook=True)
+def pytest_json_modifyreport(json_report):
+    # Write out queued records first so every range is known
+    stop_logging()
+    if LOG_AGGREGATOR is not None:
+        LOG_AGGREGATOR.flush()
+    segments = log_segments()
+    for test in json_report.get("tests", []):
+        test["log"] = segments.get(test["nodeid"], [])
+
+
+# ----------------------------
+# Hook to stop shared driver services at the end of the run
+# ----------------------------
+def pytest_sessionfinish(session, exitstatus):
+    DRIVER_SERVICES.close()
+    # Workers hand their last records to the aggregator before reporting back
+    if hasattr(session.config, "workerinput"):
+        stop_logging()
+    else:
+        # Screenshot retention, once per run (see 'screenshot_store' in config.json)
+        ScreenshotStore.from_config().apply_retention()
+
+
+# ----------------------------
+# Hook to report driver pre-warming, startup, command timing and element cache counters
+# ----------------------------
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    prewarmer = config.stash.get(PREWARMER_KEY, None)
+    if prewarmer is not None:
+        stats = prewarmer.stats()
+        terminalreporter.section("driver pre-warming")
+        terminalreporter.write_line(
+            f"size={prewarmer.size} requests={stats['requests']} waits={stats['waits']} "
+            f"total_wait={stats['total_wait']:.2f}s max_wait={stats['max_wait']:.2f}s "
+            f"created={stats['created']} failed={stats['failed']} queue_depth={stats['queue_depth']}"
+        )
+
+    # Per-test data travels in the teardown reports, so this also works under xdist
+    teardown_reports = [
+        rep for reports in terminalreporter.stats.values() for rep in reports
+        if getattr(rep, "when", None) == "teardown"
+    ]
+    _report_log_aggregation(terminalreporter)
+    _report_driver_startup(terminalreporter, teardown_reports)
+    _report_slowest_commands(terminalreporter, teardown_reports)
+
+    per_test = []
+    for rep in teardown_reports:
+        counters = dict(rep.user_properties).get("element_cache")
+        if counters and counters["hits"] + counters["misses"]:
+            per_test.append((rep.nodeid, counters))
+    if not per_test:
+        return
+    terminalreporter.section("element cache")
+    for nodeid, counters in per_test:
+        terminalreporter.write_line(
+            f"{nodeid}: hits={counters['hits']} misses={counters['misses']} stale={counters['stale']} "
+            f"hit_rate={counters['hit_rate']:.0%} (WebDriver lookups saved: {counters['hits']})"
+        )
+    hits = sum(counters["hits"] for _, counters in per_test)
+    lookups = hits + sum(counters["misses"] for _, counters in per_test)
+    terminalreporter.write_line(f"total: lookups={lookups} hits={hits} hit_rate={hits / lookups:.0%}")
+
+
+def _report_log_aggregation(terminalreporter) -> None:
+    """Print per-worker record counts of the log aggregator (parallel runs only)."""
+    if LOG_AGGREGATOR is None:
+        return
+    stats = LOG_AGGREGATOR.stats()
+    terminalreporter.section("log aggregation")
+    for worker in sorted(set(stats["received"]) | set(stats["dropped"])):
+        terminalreporter.write_line(
+            f"{worker}: received={stats['received'].get(worker, 0)} dropped={stats['dropped'].get(worker, 0)}"
+        )
+    terminalreporter.write_line(f"out of order={stats['late']}")
+
+
+def _report_driver_startup(terminalreporter, teardown_reports) -> None:
+    """Print the aggregate startup profile of the sessions created during the run."""
+    profiles = [
+        dict(rep.user_properties)["driver_startup"]
+        for rep in teardown_reports
+        if dict(rep.user_properties).get("driver_startup")
+    ]
+    if not profiles:
+        return
+    terminalreporter.section("driver startup")
+    for phase, stats in aggregate(profiles).items():
+        terminalreporter.write_line(
+            f"{phase:<24}sessions={stats['sessions']:<4}mean={stats['mean_ms']:>9.1f}ms "
+            f"p50={stats['p50_ms']:>9.1f}ms max={stats['max_ms']:>9.1f}ms share={stats['share']:.0%}"
+        )
+
+
+def _report_slowest_commands(terminalreporter, teardown_reports) -> None:
+    """Print the slowest WebDriver commands of the session (--command-timing)."""
+    slowest = [
+        (rep.nodeid, record)
+        for rep in teardown_reports
+        for record in dict(rep.user_properties).get("webdriver_commands", {}).get("slowest", [])
+    ]
+    if not slowest:
+        return
+    top_n = int(CONFIG.get("command_timing", {}).get("top_n", 10))
+    slowest.sort(key=lambda item: item[1]["duration_ms"], reverse=True)
+    terminalreporter.section(f"slowest {top_n} WebDriver commands")
+    for nodeid, record in slowest[:top_n]:
+        terminalreporter.write_line(
+            f"{record['duration_ms']:>10.1f}ms  {record['command']:<28}{record['origin']:<40}"
+            f"req={record['request_bytes']}B resp={record['response_bytes']}B  {nodeid}"
+        )
+
+
+# ----------------------------
+# Fixture: WebDriver reaper
+# ----------------------------
+@pytest.fixture(scope="session")
+def driver_reaper():
+    """
+    Provides a background reaper that quits drivers off the test's critical path.
+
+    Controlled by the 'teardown' section of config.json:
+        mode (str): 'sync' quits drivers inline, 'async' hands them to the
+            reaper. Defaults to 'sync'.
+        disposable (bool): In async mode, kill the driver and browser process
+            tree if quit() does not finish within the grace period. Defaults to False.
+        grace_period (float): Seconds given to quit() in disposable mode. Defaults to 3.
+
+    Yields None in sync mode.
+    """
+    settings = CONFIG.get("teardown", {})
+    if str(settings.get("mode", "sync")).lower() != "async":
+        yield None
+        return
+
+    reaper = DriverReaper(
+        disposable=bool(settings.get("disposable", False)),
+        grace_period=float(settings.get("grace_period", 3)),
+    )
+    try:
+        yield reaper
+    finally:
+        reaper.close()
+
+
+# ----------------------------
+# Fixture: WebDriver pool
+# ----------------------------
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_reaper):
+    """
+    Provides a pool of reusable WebDriver sessions for the whole run
+    (one pool per worker process when running in parallel).
+
+    Controlled by the 'driver_pool' section of config.json:
+        enabled (bool): Reuse sessions between tests. Defaults to True.
+        max_idle (int): Idle sessions kept alive between tests. Defaults to 1.
+        prewarm (int): Sessions booted ahead of demand in background
+            threads. Defaults to 0 (sessions are created on demand).
+
+    Yields None when pooling is disabled.
+    """
+    settings = CONFIG.get("driver_pool", {})
+    if not settings.get("enabled", True):
+        yield None
+        return
+
+    prewarm = int(settings.get("prewarm", 0))
+    prewarmer = None
+    factory = _create_driver
+    if prewarm > 0:
+        prewarmer = DriverPrewarmer(_create_driver, size=prewarm)
+        prewarmer.start()
+        request.config.stash[PREWARMER_KEY] = prewarmer
+        factory = prewarmer.get
+
+    disposer = driver_reaper.submit if driver_reaper else None
+    pool = DriverPool(factory, max_idle=settings.get("max_idle", 1), disposer=disposer)
+    try:
+        yield pool
+    finally:
+        pool.close()
+        if prewarmer:
+            prewarmer.stop()
+
+
+# ----------------------------
+# Fixture: failure artifact capture
+# ----------------------------
+@pytest.fixture(scope="session")
+def failure_artifacts():
+    """
+    Provides the pipeline that saves the state of failed tests (see utils.failure_artifacts).
+
+    Controlled by the 'failure_artifacts' section of config.json:
+        page_source (bool): Also save the page source. Defaults to True.
+        element_region (bool): Screenshot only the element the test last
+            waited for, when it is on the page. Defaults to False.
+    Screenshots go to the content-addressed store configured in 'screenshot_store',
+    page sources and metadata to its attachments (pruned with the screenshot).
+    """
+    settings = CONFIG.get("failure_artifacts", {})
+    artifacts = FailureArtifacts(
+        SCREENSHOTS_DIR,
+        page_source=bool(settings.get("page_source", True)),
+        element_region=bool(settings.get("element_region", False)),
+        store=ScreenshotStore.from_config(),
+    )
+    try:
+        yield artifacts
+    finally:
+        artifacts.close()
+
+
+# ----------------------------
+# Fixtures: visual regression
+# ----------------------------
+@pytest.fixture(scope="session")
+def visual_regression(request):
+    """
+    Provides the baseline screenshot comparator (see utils.visual_regression).
+
+    Controlled by the 'visual_regression' section of config.json and
+    --update-baselines (records baselines instead of comparing). Tests using
+    it are skipped when NumPy is missing.
+    """
+    try:
+        return VisualRegression.from_config(update=request.config.getoption("update_baselines"))
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+
+
+@pytest.fixture(scope="function")
+def visual(request, visual_regression):
+    """
+    Provides `visual(page, name="", ignore=())`: checks a page object against
+    its baseline and records the result in the test's report ('visual').
+    """
+    def check(page, name="", ignore=()):
+        result = visual_regression.check(page, name, ignore)
+        request.node.user_properties.append(("visual", result))
+        return result
+
+    return check
+
+
 # ----------------------------
 # Fixture: WebDriver
 # ----------------------------
 @pytest.fixture(scope="function")
-def driver(request):
+def driver(request, driver_pool, driver_reaper, failure_artifacts):
     """
     Provides a WebDriver instance for each test function.
-    Takes screenshots on failure.
-    Ensures proper driver quit.
+    Sessions come from the driver pool and are reset after the test;
+    without a pool a fresh driver is created and quit per test.
+    Captures screenshot, page source, URL and windows on failure;
+    the files are written in the background.
     """
     logger = get_logger("tests.driver")
-    drv = _create_driver()
+    drv = driver_pool.acquire() if driver_pool else _create_driver()
+    cache_before = CACHE_STATS.snapshot()
+
+    # Startup phases of the session, reported by the first test that uses it
+    startup = take_profile(drv)
+    if startup is not None:
+        request.node.user_properties.append(("driver_startup", startup))
+    if COMMAND_RECORDER is not None:
+        COMMAND_RECORDER.start_test()
 
     logger.info("WebDriver started for test: %s | browser=%s | headless=%s", 
                 request.node.name,
@@ -171,26 +665,40 @@ def driver(request):
         yield drv
 
     finally:
-        # Capture screenshot if test failed
+        # Element cache counters of this test (see utils.element_cache)
+        cache_counters = ElementCacheStats.delta(cache_before, CACHE_STATS.snapshot())
+        request.node.user_properties.append(("element_cache", cache_counters))
+        logger.debug("Element cache for %s: %s", request.node.name, cache_counters)
+
+        # WebDriver command timings of this test, before the screenshot and pool reset
+        if COMMAND_RECORDER is not None:
+            request.node.user_properties.append(("webdriver_commands", COMMAND_RECORDER.finish_test()))
+
+        # Capture the failure state; encoding and disk writes happen in the background
         failed = hasattr(request.node, "rep_call") and request.node.rep_call.failed
         if failed:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             browser = str(CONFIG.get("browser", "edge")).lower()
             headless = CONFIG.get("headless", False)
-            fname = f"{request.node.name}_{browser}_{'headless' if headless else 'gui'}_{timestamp}.png"
-            fpath = SCREENSHOTS_DIR / fname
+            name = f"{request.node.name}_{browser}_{'headless' if headless else 'gui'}_{timestamp}"
+            wait_engine = request.node.funcargs.get("wait")
+            paths = failure_artifacts.capture(
+                drv, name, getattr(wait_engine, "last_locator", None), test=request.node.nodeid
+            )
+            request.node.user_properties.append(("failure_artifacts", paths))
+            logger.error("Test FAILED. Artifacts queued: %s", paths)
+
+        # Return driver to the pool (reset), hand it to the reaper or quit it
+        if driver_pool:
+            driver_pool.release(drv)
+        elif driver_reaper:
+            driver_reaper.submit(drv)
+        else:
             try:
-                drv.save_screenshot(str(fpath))
-                logger.error("Test FAILED. Screenshot saved: %s", fpath, exc_info=True)
+                drv.quit()
+                logger.info("WebDriver quit successfully")
             except WebDriverException:
-                logger.exception("Could not save screenshot", exc_info=True)
-
-        # Quit driver
-        try:
-            drv.quit()
-            logger.info("WebDriver quit successfully")
-        except WebDriverException:
-            logger.exception("Error quitting WebDriver", exc_info=True)
+                logger.exception("Error quitting WebDriver", exc_info=True)
 
 
 # ----------------------------
@@ -199,8 +707,8 @@ def driver(request):
 @pytest.fixture(scope="function")
 def wait(driver):
     """
-    Provides a WebDriverWait instance for explicit waits.
-    Reads timeout from config.json.
+    Provides a WaitEngine (a WebDriverWait with named conditions) for explicit waits.
+    Reads timeout, poll_frequency and wait_mode ('poll' or 'observer') from config.json.
     """
     timeout = CONFIG.get("timeout", 10)
 
@@ -212,4 +720,4 @@ def wait(driver):
     logger = get_logger("tests.driver")
     logger.debug("Creating WebDriver | timeout=%s for driver id=%s", timeout, id(driver))
 
-    return WebDriverWait(driver, timeout)
+    return WaitEngine.from_config(driver, timeout)
@@ -3,6 +3,9 @@ import subprocess
 import os
 import json
 
+from utils.log_analyzer import read_segments
+from utils.screenshot_store import ScreenshotStore
+
 REPORT_JSON = "reports/result.json"
 TESTS_PATH = "tests"
 
@@ -109,5 +112,32 @@ if st.session_state.summary_results:
                 f"</div>",
                 unsafe_allow_html=True
             )
+
+        # ----------------------------
+        # Log of one test, read from logs/ through the byte ranges in the report
+        # ----------------------------
+        logged_tests = [t for t in report_data["tests"] if t.get("log")]
+        if logged_tests:
+            st.subheader("📜 Test Log")
+            selected_log = st.selectbox("Select a test", [t["nodeid"] for t in logged_tests], key="log_test")
+            test_entry = next(t for t in logged_tests if t["nodeid"] == selected_log)
+            log_lines = read_segments(test_entry["log"], selected_log)
+            if log_lines:
+                st.code("\n".join(log_lines))
+            else:
+                st.info("⚠️ The log lines of this test were rotated away.")
+
+        # ----------------------------
+        # Latest screenshot of each failed test, read from the screenshot store index
+        # ----------------------------
+        store = ScreenshotStore.from_config()
+        latest = store.latest_by_test()
+        shot_tests = [t["nodeid"] for t in report_data["tests"] if t["nodeid"] in latest]
+        if shot_tests:
+            st.subheader("📸 Screenshots")
+            selected_shot = st.selectbox("Select a test", shot_tests, key="screenshot_test")
+            entry = latest[selected_shot]
+            st.image(str(store.blob_path(entry["sha256"])), caption=entry["name"])
+            st.caption(f"{entry['group_size']} near-identical capture(s) of this failure in the store")
 else:
     st.info("⚠️ No summary available. Run a test to generate it.")
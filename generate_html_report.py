@@ -1,17 +1,23 @@
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
+from utils.screenshot_store import ScreenshotStore
+
 # Diretórios
 PROJECT_ROOT = Path(__file__).parent
 JSON_FILE = PROJECT_ROOT / "reports" / "result.json"
 HTML_FILE = PROJECT_ROOT / "reports" / "report.html"
-SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
 
 # Carregar resultados do JSON
 with open(JSON_FILE, "r", encoding="utf-8") as f:
     data = json.load(f)
 
+# Último screenshot de cada teste, lido do índice do store de screenshots
+store = ScreenshotStore.from_config()
+screenshots = store.latest_by_test()
+
 # HTML básico
 html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -35,6 +41,7 @@ html_content = f"""<!DOCTYPE html>
 <th>Status</th>
 <th>Test</th>
 <th>Screenshot</th>
+<th>Log</th>
 </tr>
 """
 
@@ -43,15 +50,24 @@ for test in data.get("tests", []):
     status = test.get("outcome", "unknown")
     nodeid = test.get("nodeid", "")
     
-    # Se existir screenshot
-    screenshot_name = test.get("extra_screenshot")  # ajuste conforme a chave usada no JSON
-    if screenshot_name and (SCREENSHOTS_DIR / screenshot_name).exists():
-        screenshot_link = f'<a href="../screenshots/{screenshot_name}">View</a>'
+    # Se existir screenshot (com o número de capturas quase idênticas do mesmo grupo)
+    entry = screenshots.get(nodeid)
+    if entry:
+        blob = Path(os.path.relpath(store.blob_path(entry["sha256"]), HTML_FILE.parent)).as_posix()
+        screenshot_link = f'<a href="{blob}">View</a> ({entry["group_size"]} similar)'
     else:
         screenshot_link = "—"
     
+    # Faixas de bytes do teste nos arquivos de log (o texto não é copiado para o relatório)
+    log_ranges = "<br>".join(
+        f"{segment['file']} [{segment['start']}:{segment['end']}]" for segment in test.get("log", [])
+    ) or "—"
+
     row_class = "pass" if status == "passed" else "fail"
-    html_content += f"<tr class='{row_class}'><td>{status}</td><td>{nodeid}</td><td>{screenshot_link}</td></tr>\n"
+    html_content += (
+        f"<tr class='{row_class}'><td>{status}</td><td>{nodeid}</td>"
+        f"<td>{screenshot_link}</td><td>{log_ranges}</td></tr>\n"
+    )
 
 html_content += """
 </table>
@@ -1,12 +1,9 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
 
-class AlertsPage:
+class AlertsPage(BasePage):
     """
     Page Object Model for the 'JavaScript Alerts' page in 'The Internet' demo site.
 
@@ -26,32 +23,6 @@ class AlertsPage:
     JS_PROMPT_BUTTON = (By.XPATH, "//button[text()='Click for JS Prompt']")
     RESULT_TEXT = (By.ID, "result")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the AlertsPage object.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Explicit wait instance for synchronization.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Navigate to the alerts page.
-
-        Raises:
-            WebDriverException: If the URL cannot be loaded.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-
     def click_alert_button(self) -> None:
         """
         Click the "JS Alert" button to trigger a simple alert.
@@ -60,7 +31,7 @@ class AlertsPage:
             TimeoutException: If the button is not clickable.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.JS_ALERT_BUTTON)).click()
+            self.wait.clickable(self.JS_ALERT_BUTTON).click()
             self.logger.info("Clicked JS Alert button")
         except TimeoutException:
             self.logger.exception("Timeout: JS Alert button not clickable")
@@ -74,7 +45,7 @@ class AlertsPage:
             TimeoutException: If the button is not clickable.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.JS_CONFIRM_BUTTON)).click()
+            self.wait.clickable(self.JS_CONFIRM_BUTTON).click()
             self.logger.info("Clicked JS Confirm button")
         except TimeoutException:
             self.logger.exception("Timeout: JS Confirm button not clickable")
@@ -88,7 +59,7 @@ class AlertsPage:
             TimeoutException: If the button is not clickable.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.JS_PROMPT_BUTTON)).click()
+            self.wait.clickable(self.JS_PROMPT_BUTTON).click()
             self.logger.info("Clicked JS Prompt button")
         except TimeoutException:
             self.logger.exception("Timeout: JS Prompt button not clickable")
@@ -172,7 +143,7 @@ class AlertsPage:
             TimeoutException: If the result text element is not found or visible.
         """
         try:
-            element = self.wait.until(EC.visibility_of_element_located(self.RESULT_TEXT))
+            element = self.wait.visible(self.RESULT_TEXT)
             text = element.text
             self.logger.info("Retrieved result text: %s", text)
             return text
@@ -0,0 +1,159 @@
+from urllib.parse import urldefrag, urlsplit
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.config_loader import CONFIG
+from utils.element_cache import ElementCache
+from utils.logger import get_logger
+from utils.wait_engine import WaitEngine
+
+# Arguments: none. Returns [location.href, document.readyState] in one round trip.
+_LOCATION_SCRIPT = "return [window.location.href, document.readyState];"
+
+# Arguments: target URL. Marks the current document, then navigates in-page.
+_ASSIGN_SCRIPT = "window.__basePageLeaving = true; window.location.assign(arguments[0]);"
+
+# Arguments: none. True once the marked document was replaced and the new one is parsed.
+_ARRIVED_SCRIPT = "return !window.__basePageLeaving && document.readyState !== 'loading';"
+
+
+class BasePage:
+    """
+    Common base of every page object: navigation, waits, logging and element cache.
+
+    Navigation (`open()`) avoids work the browser does not need:
+        - Already on URL, `reuse=True`: nothing is loaded at all.
+        - Already on URL otherwise: a fresh driver.get() (never a refresh,
+          which would re-submit a POST result such as /upload's).
+        - Same origin (config 'navigation.same_origin_fast_path'): the page
+          changes `window.location` itself instead of a WebDriver get().
+        - Anything else (e.g. about:blank after a pool reset): driver.get().
+
+    Attributes:
+        URL (str): Full URL of the page; set by each subclass.
+        VISUAL_IGNORE (tuple): Locators of regions visual checks ignore (dynamic content).
+        driver (WebDriver): Selenium WebDriver instance.
+        wait (WaitEngine): Explicit waits with named conditions.
+        cache (ElementCache): Located elements, reused until the next navigation.
+        logger (logging.Logger): Logger named after the page class.
+    """
+
+    URL: str = ""
+    VISUAL_IGNORE: tuple = ()
+
+    def __init__(self, driver: WebDriver, wait: WebDriverWait):
+        """
+        Initialize the page object.
+
+        Args:
+            driver (WebDriver): Selenium WebDriver instance.
+            wait (WebDriverWait): Explicit wait instance for synchronization.
+        """
+        self.driver = driver
+        self.wait = WaitEngine.wrap(wait)
+        self.cache = ElementCache()
+        self.logger = get_logger(self.__class__.__name__)
+
+    def open(self, reuse: bool = False) -> None:
+        """
+        Navigate to the page's URL.
+
+        Args:
+            reuse (bool): Keep the current document if the browser is already
+                on the URL (its state is not reset). Defaults to False.
+
+        Raises:
+            WebDriverException: If the page fails to load.
+        """
+        self.navigate(self.URL, reuse=reuse)
+
+    def navigate(self, url: str, reuse: bool = False) -> None:
+        """
+        Navigate to `url`, skipping or shortening the navigation when possible.
+
+        Args:
+            url (str): Target URL.
+            reuse (bool): Keep the current document if already on `url`. Defaults to False.
+
+        Raises:
+            WebDriverException: If the page fails to load.
+        """
+        try:
+            current, ready_state = self.driver.execute_script(_LOCATION_SCRIPT)
+            if _same_document(current, url) and ready_state != "loading":
+                if reuse:
+                    self.logger.info("Already on URL, navigation skipped: %s", url)
+                    return
+                self.cache.invalidate()
+                self.driver.get(url)
+                self.logger.info("Reloaded URL: %s", url)
+                return
+
+            self.cache.invalidate()
+            if self._fast_path_enabled() and _same_origin(current, url) and self._assign_location(url):
+                self.logger.info("Opened URL in-page: %s", url)
+                return
+            self.driver.get(url)
+            self.logger.info("Opened URL: %s", url)
+        except WebDriverException:
+            self.logger.exception("Failed to open URL: %s", url)
+            raise
+
+    # ----------------------------
+    # Navigation helpers
+    # ----------------------------
+    def _assign_location(self, url: str) -> bool:
+        """
+        Navigate by assigning `window.location` from inside the page.
+
+        Args:
+            url (str): Same-origin target URL.
+
+        Returns:
+            bool: True once the new document is parsed; False if the script
+            could not run (the caller then falls back to driver.get()).
+
+        Raises:
+            TimeoutException: If the new document does not load within the wait timeout.
+        """
+        try:
+            self.driver.execute_script(_ASSIGN_SCRIPT, url)
+            self.wait.until(self._arrived)
+        except TimeoutException:
+            self.logger.error("In-page navigation to %s did not finish in time", url)
+            raise
+        except WebDriverException:
+            self.logger.debug("In-page navigation to %s failed, using driver.get()", url, exc_info=True)
+            return False
+        return True
+
+    @staticmethod
+    def _arrived(driver: WebDriver) -> bool:
+        """Wait condition: the new document replaced the marked one (errors mid-navigation count as not yet)."""
+        try:
+            return bool(driver.execute_script(_ARRIVED_SCRIPT))
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _fast_path_enabled() -> bool:
+        """Return whether same-origin in-page navigation is enabled in config.json."""
+        return bool(CONFIG.get("navigation", {}).get("same_origin_fast_path", False))
+
+
+def _same_document(current: str, url: str) -> bool:
+    """Return whether two URLs address the same document (fragments ignored)."""
+    return _strip(current) == _strip(url)
+
+
+def _same_origin(current: str, url: str) -> bool:
+    """Return whether two http(s) URLs share scheme, host and port."""
+    a, b = urlsplit(current), urlsplit(url)
+    return a.scheme in ("http", "https") and (a.scheme, a.netloc) == (b.scheme, b.netloc)
+
+
+def _strip(url: str) -> str:
+    """Drop the fragment and a trailing slash from a URL."""
+    return urldefrag(url)[0].rstrip("/")
+
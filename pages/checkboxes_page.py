@@ -1,15 +1,13 @@
-from typing import List
+from typing import Any, Dict, List
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
+from utils.element_state import element_states
 
 
-class CheckboxesPage:
+class CheckboxesPage(BasePage):
     """
     Page Object Model for the 'Checkboxes' page in 'The Internet' demo site.
 
@@ -22,32 +20,6 @@ class CheckboxesPage:
     URL = f"{CONFIG.get('base_url')}/checkboxes"
     CHECKBOXES_INPUT = (By.CSS_SELECTOR, "input[type='checkbox']")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the CheckboxesPage object.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Explicit wait instance for synchronization.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Navigate to the checkboxes page.
-
-        Raises:
-            WebDriverException: If the page cannot be opened.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-
     def get_checkboxes(self) -> List[WebElement]:
         """
         Locate all checkboxes on the page.
@@ -59,23 +31,39 @@ class CheckboxesPage:
             TimeoutException: If no checkbox is found within the timeout.
         """
         try:
-            boxes = self.wait.until(
-                EC.visibility_of_all_elements_located(self.CHECKBOXES_INPUT)
-                )
+            boxes = self.wait.all_visible(self.CHECKBOXES_INPUT)
             self.logger.debug("Located %d checkbox(es)", len(boxes))
             return boxes
         except TimeoutException:
             self.logger.exception("Timeout: Checkbox not found")
             raise
 
+    def get_checkbox_states(self) -> List[Dict[str, Any]]:
+        """
+        Read the state of all checkboxes in a single round trip.
+
+        Waits for the checkboxes to become visible only if they are not rendered yet.
+
+        Returns:
+            List[Dict[str, Any]]: One state per checkbox (see utils.element_state).
+
+        Raises:
+            TimeoutException: If no checkbox becomes visible within the timeout.
+        """
+        states = element_states(self.driver, self.CHECKBOXES_INPUT)
+        if not states or not all(state["displayed"] for state in states):
+            self.get_checkboxes()
+            states = element_states(self.driver, self.CHECKBOXES_INPUT)
+        self.logger.debug("Read state of %d checkbox(es)", len(states))
+        return states
+
     def mark_all(self) -> None:
         """
         Select (check) all checkboxes that are not already selected.
 
         Logs how many checkboxes were marked.
         """
-        boxes = self.get_checkboxes()
-        to_mark = [cb for cb in boxes if not cb.is_selected()]
+        to_mark = [state["element"] for state in self.get_checkbox_states() if not state["selected"]]
         for cb in to_mark:
             cb.click()
         self.logger.info("Marked %d checkbox(es)", len(to_mark))
@@ -86,8 +74,7 @@ class CheckboxesPage:
 
         Logs how many checkboxes were unmarked.
         """
-        boxes = self.get_checkboxes()
-        to_unmark = [cb for cb in boxes if cb.is_selected()]
+        to_unmark = [state["element"] for state in self.get_checkbox_states() if state["selected"]]
         for cb in to_unmark:
             cb.click()
         self.logger.info("Unmarked %d checkbox(es)", len(to_unmark))
@@ -99,7 +86,7 @@ class CheckboxesPage:
         Returns:
             bool: True if all checkboxes are checked, False otherwise.
         """
-        return all(cb.is_selected() for cb in self.get_checkboxes())
+        return all(state["selected"] for state in self.get_checkbox_states())
     
     def are_all_unmarked(self) -> bool:
         """
@@ -108,4 +95,4 @@ class CheckboxesPage:
         Returns:
             bool: True if all checkboxes are unchecked, False otherwise.
         """
-        return all(not cb.is_selected() for cb in self.get_checkboxes())
\ No newline at end of file
+        return all(not state["selected"] for state in self.get_checkbox_states())
\ No newline at end of file
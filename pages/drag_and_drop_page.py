@@ -1,13 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
+from utils.element_state import element_states_many
 
-class DragAndDropPage:
+class DragAndDropPage(BasePage):
     """
     Page Object representing the 'Drag and Drop' page of the application.
 
@@ -23,30 +21,8 @@ class DragAndDropPage:
     # Locators
     BOX_A = (By.ID, "column-a")
     BOX_B = (By.ID, "column-b")
-
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the DragAndDropPage object.
-
-        :param driver: Instance of Selenium WebDriver.
-        :param wait: Instance of WebDriverWait for explicit waits.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Open the Drag and Drop page.
-
-        :raises WebDriverException: If the page fails to load.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
+    BOX_A_HEADER = (By.CSS_SELECTOR, "#column-a header")
+    BOX_B_HEADER = (By.CSS_SELECTOR, "#column-b header")
 
     def drag_and_drop_boxes(self) -> None:
         """
@@ -56,8 +32,8 @@ class DragAndDropPage:
         :raises WebDriverException: If the drag-and-drop action fails.
         """
         try:
-            box_a = self.wait.until(EC.presence_of_element_located(self.BOX_A))
-            box_b = self.wait.until(EC.presence_of_element_located(self.BOX_B))
+            box_a = self.wait.present(self.BOX_A)
+            box_b = self.wait.present(self.BOX_B)
 
             # Create and execute drag-and-drop action
             actions = ActionChains(self.driver)
@@ -79,12 +55,12 @@ class DragAndDropPage:
         :raises WebDriverException: If headers cannot be retrieved.
         """
         try:
-            box_a = self.driver.find_element(*self.BOX_A)
-            box_b = self.driver.find_element(*self.BOX_B)
-
-            # Extract header text from both boxes
-            header_a = box_a.find_element(By.TAG_NAME, "header").text
-            header_b = box_b.find_element(By.TAG_NAME, "header").text
+            # Read both headers in a single round trip
+            states = element_states_many(self.driver, {"a": self.BOX_A_HEADER, "b": self.BOX_B_HEADER})
+            if not states["a"] or not states["b"]:
+                raise NoSuchElementException("Box headers not found")
+            header_a = states["a"][0]["text"]
+            header_b = states["b"][0]["text"]
 
             self.logger.info("Box headers: A='%s', B='%s'", header_a, header_b)
             return header_a, header_b
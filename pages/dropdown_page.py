@@ -1,13 +1,12 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
+from utils.element_state import element_states
 
 
-class DropdownPage:
+class DropdownPage(BasePage):
     """
     Page Object Model for the 'Dropdown' page in 'The Internet' demo site.
 
@@ -19,26 +18,7 @@ class DropdownPage:
     
     URL = f"{CONFIG.get('base_url')}/dropdown"
     DROPDOWN = (By.ID, "dropdown")
-
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the DropdownPage object.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Explicit wait instance for synchronization.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
+    DROPDOWN_OPTIONS = (By.CSS_SELECTOR, "#dropdown option")
 
     def get_dropdown_element(self) -> 'Select':
         """
@@ -51,7 +31,7 @@ class DropdownPage:
             TimeoutException: If the dropdown is not found within the timeout.
         """
         try:
-            elem = self.wait.until(EC.visibility_of_element_located(self.DROPDOWN))
+            elem = self.wait.visible(self.DROPDOWN)
             self.logger.debug("Dropdown element located")
             return Select(elem)
         except TimeoutException:
@@ -84,10 +64,21 @@ class DropdownPage:
         """
         Get the currently selected option from the dropdown.
 
+        Reads every option's state in a single round trip instead of
+        calling is_selected() once per option.
+
         Returns:
             str: The text of the currently selected option.
+
+        Raises:
+            NoSuchElementException: If no option is selected.
         """
-        dropdown = self.get_dropdown_element()
-        selected = dropdown.first_selected_option.text
+        states = element_states(self.driver, self.DROPDOWN_OPTIONS)
+        if not states:
+            self.get_dropdown_element()
+            states = element_states(self.driver, self.DROPDOWN_OPTIONS)
+        selected = next((state["text"] for state in states if state["selected"]), None)
+        if selected is None:
+            raise NoSuchElementException("No options are selected")
         self.logger.debug("Current selected option: %s", selected)
         return selected
\ No newline at end of file
@@ -1,12 +1,9 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
 
-class FramesPage:
+class FramesPage(BasePage):
     """
     Page Object for interacting with the Frames section of 'The Internet' app.
 
@@ -20,34 +17,9 @@ class FramesPage:
 
     # Locators
     IFRAME_LINK = (By.LINK_TEXT, "iFrame")
+    IFRAME = (By.ID, "mce_0_ifr")
     IFRAME_BODY = (By.CSS_SELECTOR, "body#tinymce")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the FramesPage object.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Explicit wait handler.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Open the Frames page.
-
-        Raises:
-            WebDriverException: If the URL cannot be loaded.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-
     def click_iframe_link(self) -> None:
         """
         Click the link that opens the iFrame editor.
@@ -56,7 +28,7 @@ class FramesPage:
             TimeoutException: If the iframe link is not clickable.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.IFRAME_LINK)).click()
+            self.wait.clickable(self.IFRAME_LINK).click()
             self.logger.info("Clicked iframe link")
         except TimeoutException:
             self.logger.exception("Timeout: Iframe link not clickable")
@@ -70,7 +42,7 @@ class FramesPage:
             TimeoutException: If the iframe is not found.
         """
         try:
-            iframe = self.wait.until(EC.presence_of_element_located((By.ID, "mce_0_ifr")))
+            iframe = self.wait.present(self.IFRAME)
             self.driver.switch_to.frame(iframe)
             self.logger.info("Switched to iframe")
         except TimeoutException:
@@ -92,7 +64,7 @@ class FramesPage:
             TimeoutException: If the iframe body is not found.
         """
         try:
-            body = self.wait.until(EC.presence_of_element_located(self.IFRAME_BODY))
+            body = self.wait.present(self.IFRAME_BODY)
             self.driver.execute_script("arguments[0].innerHTML = '';", body)
             self.logger.info("Cleared iframe body")
         except TimeoutException:
@@ -110,7 +82,7 @@ class FramesPage:
             TimeoutException: If the iframe body is not found.
         """
         try:
-            body = self.wait.until(EC.presence_of_element_located(self.IFRAME_BODY))
+            body = self.wait.present(self.IFRAME_BODY)
             self.driver.execute_script("arguments[0].innerHTML = arguments[1];", body, text)
             self.logger.info("Set iframe text: %s", text)
         except TimeoutException:
@@ -128,7 +100,7 @@ class FramesPage:
             TimeoutException: If the iframe body is not found.
         """
         try:
-            body = self.wait.until(EC.presence_of_element_located(self.IFRAME_BODY))
+            body = self.wait.present(self.IFRAME_BODY)
             text = self.driver.execute_script("return arguments[0].innerText;", body)
             self.logger.info("Retrieved iframe text: %s", text)
             return text
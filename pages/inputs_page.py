@@ -1,13 +1,13 @@
+import logging
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 
-class InputsPage:
+class InputsPage(BasePage):
     """
     Page Object Model for the 'Inputs' page in 'The Internet' demo site.
 
@@ -20,40 +20,12 @@ class InputsPage:
     URL: str = f"{CONFIG.get('base_url')}/inputs"
     INPUT_FIELD = (By.TAG_NAME, "input")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the InputsPage object with driver and wait objects.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Selenium WebDriverWait instance for explicit waits.
-        """
-        # WebDriver instance for browser interaction
-        self.driver = driver
-        # WebDriverWait instance for explicit waits
-        self.wait = wait
-        # Logger specific to this class
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Navigate to the Inputs page.
-
-        Raises:
-            WebDriverException: If the page fails to load.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-
-    def get_input_field(self) -> WebDriver:
+    def get_input_field(self) -> WebElement:
         """
         Locate and return the input field element.
 
-        Uses an explicit wait until the field is visible.
+        Uses an explicit wait until the field is visible the first time;
+        later calls return the cached element.
 
         Returns:
             WebElement: Input field element.
@@ -61,8 +33,12 @@ class InputsPage:
         Raises:
             TimeoutException: If the input field is not visible in time.
         """
+        return self.cache.get(self.INPUT_FIELD, self._locate_input_field)
+
+    def _locate_input_field(self) -> WebElement:
+        """Wait until the input field is visible and return it."""
         try:
-            field = self.wait.until(EC.visibility_of_element_located(self.INPUT_FIELD))
+            field = self.wait.visible(self.INPUT_FIELD)
             self.logger.debug("Input field located")
             return field
         except TimeoutException:
@@ -77,9 +53,7 @@ class InputsPage:
             WebDriverException: If the input field cannot be cleared.
         """
         try:
-            # Ensure the field is visible before clearing
-            field = self.get_input_field()
-            field.clear()
+            self.cache.run(self.INPUT_FIELD, self._locate_input_field, lambda field: field.clear())
             self.logger.debug("Cleared input field")
         except WebDriverException:
             self.logger.exception("Failed to clear input field")
@@ -96,9 +70,7 @@ class InputsPage:
             WebDriverException: If typing fails.
         """
         try:
-            # Ensure the field is ready for input
-            field = self.get_input_field()
-            field.send_keys(value)
+            self.cache.run(self.INPUT_FIELD, self._locate_input_field, lambda field: field.send_keys(value))
             self.logger.info("Typed value into input: %s", value)
         except WebDriverException:
             self.logger.exception("Failed to type value into input: %s", value)
@@ -116,11 +88,13 @@ class InputsPage:
         Raises:
             WebDriverException: If typing fails.
         """
+        # Checked once: with DEBUG off the loop does no logging work at all
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
-            field = self.get_input_field()
             for key in value:
-                field.send_keys(key)
-                self.logger.debug("Typed char: %s", key)
+                self.cache.run(self.INPUT_FIELD, self._locate_input_field, lambda field: field.send_keys(key))
+                if debug:
+                    self.logger.debug("Typed char: %s", key)
             self.logger.info("Finished typing sequence: %s", value)
         except WebDriverException:
             self.logger.exception("Failed to type characters into input: %s", value)
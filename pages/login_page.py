@@ -1,13 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
 
 
-class LoginPage:
+class LoginPage(BasePage):
     """
     Page Object Model (POM) for the login page of 'The Internet' website.
 
@@ -27,32 +24,6 @@ class LoginPage:
     LOGIN_BUTTON = (By.CSS_SELECTOR, "button.radius")
     FLASH_MESSAGE = (By.ID, "flash")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initializes the LoginPage instance.
-
-        Args:
-            driver (WebDriver): Selenium WebDriver instance.
-            wait (WebDriverWait): Selenium WebDriverWait instance for explicit waits.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-    
-    def open(self) -> None:
-        """
-        Opens the login page using the configured URL.
-
-        Raises:
-            WebDriverException: If the page fails to load.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-    
     def enter_username(self, username: str) -> None:
         """
         Enters the provided username into the username input field.
@@ -64,7 +35,7 @@ class LoginPage:
             TimeoutException: If the username field is not visible.
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(self.USERNAME_INPUT)).send_keys(username)
+            self.wait.visible(self.USERNAME_INPUT).send_keys(username)
             self.logger.debug("Entered username: %s", username)
         except TimeoutException:
             self.logger.exception("Timeout: Username field not found")
@@ -81,7 +52,7 @@ class LoginPage:
             TimeoutException: If the password field is not visible.
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(self.PASSWORD_INPUT)).send_keys(password)
+            self.wait.visible(self.PASSWORD_INPUT).send_keys(password)
             # Mask password in logs for security
             self.logger.info("Entered password: %s", '*' * len(password))
         except TimeoutException:
@@ -96,7 +67,7 @@ class LoginPage:
             TimeoutException: If the login button is not clickable.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.LOGIN_BUTTON)).click()
+            self.wait.clickable(self.LOGIN_BUTTON).click()
             self.logger.info("Clicked login button")
         except TimeoutException:
             self.logger.exception("Timeout: Login button not clickable")
@@ -113,7 +84,7 @@ class LoginPage:
             TimeoutException: If the flash message is not found.
         """
         try:
-            msg = self.wait.until(EC.visibility_of_element_located(self.FLASH_MESSAGE)).text
+            msg = self.wait.visible(self.FLASH_MESSAGE).text
             # Remove trailing close button character ('x') and whitespace
             msg = msg.replace("x", "").strip()
             self.logger.info("Flash message retrieved: %s", msg)
@@ -1,12 +1,9 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage
 from utils.config_loader import CONFIG
-from utils.logger import get_logger
 
-class WindowsPage:
+class WindowsPage(BasePage):
     """
     Page Object representing the 'Multiple Windows' page of the application.
     
@@ -25,30 +22,6 @@ class WindowsPage:
     CLICK_HERE_LINK = (By.LINK_TEXT, "Click Here")
     HEADING = (By.TAG_NAME, "h3")
 
-    def __init__(self, driver: WebDriver, wait: WebDriverWait):
-        """
-        Initialize the WindowsPage object.
-        
-        :param driver: Instance of Selenium WebDriver.
-        :param wait: Instance of WebDriverWait for explicit waits.
-        """
-        self.driver = driver
-        self.wait = wait
-        self.logger = get_logger(self.__class__.__name__)
-
-    def open(self) -> None:
-        """
-        Open the Multiple Windows page.
-        
-        :raises WebDriverException: If the page fails to load.
-        """
-        try:
-            self.driver.get(self.URL)
-            self.logger.info("Opened URL: %s", self.URL)
-        except WebDriverException:
-            self.logger.exception("Failed to open URL: %s", self.URL)
-            raise
-
     def click_new_window_link(self) -> None:
         """
         Click the 'Click Here' link to open a new window 
@@ -58,8 +31,8 @@ class WindowsPage:
                                   the new window does not appear in time.
         """
         try:
-            self.wait.until(EC.element_to_be_clickable(self.CLICK_HERE_LINK)).click()
-            self.wait.until(lambda d: len(d.window_handles) > 1)
+            self.wait.clickable(self.CLICK_HERE_LINK).click()
+            self.wait.window_count_above(1)
             self.logger.info("Clicked 'Click Here' link to open new window")
         except TimeoutException:
             self.logger.exception("Timeout while clicking 'Click Here' link")
@@ -88,7 +61,7 @@ class WindowsPage:
         :raises TimeoutException: If the heading is not found within the timeout.
         """
         try:
-            heading = self.wait.until(EC.presence_of_element_located(self.HEADING))
+            heading = self.wait.present(self.HEADING)
             self.logger.info("Heading text in current window: %s", heading.text)
             return heading.text
         except TimeoutException:
@@ -0,0 +1,138 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from utils import duration_scheduler
+from utils.duration_scheduler import (
+    PLUGIN_NAME, DurationSchedulePlugin, load_durations, lpt_plan, predict_makespan
+)
+from utils.logger import get_logger
+
+logger = get_logger("TestDurationScheduler")
+
+DURATIONS = {"t.py::a": 5.0, "t.py::b": 4.0, "t.py::c": 3.0, "t.py::d": 3.0, "t.py::e": 2.0}
+
+
+def test_lpt_plan_assigns_longest_first_to_least_loaded_worker() -> None:
+    """
+    Test Case: LPT Assignment
+
+    Expected Results:
+    - Tests are taken longest first, each to the least loaded worker
+      (ties go to the lowest worker index).
+    - Tests without history are returned apart, in collection order.
+    """
+    nodeids = ["t.py::new_1", *DURATIONS, "t.py::new_2"]
+    plan, loads, unknown = lpt_plan(nodeids, DURATIONS, 2)
+    logger.info("Plan %s, loads %s", plan, loads)
+
+    assert plan == [["t.py::a", "t.py::d"], ["t.py::b", "t.py::c", "t.py::e"]]
+    assert loads == [8.0, 9.0]
+    assert unknown == ["t.py::new_1", "t.py::new_2"]
+
+
+def test_lpt_plan_without_history_or_workers() -> None:
+    """
+    Test Case: LPT Fallbacks
+
+    Expected Results:
+    - With no history every test is left for the shared queue.
+    - A worker count below one is treated as a single worker.
+    """
+    plan, loads, unknown = lpt_plan(["t.py::x", "t.py::y"], {}, 3)
+    assert plan == [[], [], []] and loads == [0.0, 0.0, 0.0]
+    assert unknown == ["t.py::x", "t.py::y"]
+
+    plan, loads, _ = lpt_plan(list(DURATIONS), DURATIONS, 0)
+    assert plan == [list(DURATIONS)] and loads == [17.0]
+
+
+def test_predict_makespan_spreads_unknown_tests() -> None:
+    """
+    Test Case: Makespan Prediction
+
+    Expected Results:
+    - Each test without history goes to the least loaded worker at the estimate.
+    """
+    assert predict_makespan([8.0, 9.0], 0, 3.0) == 9.0
+    assert predict_makespan([8.0, 9.0], 3, 3.0) == 14.0
+    assert predict_makespan([], 2, 1.5) == 3.0
+
+
+def test_load_durations_averages_phases_over_reports(tmp_path) -> None:
+    """
+    Test Case: Duration History
+
+    Expected Results:
+    - A test's duration is setup + call + teardown, averaged over reports.
+    - Unreadable reports are skipped.
+    """
+    def report(call: float) -> dict:
+        return {"tests": [{"nodeid": "t.py::a", "setup": {"duration": 1.0},
+                           "call": {"duration": call}, "teardown": {"duration": 0.5}}]}
+
+    (tmp_path / "one.json").write_text(json.dumps(report(2.0)), encoding="utf-8")
+    (tmp_path / "two.json").write_text(json.dumps(report(4.0)), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+
+    assert load_durations([str(tmp_path / "*.json")]) == {"t.py::a": 4.5}
+
+
+class _FakeNode:
+    """Stand-in for an xdist WorkerController that records what it is sent."""
+
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+        self.steal = None
+
+    def send_runtest_some(self, indices) -> None:
+        self.sent.extend(indices)
+
+    def send_steal(self, indices) -> None:
+        self.steal = list(indices)
+
+    def shutdown(self) -> None:
+        self.shutting_down = True
+
+
+def test_scheduler_preassigns_known_tests_and_steals_the_rest() -> None:
+    """
+    Test Case: LPT + Work Stealing Scheduler
+
+    Test Steps:
+    1. Schedule a collection with history for most tests on two workers.
+    2. Let the lightly loaded worker finish its tests.
+
+    Expected Results:
+    - Each worker is sent its LPT share up front.
+    - Tests without history go to the worker that runs out of work.
+    - Once the shared queue is empty, the idle worker steals from the busiest one.
+    """
+    if not hasattr(duration_scheduler, "DurationScheduling"):
+        pytest.skip("pytest-xdist is not installed")
+
+    durations = {"t.py::a": 10.0, **{f"t.py::{name}": 1.0 for name in "bcdef"}}
+    collection = [*durations, "t.py::x", "t.py::y"]
+    plugin = DurationSchedulePlugin(durations)
+    config = SimpleNamespace(
+        getvalue=lambda name: ["2*popen"],
+        pluginmanager=SimpleNamespace(get_plugin=lambda name: plugin if name == PLUGIN_NAME else None),
+    )
+    scheduler = duration_scheduler.DurationScheduling(config)
+    first, second = _FakeNode("gw0"), _FakeNode("gw1")
+    for node in (first, second):
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+    index = {nodeid: position for position, nodeid in enumerate(collection)}
+    # gw0 only has 'a' (10s): idle right away, so it also drains the shared queue
+    assert first.sent == [index["t.py::a"], index["t.py::x"], index["t.py::y"]]
+    assert second.sent == [index[f"t.py::{name}"] for name in "bcdef"]
+    assert plugin.predicted == 10.0
+
+    for nodeid in ("t.py::a", "t.py::x"):
+        scheduler.mark_test_complete(first, index[nodeid])
+    assert second.steal == [index["t.py::e"], index["t.py::f"]]
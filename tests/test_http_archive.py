@@ -0,0 +1,112 @@
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from utils.http_archive import ANY_STATE, RECORD_MODE, REPLAY_MODE, HttpArchive, RecordReplayProxy
+from utils.logger import get_logger
+
+logger = get_logger("TestHttpArchive")
+
+
+class _Upstream(BaseHTTPRequestHandler):
+    """Two-page site: /login starts a session, /inputs answers per session."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        cookie = self.headers.get("Cookie", "")
+        headers = [("Content-Type", "text/html")]
+        if self.path == "/login":
+            body = b"<h2>Login Page</h2>"
+            headers.append(("Set-Cookie", "rack.session=first; path=/"))
+        else:
+            body = f"<h2>Inputs</h2><p>{cookie}</p>".encode("utf-8")
+        self.send_response(200)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Upstream)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://%s:%d" % server.server_address[:2]
+    server.shutdown()
+    server.server_close()
+
+
+def _get(base_url: str, path: str, cookie: str = "") -> bytes:
+    request = urllib.request.Request(base_url + path, headers={"Cookie": cookie} if cookie else {})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+
+def _run(upstream: str, directory, mode: str, requests) -> list:
+    proxy = RecordReplayProxy(upstream, HttpArchive(directory), mode)
+    url = proxy.start()
+    try:
+        return [_get(url, path, cookie) for path, cookie in requests]
+    finally:
+        proxy.stop()
+
+
+def test_clean_replay_leaves_nothing_unused(upstream, tmp_path) -> None:
+    """
+    Test Case: Record, Replay, Unused
+
+    Verifies that replaying exactly what was recorded uses every entry.
+
+    Test Steps:
+    1. Record /login (no session) and /inputs (in a session).
+    2. Replay the same requests from the archive.
+
+    Expected Results:
+    - Replay answers with the recorded bodies.
+    - Each response is stored once; the 'state=*' fallbacks are aliases.
+    - `unused()` is empty, so `prune --unused` removes nothing.
+    """
+    requests = [("/login", ""), ("/inputs", "rack.session=first")]
+    recorded = _run(upstream, tmp_path, RECORD_MODE, requests)
+    replayed = _run(upstream, tmp_path, REPLAY_MODE, requests)
+    assert replayed == recorded
+
+    archive = HttpArchive(tmp_path)
+    logger.info("Archive after replay: %s", archive.stats())
+    aliases = {key: entry for key, entry in archive.entries.items() if "alias" in entry}
+    assert len(aliases) == 2
+    assert all(key.endswith(f"state={ANY_STATE}") for key in aliases)
+    assert archive.stats()["blobs"] == archive.stats()["entries"] == 2
+    assert archive.unused() == []
+    assert archive.prune(archive.unused()) == (0, 0)
+
+
+def test_fallback_marks_the_aliased_entry_used(upstream, tmp_path) -> None:
+    """
+    Test Case: State Fallback
+
+    Verifies that a request replayed in an unrecorded state is served
+    through the alias, and that only the never-served entry is unused.
+
+    Expected Results:
+    - /inputs in another session gets the latest recording of /inputs.
+    - `unused()` lists /login (not replayed) but no alias; pruning it
+      also drops its alias.
+    """
+    _run(upstream, tmp_path, RECORD_MODE, [("/login", ""), ("/inputs", "rack.session=first")])
+    replayed = _run(upstream, tmp_path, REPLAY_MODE, [("/inputs", "rack.session=other")])
+    assert b"rack.session=first" in replayed[0]
+
+    archive = HttpArchive(tmp_path)
+    unused = archive.unused()
+    assert unused == [HttpArchive.key("GET", f"{upstream}/login")]
+    assert archive.prune(unused) == (2, 1)
+    assert HttpArchive.key("GET", f"{upstream}/login", state=ANY_STATE) not in archive.entries
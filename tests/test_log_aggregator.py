@@ -0,0 +1,152 @@
+import json
+import logging
+import socket
+import threading
+import time
+
+import pytest
+from utils.log_aggregator import ForwardingHandler, LogAggregator
+from utils.logger import get_logger
+
+logger = get_logger("TestLogAggregator")
+
+
+class _YieldingFileHandler(logging.FileHandler):
+    """File handler that gives other threads a chance to run between records."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        time.sleep(0)
+
+
+@pytest.fixture
+def aggregator_to(tmp_path):
+    """Starts LogAggregators writing '<created> <worker> <message>' lines to a file in tmp_path."""
+    started = []
+
+    def start(window: float):
+        output = tmp_path / "run.log"
+        handler = _YieldingFileHandler(output, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(created).6f %(worker)s %(message)s"))
+        aggregator = LogAggregator(window=window, handler=handler)
+        aggregator.start()
+        started.append(aggregator)
+        return aggregator, output
+
+    yield start
+    for aggregator in started:
+        aggregator.stop()
+
+
+def _lines(output) -> list:
+    return [line.split(" ", 2) for line in output.read_text(encoding="utf-8").splitlines()]
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    """Wait until the aggregator's connection threads have handled what was sent."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "aggregator did not receive the records in time"
+        time.sleep(0.01)
+
+
+def _send(address: str, lines: list) -> None:
+    """Act as a worker: send JSON lines over one connection, then close it."""
+    host, _, port = address.rpartition(":")
+    with socket.create_connection((host, int(port)), timeout=5) as sock:
+        sock.sendall(b"".join(json.dumps(line).encode("utf-8") + b"\n" for line in lines))
+
+
+def test_records_of_two_workers_are_written_in_time_order(aggregator_to) -> None:
+    """
+    Test Case: Ordering Window
+
+    Test Steps:
+    1. Worker gw1 sends its records, then gw0 sends older ones, all inside the window.
+    2. Flush the aggregator.
+
+    Expected Results:
+    - The file holds every record in timestamp order, whatever the arrival order.
+    - No record counts as late; each worker's reported drop count is kept.
+    """
+    aggregator, output = aggregator_to(window=5.0)
+    now = time.time()
+
+    def record(worker: str, offset: float, dropped: int = 0) -> dict:
+        return {"worker": worker, "created": now + offset, "msg": f"{worker}+{offset}",
+                "levelno": logging.INFO, "levelname": "INFO", "name": "test", "dropped": dropped}
+
+    _send(aggregator.address, [record("gw1", 0.2), record("gw1", 0.4, dropped=1),
+                               {"type": "stats", "worker": "gw1", "dropped": 2}])
+    _send(aggregator.address, [record("gw0", 0.1), record("gw0", 0.3), record("gw0", 0.5)])
+    _wait_for(lambda: sum(aggregator.stats()["received"].values()) == 5)
+    aggregator.flush()
+
+    lines = _lines(output)
+    logger.info("Aggregated lines: %s", lines)
+    assert [message for _, _, message in lines] == ["gw0+0.1", "gw1+0.2", "gw0+0.3", "gw1+0.4", "gw0+0.5"]
+    assert aggregator.stats() == {"received": {"gw1": 2, "gw0": 3}, "dropped": {"gw1": 2, "gw0": 0}, "late": 0}
+
+
+def test_forwarding_handler_counts_what_it_drops(aggregator_to) -> None:
+    """
+    Test Case: Dropped Records
+
+    Expected Results:
+    - A record that does not fit in the send buffer is dropped and counted.
+    - The count reaches the aggregator in the final 'stats' line.
+    - Without an aggregator every record is dropped, never blocking.
+    """
+    aggregator, output = aggregator_to(window=0.1)
+    handler = ForwardingHandler(aggregator.address, max_buffer=2000)
+    for message in ("short", "x" * 5000, "after"):
+        handler.handle(logging.makeLogRecord({"msg": message, "worker": "gw3", "nodeid": ""}))
+    handler.close()
+    _wait_for(lambda: "gw3" in aggregator.stats()["dropped"])
+    aggregator.flush()
+
+    assert [message for _, _, message in _lines(output)] == ["short", "after"]
+    assert handler.dropped == 1
+    assert aggregator.stats()["dropped"]["gw3"] == 1
+
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        address = "127.0.0.1:%d" % unused.getsockname()[1]
+    orphan = ForwardingHandler(address)
+    orphan.handle(logging.makeLogRecord({"msg": "lost"}))
+    orphan.close()
+    assert orphan.dropped == 1
+
+
+def test_flush_does_not_interleave_with_the_writer_thread(aggregator_to) -> None:
+    """
+    Test Case: Flush vs Writer Thread
+
+    Test Steps:
+    1. Feed records continuously while the writer thread runs with a short window.
+    2. Call flush() repeatedly from another thread at the same time.
+
+    Expected Results:
+    - Every record is written once, in timestamp order (no 'late' records).
+    """
+    aggregator, output = aggregator_to(window=0.01)
+    total = 3000
+    feeding = threading.Event()
+
+    def flush_repeatedly() -> None:
+        while not feeding.is_set():
+            aggregator.flush(timeout=0)
+
+    flusher = threading.Thread(target=flush_repeatedly)
+    flusher.start()
+    try:
+        for index in range(total):
+            aggregator.receive({"worker": "gw0", "created": time.time(), "msg": str(index)})
+    finally:
+        feeding.set()
+        flusher.join()
+    aggregator.flush()
+
+    written = _lines(output)
+    assert [int(message) for _, _, message in written] == list(range(total))
+    assert aggregator.stats()["late"] == 0
@@ -0,0 +1,81 @@
+import logging
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from utils.log_analyzer import LogIndex, log_files, read_segments
+from utils.logger import FILE_FORMAT, get_logger
+
+logger = get_logger("TestLogAnalyzer")
+
+TEST_A = "tests/test_a.py::test_a"
+TEST_B = "tests/test_b.py::test_b"
+
+
+def _write_rotated_log(path) -> dict:
+    """
+    Log interleaved lines of two tests through a small RotatingFileHandler.
+
+    Returns:
+        dict: nodeid -> the formatted lines written for it, in order.
+    """
+    handler = RotatingFileHandler(path, maxBytes=700, backupCount=10, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(FILE_FORMAT))
+    written = {TEST_A: [], TEST_B: []}
+    steps = [TEST_A] * 4 + [TEST_B] * 3 + [TEST_A] * 5 + [TEST_B] * 4 + [TEST_A] * 2
+    for number, nodeid in enumerate(steps):
+        record = logging.makeLogRecord({
+            "name": "TestPage", "levelname": "INFO", "levelno": logging.INFO,
+            "filename": "page.py", "lineno": 10 + number, "worker": "gw0", "nodeid": nodeid,
+            "msg": f"Step {number} of {nodeid.rpartition('::')[2]}",
+        })
+        handler.handle(record)
+        written[nodeid].append(handler.format(record))
+    handler.close()
+    return written
+
+
+def test_index_finds_a_test_across_rotations(tmp_path) -> None:
+    """
+    Test Case: Offset Index Across a Rotation
+
+    Test Steps:
+    1. Write a log that rotates several times while two tests log alternately.
+    2. Index run.log and its backups.
+
+    Expected Results:
+    - The files are indexed oldest first.
+    - Each test's lines are read back through its byte ranges, complete and
+      in order, although they span several files.
+    """
+    log = tmp_path / "run.log"
+    written = _write_rotated_log(log)
+    files = log_files(log)
+    assert len(files) > 2
+    assert [path.name for path in files] == [f"run.log.{n}" for n in range(len(files) - 1, 0, -1)] + ["run.log"]
+
+    index = LogIndex(files)
+    logger.info("Spans of %s: %s", TEST_A, index.tests[TEST_A])
+    assert len({name for name, _, _ in index.tests[TEST_A]}) > 1
+    for nodeid, lines in written.items():
+        assert list(index.test_lines(nodeid)) == lines
+
+
+def test_read_segments_skips_ranges_that_rotated_away(tmp_path) -> None:
+    """
+    Test Case: Report Segments
+
+    Expected Results:
+    - Ranges (relative to the root) spanning a rotation boundary are read in order.
+    - A range whose first line belongs to another test (the log rotated since
+      the report was written) is skipped.
+    """
+    written = _write_rotated_log(tmp_path / "run.log")
+    index = LogIndex(log_files(tmp_path / "run.log"))
+
+    def segments(nodeid: str) -> list:
+        return [{"file": Path(name).name, "start": start, "end": end}
+                for name, start, end in index.tests[nodeid]]
+
+    assert read_segments(segments(TEST_A), TEST_A, root=tmp_path) == written[TEST_A]
+    assert read_segments(segments(TEST_B) + segments(TEST_A), TEST_A, root=tmp_path) == written[TEST_A]
+    assert read_segments([{"file": "run.log.99", "start": 0, "end": 10}], TEST_A, root=tmp_path) == []
@@ -0,0 +1,128 @@
+import struct
+import time
+import zlib
+
+from utils.logger import get_logger
+from utils.screenshot_store import ScreenshotStore, perceptual_hash
+
+logger = get_logger("TestScreenshotStore")
+
+# Grey level of each of the 9 columns of the dHash grid: neighbours differ a lot
+COLUMNS = (200, 50, 180, 30, 220, 10, 190, 60, 170)
+
+
+def _png(columns=COLUMNS, nudge: int = 0) -> bytes:
+    """A 36x32 RGB PNG of vertical bands; `nudge` changes one pixel slightly (new bytes, same look)."""
+    rows = []
+    for y in range(32):
+        row = bytearray()
+        for x in range(36):
+            row += bytes([columns[x // 4]] * 3)
+        if y == 0:
+            row[0] = (row[0] + nudge) % 256
+        rows.append(b"\x00" + bytes(row))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", 36, 32, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(b"".join(rows))) + chunk(b"IEND", b""))
+
+
+def test_duplicate_put_stores_one_blob(tmp_path) -> None:
+    """
+    Test Case: Deduplication
+
+    Expected Results:
+    - The same PNG stored twice is one blob with two index entries.
+    - The second entry is flagged as a duplicate, in the same group.
+    """
+    store = ScreenshotStore(tmp_path)
+    first = store.put(_png(), "first", test="t::a")
+    second = store.put(_png(), "second", test="t::a")
+
+    assert (first["duplicate"], second["duplicate"]) == (False, True)
+    assert first["sha256"] == second["sha256"] and first["group"] == second["group"]
+    stats = store.stats()
+    logger.info("Store stats: %s", stats)
+    assert (stats["entries"], stats["blobs"], stats["deduplicated_bytes"]) == (2, 1, first["size"])
+
+
+def test_near_duplicates_of_a_test_share_a_group(tmp_path) -> None:
+    """
+    Test Case: Near-Duplicate Grouping
+
+    Expected Results:
+    - A screenshot differing in one pixel has new bytes but joins the group.
+    - A different screen of the same test starts a new group.
+    - The same screen in another test is grouped separately.
+    """
+    original, nudged, inverted = _png(), _png(nudge=1), _png(tuple(255 - value for value in COLUMNS))
+    assert perceptual_hash(original) == perceptual_hash(nudged) != perceptual_hash(inverted)
+
+    store = ScreenshotStore(tmp_path)
+    base = store.put(original, "base", test="t::a")
+    near = store.put(nudged, "near", test="t::a")
+    other_screen = store.put(inverted, "other", test="t::a")
+    other_test = store.put(original, "base", test="t::b")
+
+    assert near["sha256"] != base["sha256"] and near["group"] == base["group"]
+    assert other_screen["group"] != base["group"]
+    assert other_test["group"] not in (base["group"], other_screen["group"])
+    assert store.latest_by_test()["t::a"]["group_size"] == 1
+    assert store.stats()["near_duplicate_groups"] == 3
+
+
+def test_prune_by_count_age_and_size(tmp_path) -> None:
+    """
+    Test Case: Retention
+
+    Expected Results:
+    - keep_per_group keeps the newest entries of each group.
+    - max_age_days drops older entries, their blobs and their attachments.
+    - max_bytes alone drops the oldest entries until the blobs fit, and the
+      index no longer lists them.
+    """
+    store = ScreenshotStore(tmp_path)
+    now = time.time()
+    attachment = store.attachment_dir / "old.json"
+    attachment.parent.mkdir(parents=True)
+    attachment.write_text("{}", encoding="utf-8")
+    store.put(_png(), "old", test="t::a", created=now - 10 * 86400, files=[attachment])
+    for nudge in (1, 2, 3):
+        store.put(_png(nudge=nudge), f"near_{nudge}", test="t::a", created=now - 5 + nudge)
+    store.put(_png(tuple(255 - value for value in COLUMNS)), "other", test="t::b", created=now)
+
+    removed = store.prune(max_age_days=7)
+    assert (removed["entries"], removed["blobs"], removed["attachments"]) == (1, 1, 1)
+    assert not attachment.exists()
+
+    store.prune(keep_per_group=2)
+    assert [entry["name"] for entry in store.entries()] == ["near_2", "near_3", "other"]
+
+    newest = store.entries()[-1]
+    removed = store.prune(max_bytes=newest["size"])
+    assert removed["entries"] == 2 and removed["blobs"] == 2
+    assert [entry["name"] for entry in ScreenshotStore(tmp_path).entries()] == ["other"]
+    assert store.stats()["blobs"] == 1
+
+
+def test_index_is_read_incrementally_and_reloaded_after_a_prune(tmp_path) -> None:
+    """
+    Test Case: Shared Index
+
+    Expected Results:
+    - A second store on the same directory sees entries appended by the first.
+    - After the first prunes (index rewritten), the second reloads it.
+    """
+    writer, reader = ScreenshotStore(tmp_path), ScreenshotStore(tmp_path)
+    writer.put(_png(), "one", test="t::a", created=time.time() - 30 * 86400)
+    assert [entry["name"] for entry in reader.entries()] == ["one"]
+
+    writer.put(_png(nudge=1), "two", test="t::a")
+    assert [entry["name"] for entry in reader.entries()] == ["one", "two"]
+
+    writer.prune(max_age_days=1)
+    assert [entry["name"] for entry in reader.entries()] == ["two"]
+    assert reader.put(_png(), "three", test="t::a")["duplicate"] is False
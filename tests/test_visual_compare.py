@@ -0,0 +1,202 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from utils.logger import get_logger  # noqa: E402
+from utils.visual_regression import (  # noqa: E402
+    VisualRegression, compare, decode, dhash, encode_png, heatmap, ignore_mask
+)
+
+logger = get_logger("TestVisualCompare")
+
+
+def _page(height: int = 40, width: int = 60) -> "np.ndarray":
+    """A grey page with a dark band, as a HxWx3 uint8 image."""
+    image = np.full((height, width, 3), 200, dtype=np.uint8)
+    image[10:14, 5:55] = 30
+    return image
+
+
+def test_compare_counts_changes_beyond_tolerance() -> None:
+    """
+    Test Case: Vectorized Diff
+
+    Expected Results:
+    - Identical images have no changed pixels.
+    - Differences up to the tolerance are ignored.
+    - A changed block is counted with its bounding box and largest difference,
+      whichever image is brighter (no uint8 wrap-around).
+    """
+    expected = _page()
+    assert compare(expected, expected.copy())["changed_pixels"] == 0
+
+    faint = expected.copy()
+    faint[0:5, 0:5] += 16
+    assert compare(faint, expected, tolerance=16)["changed_pixels"] == 0
+
+    actual = expected.copy()
+    actual[20:25, 30:40] = (250, 10, 200)
+    result = compare(actual, expected, tolerance=16)
+    logger.info("Diff result: %s", result)
+    assert result["changed_pixels"] == 50
+    assert result["bbox"] == [30, 20, 10, 5]
+    assert result["max_delta"] == 190
+    assert result["diff_ratio"] == 50 / (40 * 60)
+    assert compare(expected, actual)["changed_pixels"] == 50
+
+
+def test_ignore_mask_excludes_regions() -> None:
+    """
+    Test Case: Ignore Regions
+
+    Expected Results:
+    - Without regions there is no mask.
+    - Regions are scaled to screenshot pixels and excluded from the diff;
+      the ratio is taken over the compared pixels only.
+    - A region scrolled partly or fully out of the viewport (negative
+      coordinates) masks only what is visible.
+    """
+    assert ignore_mask((40, 60), []) is None
+
+    mask = ignore_mask((40, 60), [(15, 10, 5, 3)], scale=2.0)
+    assert not mask[20:26, 30:40].any()
+    assert mask.sum() == 40 * 60 - 6 * 10
+
+    expected = _page()
+    actual = expected.copy()
+    actual[20:26, 30:40] = 0
+    actual[0, 0] = 0
+    result = compare(actual, expected, mask=mask)
+    assert result["changed_pixels"] == 1
+    assert result["diff_ratio"] == 1 / mask.sum()
+
+    partly_above = ignore_mask((40, 60), [(0, -5, 10, 8)])
+    assert not partly_above[0:3, 0:10].any() and partly_above[3:].all()
+    assert ignore_mask((40, 60), [(0, -50, 10, 8)]).all()
+
+
+def test_heatmap_marks_changes_in_red() -> None:
+    """
+    Test Case: Heatmap
+
+    Expected Results:
+    - Changed pixels are red, brighter for larger differences.
+    - Unchanged pixels show the dimmed baseline.
+    """
+    expected = _page()
+    actual = expected.copy()
+    actual[0, 0] = 0
+    actual[0, 1] = 100
+    result = compare(actual, expected, keep_delta=True)
+    image = heatmap(expected, result["_delta"], result["_changed"])
+
+    assert image.dtype == np.uint8 and image.shape == expected.shape
+    assert tuple(image[0, 0]) == (128 + 200 // 2, 0, 0)
+    assert tuple(image[0, 1]) == (128 + 100 // 2, 0, 0)
+    assert tuple(image[39, 59]) == (200 // 3 + 170,) * 3
+
+
+def test_dhash_ignores_small_changes() -> None:
+    """
+    Test Case: Perceptual Hash
+
+    Expected Results:
+    - A few changed pixels keep the hash; an inverted page changes most bits.
+    """
+    rng = np.random.default_rng(0)
+    expected = rng.integers(0, 256, size=(64, 72, 3), dtype=np.uint8)
+    actual = expected.copy()
+    actual[0, 0] = 255 - actual[0, 0]
+    assert dhash(actual) == dhash(expected)
+    assert bin(dhash(255 - expected) ^ dhash(expected)).count("1") > 48
+
+
+def test_encode_decode_round_trip() -> None:
+    """
+    Test Case: PNG Round Trip
+
+    Expected Results:
+    - encode_png() output decodes back to the same pixels.
+    """
+    image = _page()
+    assert np.array_equal(decode(encode_png(image)), image)
+
+
+class _FakeElement:
+    pass
+
+
+class _FakeDriver:
+    """Just enough of a WebDriver for VisualRegression.check()."""
+
+    def __init__(self, png: bytes, viewport_rects: list):
+        self.png = png
+        self.viewport_rects = viewport_rects
+        self.scripts = []
+
+    def get_window_size(self) -> dict:
+        return {"width": 60, "height": 40}
+
+    def get_screenshot_as_png(self) -> bytes:
+        return self.png
+
+    def find_elements(self, by: str, value: str) -> list:
+        return [_FakeElement() for _ in self.viewport_rects]
+
+    def execute_script(self, script: str, *args):
+        self.scripts.append(script)
+        if "getBoundingClientRect" in script:
+            return self.viewport_rects
+        return 1
+
+
+class _ScrolledPage:
+    VISUAL_IGNORE = (("css selector", "#clock"),)
+
+    def __init__(self, driver):
+        self.driver = driver
+
+
+def test_check_flow_and_viewport_ignore_regions(tmp_path) -> None:
+    """
+    Test Case: Check Against a Baseline
+
+    Test Steps:
+    1. Check without a baseline, then record one.
+    2. Check an identical and a changed screenshot; the change lies in an
+       ignored element whose viewport position differs from its page position.
+
+    Expected Results:
+    - No baseline: not passed, 'missing_baseline', the screenshot is kept.
+    - Identical bytes: 'identical'.
+    - The ignore region is taken from getBoundingClientRect() (viewport), so
+      the change inside it is not counted; other changes are.
+    """
+    expected = _page()
+    checker = VisualRegression(tmp_path / "baselines", tmp_path / "out")
+    driver = _FakeDriver(encode_png(expected), [[30, 20, 10, 5]])
+    page = _ScrolledPage(driver)
+
+    missing = checker.check(page)
+    assert (missing["passed"], missing["status"]) == (False, "missing_baseline")
+    assert Path(missing["actual"]).read_bytes() == driver.png
+
+    checker.update = True
+    assert checker.check(page)["status"] == "baseline_created"
+    checker.update = False
+    assert checker.check(page)["status"] == "identical"
+
+    actual = expected.copy()
+    actual[20:25, 30:40] = 0
+    driver.png = encode_png(actual)
+    result = checker.check(page)
+    assert (result["passed"], result["status"], result["changed_pixels"]) == (True, "compared", 0)
+    assert any("getBoundingClientRect" in script for script in driver.scripts)
+
+    actual[0:5, 0:5] = 0
+    driver.png = encode_png(actual)
+    result = checker.check(page)
+    assert (result["passed"], result["changed_pixels"]) == (False, 25)
+    assert result["heatmap"].endswith(".diff.png")
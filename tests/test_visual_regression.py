@@ -0,0 +1,55 @@
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from pages.alerts_page import AlertsPage
+from pages.checkboxes_page import CheckboxesPage
+from pages.drag_and_drop_page import DragAndDropPage
+from pages.dropdown_page import DropdownPage
+from pages.dynamic_controls_page import DynamicControlsPage
+from pages.file_upload_page import FileUploadPage
+from pages.frames_page import FramesPage
+from pages.inputs_page import InputsPage
+from pages.login_page import LoginPage
+from pages.windows_page import WindowsPage
+from utils.logger import get_logger
+
+logger = get_logger("TestVisualRegression")
+
+PAGES = [
+    AlertsPage, CheckboxesPage, DragAndDropPage, DropdownPage, DynamicControlsPage,
+    FileUploadPage, FramesPage, InputsPage, LoginPage, WindowsPage,
+]
+
+
+@pytest.mark.visual
+@pytest.mark.parametrize("page_class", PAGES, ids=lambda page_class: page_class.__name__)
+def test_page_matches_baseline(visual, driver: WebDriver, wait: WebDriverWait, page_class) -> None:
+    """
+    Test Case: Visual Regression
+
+    Verifies that a page still looks like its baseline screenshot.
+    Deselected by default (pytest.ini): run with `pytest -m visual`, after
+    recording baselines with `pytest -m visual --update-baselines`.
+
+    Test Steps:
+    1. Open the page.
+    2. Screenshot it and compare with the baseline of this browser and window size.
+
+    Expected Results:
+    - No more than 'max_diff_ratio' of the pixels differ beyond 'tolerance'.
+    - Without a baseline the test is reported as xfail until one is
+      recorded with --update-baselines.
+    """
+    page = page_class(driver, wait)
+    page.open()
+
+    result = visual(page)
+    logger.info("Visual check of %s: %s", page_class.__name__, result)
+
+    if result["status"] == "missing_baseline":
+        pytest.xfail(f"No baseline {result['baseline']}: record it with --update-baselines")
+
+    assert result["passed"], (
+        f"{page_class.__name__} differs from its baseline: {result.get('diff_ratio')} of pixels changed, "
+        f"see {result.get('heatmap') or result.get('actual')}"
+    )
@@ -0,0 +1,128 @@
+from typing import Any, Dict
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.config_loader import CONFIG
+from utils.request_rules import apply_request_rules
+
+# URL patterns blocked when a profile sets 'block_fonts'
+FONT_URL_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+
+
+def get_profile(name: str = None) -> Dict[str, Any]:
+    """
+    Return the browser performance profile selected in config.json.
+
+    Profiles live under 'browser_profiles'; the active one is named by
+    'browser_profile' ('default', no tuning, unless changed) and can be
+    switched per run with `pytest --browser-profile NAME`, e.g. 'fast'.
+    A tuned profile changes what the suite loads (eager page loads, no
+    images or fonts), so it is opt-in.
+    Supported keys:
+        page_load_strategy (str): 'normal', 'eager' or 'none'.
+        block_images (bool): Do not load images.
+        block_fonts (bool): Do not load web fonts.
+        disable_extensions (bool): Start without browser extensions.
+        disable_background_networking (bool): Turn off background requests.
+        disable_component_update (bool): Turn off component / add-on updates.
+        skip_first_run (bool): Skip first-run and default-browser prompts.
+        device_scale_factor (float): Device pixel ratio (smaller screenshots).
+
+    Args:
+        name (str): Profile name. Defaults to the 'browser_profile' setting.
+
+    Returns:
+        Dict[str, Any]: Profile settings (empty for no profile).
+
+    Raises:
+        RuntimeError: If the profile is not defined in config.json.
+    """
+    name = name or CONFIG.get("browser_profile")
+    if not name:
+        return {}
+    profiles = CONFIG.get("browser_profiles", {})
+    if name not in profiles:
+        raise RuntimeError(f"config.json: browser profile '{name}' not defined under 'browser_profiles'")
+    return profiles[name]
+
+
+def apply_chromium_profile(options: ArgOptions, profile: Dict[str, Any]) -> None:
+    """
+    Apply a profile to Edge or Chrome options.
+
+    Args:
+        options (ArgOptions): EdgeOptions or ChromeOptions instance.
+        profile (Dict[str, Any]): Profile settings.
+    """
+    if profile.get("page_load_strategy"):
+        options.page_load_strategy = profile["page_load_strategy"]
+    if profile.get("block_images"):
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    if profile.get("disable_extensions"):
+        options.add_argument("--disable-extensions")
+    if profile.get("disable_background_networking"):
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+    if profile.get("disable_component_update"):
+        options.add_argument("--disable-component-update")
+    if profile.get("skip_first_run"):
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+    if profile.get("device_scale_factor"):
+        options.add_argument(f"--force-device-scale-factor={profile['device_scale_factor']}")
+
+
+def apply_firefox_profile(options: ArgOptions, profile: Dict[str, Any]) -> None:
+    """
+    Apply a profile to Firefox options through about:config preferences.
+
+    Args:
+        options (ArgOptions): FirefoxOptions instance.
+        profile (Dict[str, Any]): Profile settings.
+    """
+    if profile.get("page_load_strategy"):
+        options.page_load_strategy = profile["page_load_strategy"]
+    if profile.get("block_images"):
+        options.set_preference("permissions.default.image", 2)
+    if profile.get("block_fonts"):
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
+    if profile.get("disable_extensions"):
+        options.set_preference("extensions.enabledScopes", 0)
+        options.set_preference("extensions.autoDisableScopes", 15)
+    if profile.get("disable_background_networking"):
+        options.set_preference("network.prefetch-next", False)
+        options.set_preference("network.dns.disablePrefetch", True)
+        options.set_preference("browser.safebrowsing.malware.enabled", False)
+        options.set_preference("browser.safebrowsing.phishing.enabled", False)
+        options.set_preference("datareporting.healthreport.uploadEnabled", False)
+    if profile.get("disable_component_update"):
+        options.set_preference("app.update.auto", False)
+        options.set_preference("extensions.update.enabled", False)
+        options.set_preference("media.gmp-manager.updateEnabled", False)
+    if profile.get("skip_first_run"):
+        options.set_preference("browser.startup.homepage_override.mstone", "ignore")
+        options.set_preference("datareporting.policy.firstRunURL", "")
+        options.set_preference("browser.shell.checkDefaultBrowser", False)
+    if profile.get("device_scale_factor"):
+        options.set_preference("layout.css.devPixelsPerPx", str(profile["device_scale_factor"]))
+
+
+def apply_session_profile(drv: WebDriver, browser: str, profile: Dict[str, Any]) -> None:
+    """
+    Apply profile settings and request rules that need a live session.
+
+    Chromium has no launch flag to block web fonts, so they are blocked
+    through the DevTools Network domain once the session exists, in the
+    same blocked-URL list as the third-party hosts of 'request_rules'.
+
+    Args:
+        drv (WebDriver): Newly created session.
+        browser (str): Browser name from config.json.
+        profile (Dict[str, Any]): Profile settings.
+    """
+    extra_patterns = FONT_URL_PATTERNS if profile.get("block_fonts") else []
+    apply_request_rules(drv, browser, extra_patterns)
@@ -0,0 +1,22 @@
+from typing import Any, Dict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def execute_cdp(drv: WebDriver, cmd: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Execute a Chrome DevTools Protocol command on an Edge or Chrome session.
+
+    Goes through the 'executeCdpCommand' endpoint directly, so it works for
+    local drivers as well as `webdriver.Remote` sessions opened against a
+    shared driver service with a `ChromiumRemoteConnection`.
+
+    Args:
+        drv (WebDriver): Edge or Chrome session.
+        cmd (str): DevTools command, e.g. 'Network.enable'.
+        params (Dict[str, Any]): Command parameters. Defaults to no parameters.
+
+    Returns:
+        Dict[str, Any]: Command result.
+    """
+    return drv.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
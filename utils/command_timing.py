@@ -0,0 +1,198 @@
+import json
+import math
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class CommandRecorder:
+    """
+    Records every WebDriver command issued by instrumented sessions during a test.
+
+    `instrument()` wraps a session's command executor; from then on each
+    command is timed and attributed to the page-object method (or test
+    function) that issued it. Only commands sent from the thread running the
+    test are recorded, so background work (pre-warming, the reaper quitting
+    old sessions) does not leak into a test's numbers.
+
+    Attributes:
+        top_n (int): Slowest commands kept per test summary.
+    """
+
+    def __init__(self, top_n: int = 10):
+        """
+        Initialize the recorder.
+
+        Args:
+            top_n (int): Slowest commands kept per test summary. Defaults to 10.
+        """
+        self.top_n = top_n
+        self._records: List[Dict[str, Any]] = []
+        self._thread: Optional[threading.Thread] = None
+
+    # ----------------------------
+    # Instrumentation
+    # ----------------------------
+    def instrument(self, drv: WebDriver) -> WebDriver:
+        """
+        Wrap the session's command executor so its commands are recorded.
+
+        Idempotent: pooled sessions can be passed again safely.
+
+        Args:
+            drv (WebDriver): Session to instrument.
+
+        Returns:
+            WebDriver: The same session.
+        """
+        executor = drv.command_executor
+        if getattr(executor, "_timed_by", None) is self:
+            return drv
+        execute = executor.execute
+        recorder = self
+
+        def timed_execute(command: str, params: Optional[dict] = None) -> Any:
+            if threading.current_thread() is not recorder._thread:
+                return execute(command, params)
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(command, params)
+                return response
+            finally:
+                recorder._records.append({
+                    "command": command,
+                    "origin": _origin(),
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                    "request_bytes": _size(params),
+                    "response_bytes": _size(response.get("value") if isinstance(response, dict) else response),
+                })
+
+        executor.execute = timed_execute
+        executor._timed_by = self
+        return drv
+
+    # ----------------------------
+    # Per-test lifecycle
+    # ----------------------------
+    def start_test(self) -> None:
+        """Start recording for the test running on the current thread."""
+        self._records = []
+        self._thread = threading.current_thread()
+
+    def finish_test(self) -> Dict[str, Any]:
+        """
+        Stop recording and summarise the test's commands.
+
+        Returns:
+            Dict[str, Any]: See `summarize()`.
+        """
+        self._thread = None
+        records, self._records = self._records, []
+        return summarize(records, self.top_n)
+
+
+def summarize(records: List[Dict[str, Any]], top_n: int = 10) -> Dict[str, Any]:
+    """
+    Aggregate command records into per-command latency histograms.
+
+    Args:
+        records (List[Dict[str, Any]]): Records from CommandRecorder.
+        top_n (int): Number of slowest commands to keep. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: {
+            total: {count, duration_ms, request_bytes, response_bytes},
+            commands: {name: {count, total_ms, mean_ms, p50_ms, p95_ms, max_ms, buckets}},
+            origins: {origin: {count, total_ms}},
+            slowest: [record, ...]  (top_n, slowest first)
+        }
+    """
+    by_command: Dict[str, List[float]] = {}
+    origins: Dict[str, Dict[str, float]] = {}
+    for record in records:
+        by_command.setdefault(record["command"], []).append(record["duration_ms"])
+        origin = origins.setdefault(record["origin"], {"count": 0, "total_ms": 0.0})
+        origin["count"] += 1
+        origin["total_ms"] = round(origin["total_ms"] + record["duration_ms"], 3)
+
+    commands = {}
+    for name, durations in sorted(by_command.items()):
+        durations.sort()
+        commands[name] = {
+            "count": len(durations),
+            "total_ms": round(sum(durations), 3),
+            "mean_ms": round(sum(durations) / len(durations), 3),
+            "p50_ms": round(_percentile(durations, 50), 3),
+            "p95_ms": round(_percentile(durations, 95), 3),
+            "max_ms": round(durations[-1], 3),
+            "buckets": _histogram(durations),
+        }
+
+    slowest = sorted(records, key=lambda r: r["duration_ms"], reverse=True)[:top_n]
+    return {
+        "total": {
+            "count": len(records),
+            "duration_ms": round(sum(r["duration_ms"] for r in records), 3),
+            "request_bytes": sum(r["request_bytes"] for r in records),
+            "response_bytes": sum(r["response_bytes"] for r in records),
+        },
+        "commands": commands,
+        "origins": origins,
+        "slowest": [{**r, "duration_ms": round(r["duration_ms"], 3)} for r in slowest],
+    }
+
+
+def _histogram(durations: List[float]) -> Dict[str, int]:
+    """Count durations per bucket ('le_<ms>' and a final 'gt_<ms>'); empty buckets are omitted."""
+    buckets: Dict[str, int] = {}
+    for duration in durations:
+        label = next((f"le_{bound}" for bound in BUCKETS_MS if duration <= bound), f"gt_{BUCKETS_MS[-1]}")
+        buckets[label] = buckets.get(label, 0) + 1
+    return buckets
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _origin() -> str:
+    """
+    Return the page-object method (or test function) that issued the current command.
+
+    Walks up the stack to the first frame in a `pages.*` module; falls back to
+    the first `tests.*` frame, then to '<other>'.
+    """
+    frame = sys._getframe(2)
+    test_frame = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("pages."):
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            return frame.f_code.co_qualname
+        if test_frame is None and (module.startswith("tests.") or module.startswith("test_")):
+            test_frame = frame
+        frame = frame.f_back
+    return test_frame.f_code.co_name if test_frame is not None else "<other>"
+
+
+def _size(payload: Any) -> int:
+    """Approximate JSON size of a command payload in bytes."""
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload)
+    try:
+        return len(json.dumps(payload, default=str))
+    except (TypeError, ValueError):
+        return 0
@@ -1,7 +1,7 @@
 import json
 import os
 from typing import Any, Dict
-from utils.logger import get_logger
+from utils.logger import configure_levels, get_logger
 
 logger = get_logger(__name__)
 
@@ -46,3 +46,9 @@ def load_config() -> Dict[str, Any]:
 
 # Load configuration at module import
 CONFIG: Dict[str, Any] = load_config()
+
+# Apply the configured log levels to every logger (see utils.logger.configure_levels)
+try:
+    configure_levels(CONFIG.get("logging", {}).get("level"), CONFIG.get("logging", {}).get("levels"))
+except ValueError as exc:
+    raise RuntimeError(f"config.json: invalid 'logging' level: {exc}") from exc
@@ -0,0 +1,43 @@
+"""
+JavaScript helpers shared by the scripts WaitEngine and element_state run in the browser.
+
+DOM_HELPERS_JS defines:
+    findAll(by, value): Resolve a Selenium locator ('id', 'css selector',
+        'xpath', 'tag name', 'class name', 'name', 'link text',
+        'partial link text') to an array of elements in the current document.
+    isDisplayed(el): Approximation of WebElement.is_displayed().
+"""
+
+DOM_HELPERS_JS = """
+function findAll(by, value) {
+    var doc = document;
+    switch (by) {
+        case 'id': var el = doc.getElementById(value); return el ? [el] : [];
+        case 'css selector': return Array.prototype.slice.call(doc.querySelectorAll(value));
+        case 'tag name': return Array.prototype.slice.call(doc.getElementsByTagName(value));
+        case 'class name': return Array.prototype.slice.call(doc.getElementsByClassName(value));
+        case 'name': return Array.prototype.slice.call(doc.getElementsByName(value));
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(doc.getElementsByTagName('a'), function (a) {
+                var text = (a.innerText || a.textContent || '').trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'xpath':
+            var snap = doc.evaluate(value, doc, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var out = [];
+            for (var i = 0; i < snap.snapshotLength; i++) { out.push(snap.snapshotItem(i)); }
+            return out;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isDisplayed(el) {
+    if (!el.isConnected) { return false; }
+    if (typeof el.checkVisibility === 'function') {
+        return el.checkVisibility({visibilityProperty: true});
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+"""
@@ -0,0 +1,187 @@
+import threading
+from typing import Callable, List, Optional
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+
+
+class DriverPool:
+    """
+    Pool of live WebDriver sessions reused across tests.
+
+    Instead of starting and quitting a browser for every test, sessions are
+    handed out with `acquire()` and given back with `release()`. On release
+    the session is reset to a clean state (no alerts, a single window, the
+    top-level frame, no cookies or web storage, 'about:blank'). A session
+    that cannot be reset is quit and replaced by a fresh one on the next
+    `acquire()`.
+
+    Attributes:
+        factory (Callable[[], WebDriver]): Function creating a new WebDriver.
+        max_idle (int): Maximum number of idle sessions kept alive.
+        disposer (Optional[Callable[[WebDriver], None]]): Function used to get rid of
+            a session (e.g. a background reaper). Sessions are quit inline when None.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        max_idle: int = 1,
+        disposer: Optional[Callable[[WebDriver], None]] = None,
+    ):
+        """
+        Initialize the DriverPool.
+
+        Args:
+            factory (Callable[[], WebDriver]): Function creating a new WebDriver.
+            max_idle (int): Maximum number of idle sessions kept alive. Defaults to 1.
+            disposer (Optional[Callable[[WebDriver], None]]): Function used to get rid
+                of a session. Defaults to None (quit inline).
+        """
+        self.factory = factory
+        self.max_idle = max(1, int(max_idle))
+        self.disposer = disposer
+        self.logger = get_logger(self.__class__.__name__)
+        self._idle: List[WebDriver] = []
+        self._in_use: List[WebDriver] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> WebDriver:
+        """
+        Hand out an idle session, or create a new one if none is available.
+
+        Returns:
+            WebDriver: A live WebDriver session in a clean state.
+        """
+        with self._lock:
+            drv = self._idle.pop() if self._idle else None
+
+        if drv is None:
+            drv = self.factory()
+            self.logger.info("Created new pooled WebDriver session id=%s", id(drv))
+        else:
+            self.logger.debug("Reusing pooled WebDriver session id=%s", id(drv))
+
+        with self._lock:
+            self._in_use.append(drv)
+        return drv
+
+    def release(self, drv: WebDriver) -> None:
+        """
+        Give a session back to the pool.
+
+        The session is reset first; if the reset fails, or the pool already
+        holds `max_idle` idle sessions, the session is quit instead.
+
+        Args:
+            drv (WebDriver): Session previously returned by `acquire()`.
+        """
+        with self._lock:
+            if drv in self._in_use:
+                self._in_use.remove(drv)
+
+        if not self.reset(drv):
+            self.discard(drv)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(drv)
+                return
+        self.discard(drv)
+
+    def reset(self, drv: WebDriver) -> bool:
+        """
+        Bring a session back to a clean state between tests.
+
+        Steps:
+            - Dismiss any open JavaScript alert (see AlertsPage).
+            - Close every window except the first one (see WindowsPage).
+            - Leave any iframe (see FramesPage).
+            - Clear cookies, localStorage and sessionStorage.
+            - Navigate to 'about:blank'.
+
+        Args:
+            drv (WebDriver): Session to reset.
+
+        Returns:
+            bool: True if the session was reset, False if it should be discarded.
+        """
+        try:
+            self._dismiss_alert(drv)
+
+            handles = drv.window_handles
+            if not handles:
+                return False
+            for handle in handles[1:]:
+                drv.switch_to.window(handle)
+                self._dismiss_alert(drv)
+                drv.close()
+            drv.switch_to.window(handles[0])
+            drv.switch_to.default_content()
+
+            drv.delete_all_cookies()
+            try:
+                drv.execute_script(
+                    "try { window.localStorage.clear(); } catch (e) {}"
+                    "try { window.sessionStorage.clear(); } catch (e) {}"
+                )
+            except WebDriverException:
+                # Pages such as 'about:blank' have no storage to clear
+                self.logger.debug("Web storage not accessible on current page", exc_info=True)
+
+            drv.get("about:blank")
+            self.logger.debug("Reset pooled WebDriver session id=%s", id(drv))
+            return True
+        except WebDriverException:
+            self.logger.warning("Failed to reset WebDriver session id=%s, discarding it",
+                                id(drv), exc_info=True)
+            return False
+
+    def discard(self, drv: WebDriver) -> None:
+        """
+        Quit a session (or hand it to the disposer) and drop it from the pool.
+
+        Args:
+            drv (WebDriver): Session to quit.
+        """
+        with self._lock:
+            if drv in self._idle:
+                self._idle.remove(drv)
+            if drv in self._in_use:
+                self._in_use.remove(drv)
+        if self.disposer:
+            self.disposer(drv)
+            return
+        try:
+            drv.quit()
+            self.logger.info("WebDriver quit successfully")
+        except WebDriverException:
+            self.logger.exception("Error quitting WebDriver")
+
+    def close(self) -> None:
+        """
+        Quit every session owned by the pool, idle or in use.
+        """
+        with self._lock:
+            sessions = self._idle + self._in_use
+            self._idle = []
+            self._in_use = []
+        for drv in sessions:
+            self.discard(drv)
+        self.logger.info("Driver pool closed | sessions quit=%d", len(sessions))
+
+    @staticmethod
+    def _dismiss_alert(drv: WebDriver) -> None:
+        """
+        Dismiss the current alert, if any.
+
+        Args:
+            drv (WebDriver): Session to inspect.
+        """
+        try:
+            drv.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
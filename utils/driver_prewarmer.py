@@ -0,0 +1,190 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, List
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+
+
+class DriverPrewarmer:
+    """
+    Keeps a queue of ready-to-use WebDriver sessions booted in background threads.
+
+    `get()` returns a warm session immediately when one is queued and only
+    blocks when the queue is empty. Every session taken from the queue
+    triggers a background refill, so the queue depth converges back to `size`.
+
+    Counters returned by `stats()` help size the queue against the test rate:
+        queue_depth: Sessions currently ready in the queue.
+        requests: Number of `get()` calls.
+        waits: Number of `get()` calls that had to block.
+        total_wait / max_wait: Time (s) spent blocked in `get()`.
+        created / failed: Background session creations that succeeded / failed.
+
+    Attributes:
+        factory (Callable[[], WebDriver]): Function creating a new WebDriver.
+        size (int): Number of sessions to keep warm.
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int):
+        """
+        Initialize the DriverPrewarmer.
+
+        Args:
+            factory (Callable[[], WebDriver]): Function creating a new WebDriver.
+            size (int): Number of sessions to keep warm.
+        """
+        self.factory = factory
+        self.size = max(0, int(size))
+        self.logger = get_logger(self.__class__.__name__)
+        self._ready: "queue.Queue[WebDriver]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stopped = False
+        self._threads: List[threading.Thread] = []
+        self._stats = {
+            "requests": 0,
+            "waits": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+            "created": 0,
+            "failed": 0,
+        }
+
+    def start(self) -> None:
+        """
+        Start booting sessions in the background until `size` are queued.
+        """
+        self.logger.info("Pre-warming %d WebDriver session(s)", self.size)
+        self._refill()
+
+    def get(self) -> WebDriver:
+        """
+        Return a warm session, blocking only if the queue is empty.
+
+        If the queue is empty and no background creation is in flight
+        (e.g. every warm-up attempt failed), the session is created in the
+        calling thread so that factory errors surface in the test.
+
+        Returns:
+            WebDriver: A freshly started WebDriver session.
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+
+        try:
+            drv = self._ready.get_nowait()
+        except queue.Empty:
+            drv = self._wait_for_session()
+
+        self._refill()
+        return drv
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return a snapshot of the pre-warmer counters.
+
+        Returns:
+            Dict[str, float]: Counters described in the class docstring.
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+        snapshot["queue_depth"] = self._ready.qsize()
+        return snapshot
+
+    def stop(self) -> None:
+        """
+        Stop refilling, wait for in-flight creations and quit queued sessions.
+        """
+        with self._lock:
+            self._stopped = True
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+
+        quit_count = 0
+        while True:
+            try:
+                drv = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                drv.quit()
+                quit_count += 1
+            except WebDriverException:
+                self.logger.exception("Error quitting pre-warmed WebDriver")
+        self.logger.info("Pre-warmer stopped | unused sessions quit=%d | stats=%s",
+                         quit_count, self.stats())
+
+    def _wait_for_session(self) -> WebDriver:
+        """
+        Block until a warm session is available and record the wait time.
+
+        Returns:
+            WebDriver: A freshly started WebDriver session.
+        """
+        start = time.perf_counter()
+        self._refill()
+        try:
+            while True:
+                try:
+                    return self._ready.get(timeout=0.1)
+                except queue.Empty:
+                    with self._lock:
+                        in_flight = self._pending
+                    if not in_flight and self._ready.empty():
+                        self.logger.warning("No warm session in flight, creating one synchronously")
+                        return self.factory()
+        finally:
+            waited = time.perf_counter() - start
+            with self._lock:
+                self._stats["waits"] += 1
+                self._stats["total_wait"] += waited
+                self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+            self.logger.debug("Waited %.3fs for a warm WebDriver session", waited)
+
+    def _refill(self) -> None:
+        """
+        Start background creations until queued + in-flight sessions reach `size`.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            missing = self.size - self._ready.qsize() - self._pending
+            self._threads = [t for t in self._threads if t.is_alive()]
+            for _ in range(max(0, missing)):
+                self._pending += 1
+                thread = threading.Thread(target=self._boot_session, name="driver-prewarm", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def _boot_session(self) -> None:
+        """
+        Background thread body: create one session and queue it.
+        """
+        try:
+            drv = self.factory()
+        except Exception:
+            self.logger.exception("Failed to pre-warm WebDriver session")
+            with self._lock:
+                self._pending -= 1
+                self._stats["failed"] += 1
+            return
+
+        with self._lock:
+            self._pending -= 1
+            self._stats["created"] += 1
+            stopped = self._stopped
+            if not stopped:
+                self._ready.put(drv)
+
+        if stopped:
+            try:
+                drv.quit()
+            except WebDriverException:
+                self.logger.exception("Error quitting pre-warmed WebDriver")
+        else:
+            self.logger.debug("Pre-warmed WebDriver session id=%s", id(drv))
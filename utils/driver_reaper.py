@@ -0,0 +1,285 @@
+import atexit
+import queue
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+
+# Optional import: psutil lets the reaper see the browser processes spawned
+# by the driver. Without it only the driver process itself can be killed.
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_PROCESS_ERRORS = (OSError,) if psutil is None else (OSError, psutil.Error)
+
+
+class DriverReaper:
+    """
+    Background reaper that quits WebDriver sessions off the test's critical path.
+
+    Sessions handed to `submit()` are quit by a worker thread, so the next
+    test does not wait for `quit()`. In disposable mode, a session that has
+    not quit after `grace_period` seconds is killed together with its driver
+    and browser process tree.
+
+    Every process tree seen by the reaper is remembered; `close()` acts as a
+    watchdog and kills whatever is still alive at the end of the run, so no
+    orphaned driver or browser process outlives it.
+
+    Attributes:
+        disposable (bool): Kill the process tree if `quit()` exceeds the grace period.
+        grace_period (float): Seconds given to `quit()` before killing in disposable mode.
+    """
+
+    def __init__(self, disposable: bool = False, grace_period: float = 3.0):
+        """
+        Initialize the DriverReaper.
+
+        Args:
+            disposable (bool): Kill the process tree after the grace period. Defaults to False.
+            grace_period (float): Seconds to wait for `quit()` in disposable mode. Defaults to 3.0.
+        """
+        self.disposable = disposable
+        self.grace_period = float(grace_period)
+        self.logger = get_logger(self.__class__.__name__)
+        self._queue: "queue.Queue[Optional[Tuple[WebDriver, List[Any]]]]" = queue.Queue()
+        self._tracked: List[Any] = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="driver-reaper", daemon=True)
+        self._thread.start()
+        # Last line of defense if the run is interrupted before close()
+        atexit.register(self._kill_orphans)
+
+    def submit(self, drv: WebDriver) -> None:
+        """
+        Hand a session to the reaper and return immediately.
+
+        Args:
+            drv (WebDriver): Session to quit.
+        """
+        procs = session_process_tree(drv)
+        with self._lock:
+            self._tracked.extend(procs)
+        self._queue.put((drv, procs))
+        self.logger.debug("Queued WebDriver id=%s for teardown | processes=%d", id(drv), len(procs))
+
+    def close(self) -> None:
+        """
+        Finish pending teardowns, then kill any tracked process still alive.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        self._kill_orphans()
+        self.logger.info("Driver reaper closed")
+
+    def _kill_orphans(self) -> None:
+        """
+        Watchdog: kill every tracked driver/browser process that is still alive.
+        """
+        with self._lock:
+            tracked = list(self._tracked)
+            self._tracked = []
+        orphans = [proc for proc in tracked if is_alive(proc)]
+        for proc in orphans:
+            kill(proc)
+        if orphans:
+            self.logger.warning("Watchdog killed %d orphaned driver/browser process(es)", len(orphans))
+
+    def _run(self) -> None:
+        """
+        Worker thread body: quit sessions until the stop sentinel is received.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            drv, procs = item
+            if self.disposable:
+                self._dispose(drv, procs)
+            else:
+                _quit(drv, self.logger)
+
+    def _dispose(self, drv: WebDriver, procs: List[Any]) -> None:
+        """
+        Quit a session, killing its process tree if it exceeds the grace period.
+
+        Args:
+            drv (WebDriver): Session to quit.
+            procs (List[Any]): Driver and browser processes of the session.
+        """
+        quitter = threading.Thread(target=_quit, args=(drv, self.logger), daemon=True)
+        quitter.start()
+        quitter.join(self.grace_period)
+
+        alive = [proc for proc in procs if is_alive(proc)]
+        for proc in alive:
+            kill(proc)
+        if quitter.is_alive() or alive:
+            self.logger.warning(
+                "WebDriver id=%s did not quit within %.1fs, killed %d process(es)",
+                id(drv), self.grace_period, len(alive),
+            )
+
+
+def _quit(drv: WebDriver, logger) -> None:
+    """
+    Quit a session, logging instead of raising on failure.
+
+    Args:
+        drv (WebDriver): Session to quit.
+        logger (logging.Logger): Logger used to report the outcome.
+    """
+    try:
+        drv.quit()
+        logger.info("WebDriver quit successfully")
+    except WebDriverException:
+        logger.exception("Error quitting WebDriver")
+
+
+def session_process_tree(drv: WebDriver) -> List[Any]:
+    """
+    Collect the driver process of a session and, with psutil, its descendants.
+
+    Sessions opened against a shared driver service have no `service`
+    attribute: the driver process belongs to the service, so only the
+    browser recorded at creation (see `attach_browser_process()`) and its
+    descendants are collected; without one the list is empty.
+
+    Args:
+        drv (WebDriver): Session to inspect.
+
+    Returns:
+        List[Any]: `psutil.Process` objects, or the driver's `subprocess.Popen`.
+    """
+    service = getattr(drv, "service", None)
+    if service is not None:
+        return process_tree(getattr(service, "process", None))
+    browser = getattr(drv, "browser_process", None)
+    if browser is None:
+        return []
+    try:
+        return [browser] + browser.children(recursive=True)
+    except _PROCESS_ERRORS:
+        return [browser]
+
+
+def child_pids(process: Optional[subprocess.Popen]) -> Set[int]:
+    """
+    Return the PIDs of a driver process's direct children (needs psutil).
+
+    Args:
+        process (Optional[subprocess.Popen]): Driver process.
+
+    Returns:
+        Set[int]: Child PIDs; empty without psutil.
+    """
+    if process is None or psutil is None:
+        return set()
+    try:
+        return {child.pid for child in psutil.Process(process.pid).children()}
+    except psutil.Error:
+        return set()
+
+
+def attach_browser_process(drv: WebDriver, process: Optional[subprocess.Popen], known_children: Set[int]) -> None:
+    """
+    Record on a session opened against a shared service the browser process it runs in.
+
+    The browser is identified from the session capabilities ('moz:processID'
+    for Firefox, the DevTools port of '<vendor>:<browser>Options.debuggerAddress'
+    matched against the command line of the service's children for
+    Chromium browsers). Failing that, the only new direct child of the
+    service since `known_children` is taken; when several sessions were
+    opened at once this is ambiguous and nothing is recorded.
+
+    Args:
+        drv (WebDriver): New session (a `webdriver.Remote`).
+        process (Optional[subprocess.Popen]): Process of the shared driver service.
+        known_children (Set[int]): `child_pids(process)` before the session was opened.
+    """
+    if process is None or psutil is None:
+        return
+    capabilities = drv.capabilities or {}
+    try:
+        if capabilities.get("moz:processID"):
+            drv.browser_process = psutil.Process(int(capabilities["moz:processID"]))
+            return
+        children = psutil.Process(process.pid).children()
+        port = _debugger_port(capabilities)
+        if port:
+            flag = f"--remote-debugging-port={port}"
+            for child in children:
+                if flag in child.cmdline():
+                    drv.browser_process = child
+                    return
+        new = [child for child in children if child.pid not in known_children]
+        if len(new) == 1:
+            drv.browser_process = new[0]
+    except _PROCESS_ERRORS:
+        pass
+
+
+def _debugger_port(capabilities: Dict[str, Any]) -> Optional[str]:
+    """Return the DevTools port of a Chromium session ('goog:chromeOptions', 'ms:edgeOptions')."""
+    for key, value in capabilities.items():
+        if key.endswith("Options") and isinstance(value, dict) and value.get("debuggerAddress"):
+            return str(value["debuggerAddress"]).rpartition(":")[2]
+    return None
+
+
+def process_tree(process: Optional[subprocess.Popen]) -> List[Any]:
+    """
+    Collect a driver process and, with psutil, its descendants (browsers).
+
+    Args:
+        process (Optional[subprocess.Popen]): Driver process.
+
+    Returns:
+        List[Any]: `psutil.Process` objects, or the `subprocess.Popen` itself.
+    """
+    if process is None:
+        return []
+    if psutil is None:
+        return [process]
+    try:
+        root = psutil.Process(process.pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def is_alive(proc: Any) -> bool:
+    """
+    Check whether a tracked process is still running.
+
+    Args:
+        proc (Any): `psutil.Process` or `subprocess.Popen`.
+
+    Returns:
+        bool: True if the process is still running.
+    """
+    if isinstance(proc, subprocess.Popen):
+        return proc.poll() is None
+    try:
+        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+    except _PROCESS_ERRORS:
+        return False
+
+
+def kill(proc: Any) -> None:
+    """
+    Kill a tracked process, ignoring processes that already exited.
+
+    Args:
+        proc (Any): `psutil.Process` or `subprocess.Popen`.
+    """
+    try:
+        proc.kill()
+    except _PROCESS_ERRORS:
+        pass
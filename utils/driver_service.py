@@ -0,0 +1,166 @@
+import threading
+from typing import Callable, Dict
+
+from selenium import webdriver
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.driver_reaper import attach_browser_process, child_pids, is_alive, kill, process_tree
+from utils.logger import get_logger
+
+
+class DriverServiceManager:
+    """
+    Starts each driver binary (msedgedriver, chromedriver) once per worker
+    and opens many browser sessions against its HTTP endpoint.
+
+    Opening a session then costs only the new-session handshake instead of
+    spawning a driver process and waiting for its port. Before every new
+    session the service is health-checked (process alive and port
+    connectable); a dead service is restarted, and a session that fails
+    because the service died in the meantime is retried once.
+
+    Sessions created here are `webdriver.Remote` instances: `quit()` ends
+    the browser session but leaves the shared service running. Each
+    session carries its browser process (`browser_process`), so the
+    DriverReaper can still kill a session that hangs on quit. Services
+    are stopped by `close()` at the end of the run.
+    """
+
+    def __init__(self):
+        """
+        Initialize the DriverServiceManager with no running services.
+        """
+        self.logger = get_logger(self.__class__.__name__)
+        self._services: Dict[str, Service] = {}
+        self._lock = threading.Lock()
+
+    def new_session(
+        self,
+        key: str,
+        make_service: Callable[[], Service],
+        make_executor: Callable[[str], RemoteConnection],
+        options: ArgOptions,
+    ) -> WebDriver:
+        """
+        Open a browser session against the shared service for `key`.
+
+        Args:
+            key (str): Service identifier, e.g. the browser name.
+            make_service (Callable[[], Service]): Creates a new, not yet started service.
+            make_executor (Callable[[str], RemoteConnection]): Creates the command
+                executor for a service URL.
+            options (ArgOptions): Browser options for the session.
+
+        Returns:
+            WebDriver: A new session driven by the shared service, with its
+            browser process in `browser_process` when it could be identified.
+        """
+        service = self.get_service(key, make_service)
+        try:
+            return self._open(service, make_executor, options)
+        except Exception:
+            if self.is_healthy(service):
+                raise
+            self.logger.warning("Driver service '%s' died while opening a session, retrying", key)
+            service = self.restart(key, make_service)
+            return self._open(service, make_executor, options)
+
+    def get_service(self, key: str, make_service: Callable[[], Service]) -> Service:
+        """
+        Return the running service for `key`, starting or restarting it if needed.
+
+        Args:
+            key (str): Service identifier, e.g. the browser name.
+            make_service (Callable[[], Service]): Creates a new, not yet started service.
+
+        Returns:
+            Service: A running, connectable driver service.
+        """
+        with self._lock:
+            service = self._services.get(key)
+            if service is not None and self.is_healthy(service):
+                return service
+            if service is not None:
+                self.logger.warning("Driver service '%s' failed health check, restarting", key)
+                self._stop(key, service)
+            return self._start(key, make_service)
+
+    def restart(self, key: str, make_service: Callable[[], Service]) -> Service:
+        """
+        Stop the service for `key` (if any) and start a new one.
+
+        Args:
+            key (str): Service identifier, e.g. the browser name.
+            make_service (Callable[[], Service]): Creates a new, not yet started service.
+
+        Returns:
+            Service: The newly started service.
+        """
+        with self._lock:
+            service = self._services.get(key)
+            if service is not None:
+                self._stop(key, service)
+            return self._start(key, make_service)
+
+    @staticmethod
+    def is_healthy(service: Service) -> bool:
+        """
+        Check that the service process is alive and its port accepts connections.
+
+        Args:
+            service (Service): Service to check.
+
+        Returns:
+            bool: True if the service can accept new sessions.
+        """
+        process = getattr(service, "process", None)
+        return process is not None and process.poll() is None and service.is_connectable()
+
+    def close(self) -> None:
+        """
+        Stop every shared service and kill browsers left behind by them.
+        """
+        with self._lock:
+            for key, service in list(self._services.items()):
+                self._stop(key, service)
+
+    def _open(self, service: Service, make_executor: Callable[[str], RemoteConnection],
+              options: ArgOptions) -> WebDriver:
+        """
+        Open a session on a running service and record its browser process.
+        """
+        process = getattr(service, "process", None)
+        known_children = child_pids(process)
+        drv = webdriver.Remote(command_executor=make_executor(service.service_url), options=options)
+        attach_browser_process(drv, process, known_children)
+        if getattr(drv, "browser_process", None) is None:
+            self.logger.debug("Browser process of WebDriver id=%s not identified", id(drv))
+        return drv
+
+    def _start(self, key: str, make_service: Callable[[], Service]) -> Service:
+        """
+        Start a new service for `key`. Caller must hold the lock.
+        """
+        service = make_service()
+        service.start()
+        self._services[key] = service
+        self.logger.info("Started shared driver service '%s' at %s", key, service.service_url)
+        return service
+
+    def _stop(self, key: str, service: Service) -> None:
+        """
+        Stop the service for `key` and kill its leftover children. Caller must hold the lock.
+        """
+        procs = process_tree(getattr(service, "process", None))
+        try:
+            service.stop()
+        except Exception:
+            self.logger.exception("Error stopping driver service '%s'", key)
+        for proc in procs:
+            if is_alive(proc):
+                kill(proc)
+        self._services.pop(key, None)
+        self.logger.info("Stopped shared driver service '%s'", key)
@@ -0,0 +1,269 @@
+"""
+Duration-aware test scheduling for parallel (pytest-xdist) runs.
+
+Per-test durations (setup + call + teardown) are read from previous
+pytest-json-report files such as 'reports/result.json'. Tests with history
+are assigned to workers with the longest-processing-time-first (LPT) rule;
+tests without history are kept in a shared queue that idle workers drain,
+falling back to xdist's work stealing once it is empty.
+
+Usage:
+    pytest -n 4 --duration-schedule
+    pytest -n 4 --duration-schedule --duration-history "reports/history/*.json"
+
+Each xdist worker is a separate process with its own session-scoped driver
+pool, so the schedule runs with one driver per worker.
+"""
+import glob
+import heapq
+import json
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pytest
+
+from utils.logger import get_logger
+
+# Optional import: the scheduler itself only exists when pytest-xdist is installed
+try:
+    from xdist.scheduler import WorkStealingScheduling
+except ImportError:
+    WorkStealingScheduling = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HISTORY = ["reports/result.json", "reports/history/*.json"]
+PLUGIN_NAME = "duration_schedule"
+PHASES = ("setup", "call", "teardown")
+
+logger = get_logger("duration_scheduler")
+
+
+def load_durations(patterns: Iterable[str]) -> Dict[str, float]:
+    """
+    Read per-test durations from pytest-json-report files.
+
+    The duration of a test is the sum of its setup, call and teardown
+    phases; when a test appears in several reports the mean is used.
+
+    Args:
+        patterns (Iterable[str]): File paths or glob patterns, relative to the project root.
+
+    Returns:
+        Dict[str, float]: Mapping of test nodeid to expected duration in seconds.
+    """
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for pattern in patterns:
+        full_pattern = pattern if Path(pattern).is_absolute() else str(PROJECT_ROOT / pattern)
+        for path in sorted(glob.glob(full_pattern)):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    report = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                logger.warning("Skipping unreadable duration history: %s", path)
+                continue
+            for test in report.get("tests", []):
+                total = sum(test.get(phase, {}).get("duration", 0.0) for phase in PHASES)
+                samples[test["nodeid"]].append(total)
+
+    return {nodeid: statistics.mean(values) for nodeid, values in samples.items()}
+
+
+def lpt_plan(
+    nodeids: Sequence[str], durations: Dict[str, float], workers: int
+) -> Tuple[List[List[str]], List[float], List[str]]:
+    """
+    Assign tests with known durations to workers, longest first.
+
+    Each test goes to the worker with the smallest accumulated load.
+
+    Args:
+        nodeids (Sequence[str]): Collected test nodeids.
+        durations (Dict[str, float]): Known durations by nodeid.
+        workers (int): Number of workers.
+
+    Returns:
+        Tuple[List[List[str]], List[float], List[str]]: Per-worker nodeids
+        (in execution order), per-worker predicted load, and the nodeids
+        without history.
+    """
+    workers = max(1, workers)
+    known = sorted((n for n in nodeids if n in durations), key=lambda n: durations[n], reverse=True)
+    unknown = [n for n in nodeids if n not in durations]
+
+    plan: List[List[str]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    heap = [(0.0, index) for index in range(workers)]
+    for nodeid in known:
+        load, index = heapq.heappop(heap)
+        plan[index].append(nodeid)
+        loads[index] = load + durations[nodeid]
+        heapq.heappush(heap, (loads[index], index))
+    return plan, loads, unknown
+
+
+def predict_makespan(loads: Sequence[float], unknown: int, estimate: float) -> float:
+    """
+    Predict the makespan once tests without history are spread over the workers.
+
+    Tests without history are assumed to take `estimate` seconds each and
+    are handed to the least loaded worker, as the shared queue would do.
+
+    Args:
+        loads (Sequence[float]): Predicted per-worker load from the LPT plan.
+        unknown (int): Number of tests without history.
+        estimate (float): Assumed duration of a test without history.
+
+    Returns:
+        float: Predicted makespan in seconds.
+    """
+    heap = list(loads) or [0.0]
+    heapq.heapify(heap)
+    for _ in range(unknown):
+        heapq.heappush(heap, heapq.heappop(heap) + estimate)
+    return max(heap)
+
+
+class DurationSchedulePlugin:
+    """
+    Pytest plugin holding the duration history and reporting the makespan.
+
+    Attributes:
+        durations (Dict[str, float]): Known durations by nodeid.
+        predicted (Optional[float]): Predicted makespan in seconds, once scheduled.
+        busy (Dict[str, float]): Measured busy time per worker in seconds.
+    """
+
+    def __init__(self, durations: Dict[str, float]):
+        """
+        Initialize the plugin.
+
+        Args:
+            durations (Dict[str, float]): Known durations by nodeid.
+        """
+        self.durations = durations
+        self.predicted: Optional[float] = None
+        self.busy: Dict[str, float] = defaultdict(float)
+        self._start = time.perf_counter()
+
+    def record_prediction(self, loads: Sequence[float], unknown: int) -> None:
+        """
+        Store the predicted makespan for the end-of-run report.
+
+        Args:
+            loads (Sequence[float]): Predicted per-worker load from the LPT plan.
+            unknown (int): Number of tests without history.
+        """
+        estimate = statistics.median(self.durations.values()) if self.durations else 0.0
+        self.predicted = predict_makespan(loads, unknown, estimate)
+
+    def pytest_collection_finish(self, session):
+        # Without xdist the whole suite runs on a single worker
+        if session.config.pluginmanager.hasplugin("dsession"):
+            return
+        _, loads, unknown = lpt_plan([item.nodeid for item in session.items], self.durations, 1)
+        self.record_prediction(loads, len(unknown))
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self.busy[worker] += report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        actual = max(self.busy.values()) if self.busy else 0.0
+        wall = time.perf_counter() - self._start
+
+        terminalreporter.section("duration schedule")
+        if self.predicted is None:
+            terminalreporter.write_line("predicted makespan=n/a")
+        else:
+            terminalreporter.write_line(f"predicted makespan={self.predicted:.2f}s")
+        terminalreporter.write_line(f"actual makespan={actual:.2f}s (busiest worker) | wall clock={wall:.2f}s")
+        for worker, seconds in sorted(self.busy.items()):
+            terminalreporter.write_line(f"  {worker}: {seconds:.2f}s")
+
+
+if WorkStealingScheduling is not None:
+
+    class DurationScheduling(WorkStealingScheduling):
+        """
+        xdist scheduler that pre-assigns tests with history using LPT.
+
+        Tests without history stay in the global pending queue; xdist's
+        work-stealing logic hands them to idle workers and rebalances once
+        the queue runs dry.
+        """
+
+        def __init__(self, config: pytest.Config, log=None):
+            super().__init__(config, log)
+            self.plugin: DurationSchedulePlugin = config.pluginmanager.get_plugin(PLUGIN_NAME)
+
+        def schedule(self) -> None:
+            """
+            Send every worker its LPT share, then let work stealing handle the rest.
+            """
+            assert self.collection_is_completed
+            if self.collection is not None:
+                self.check_schedule()
+                return
+
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = next(iter(self.node2collection.values()))
+            if not self.collection:
+                return
+
+            nodes = self.nodes
+            plan, loads, unknown = lpt_plan(self.collection, self.plugin.durations, len(nodes))
+            index_of = {nodeid: index for index, nodeid in enumerate(self.collection)}
+            self.pending[:] = [index_of[nodeid] for nodeid in unknown]
+
+            for node, nodeids in zip(nodes, plan):
+                indices = [index_of[nodeid] for nodeid in nodeids]
+                if indices:
+                    self.node2pending[node].extend(indices)
+                    node.send_runtest_some(indices)
+
+            self.plugin.record_prediction(loads, len(unknown))
+            logger.info(
+                "LPT schedule | workers=%d known=%d unknown=%d loads=%s",
+                len(nodes), len(self.collection) - len(unknown), len(unknown),
+                ", ".join(f"{load:.1f}s" for load in loads),
+            )
+            self.check_schedule()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration-schedule")
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="Distribute tests over xdist workers by historical duration (LPT + work stealing).",
+    )
+    group.addoption(
+        "--duration-history",
+        action="append",
+        default=None,
+        help="pytest-json-report file or glob to read durations from (repeatable). "
+             f"Defaults to {', '.join(DEFAULT_HISTORY)}.",
+    )
+
+
+def pytest_configure(config):
+    # Scheduling and reporting happen on the controller only, not in xdist workers
+    if not config.getoption("duration_schedule") or hasattr(config, "workerinput"):
+        return
+    durations = load_durations(config.getoption("duration_history") or DEFAULT_HISTORY)
+    config.pluginmanager.register(DurationSchedulePlugin(durations), PLUGIN_NAME)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if WorkStealingScheduling is None or not config.pluginmanager.hasplugin(PLUGIN_NAME):
+        return None
+    return DurationScheduling(config, log)
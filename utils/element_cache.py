@@ -0,0 +1,145 @@
+from typing import Callable, Dict, Tuple, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+Locator = Tuple[str, str]
+T = TypeVar("T")
+
+
+class ElementCacheStats:
+    """
+    Hit / miss counters shared by every ElementCache of a worker.
+
+    Attributes:
+        hits (int): Lookups answered from the cache (one WebDriver lookup saved each).
+        misses (int): Lookups that had to resolve the element.
+        stale (int): Cached elements found stale and re-resolved.
+        invalidations (int): Whole-cache invalidations (navigation).
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.invalidations = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Return the current counters.
+
+        Returns:
+            Dict[str, int]: hits, misses, stale and invalidations.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "invalidations": self.invalidations,
+        }
+
+    @staticmethod
+    def delta(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, float]:
+        """
+        Return the counters accumulated between two snapshots, with the hit rate.
+
+        Args:
+            before (Dict[str, int]): Earlier snapshot.
+            after (Dict[str, int]): Later snapshot.
+
+        Returns:
+            Dict[str, float]: Counter differences plus 'hit_rate' (0..1).
+        """
+        diff = {key: after[key] - before[key] for key in after}
+        lookups = diff["hits"] + diff["misses"]
+        diff["hit_rate"] = diff["hits"] / lookups if lookups else 0.0
+        return diff
+
+
+# Counters for all caches of this process (reported per test by conftest.py)
+CACHE_STATS = ElementCacheStats()
+
+
+class ElementCache:
+    """
+    Per-page cache of located elements, keyed by locator.
+
+    Elements are resolved lazily on first use and reused afterwards. The
+    cache is not validated on lookup (that would cost the round trip it
+    saves): a cached element that went stale raises
+    StaleElementReferenceException when used, and `run()` then drops it,
+    re-resolves it once and retries the action. Page objects call
+    `invalidate()` whenever they navigate.
+
+    Only cache elements that live as long as the page (form fields, buttons);
+    elements that are re-rendered in place are cheaper to look up each time.
+    """
+
+    def __init__(self, stats: ElementCacheStats = CACHE_STATS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            stats (ElementCacheStats): Counters to update. Defaults to the process-wide counters.
+        """
+        self._elements: Dict[Locator, WebElement] = {}
+        self.stats = stats
+
+    def get(self, locator: Locator, resolve: Callable[[], WebElement]) -> WebElement:
+        """
+        Return the cached element for `locator`, resolving it on a miss.
+
+        Args:
+            locator (Locator): Cache key.
+            resolve (Callable[[], WebElement]): Locates the element (usually an explicit wait).
+
+        Returns:
+            WebElement: The cached or newly resolved element.
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            self.stats.hits += 1
+            return element
+        self.stats.misses += 1
+        element = resolve()
+        self._elements[locator] = element
+        return element
+
+    def run(
+        self, locator: Locator, resolve: Callable[[], WebElement], action: Callable[[WebElement], T]
+    ) -> T:
+        """
+        Apply `action` to the cached element, re-resolving it once if it went stale.
+
+        Args:
+            locator (Locator): Cache key.
+            resolve (Callable[[], WebElement]): Locates the element.
+            action (Callable[[WebElement], T]): Operation on the element.
+
+        Returns:
+            T: Whatever `action` returns.
+
+        Raises:
+            StaleElementReferenceException: If the freshly resolved element is stale too.
+        """
+        try:
+            return action(self.get(locator, resolve))
+        except StaleElementReferenceException:
+            self.stats.stale += 1
+            self.discard(locator)
+            return action(self.get(locator, resolve))
+
+    def discard(self, locator: Locator) -> None:
+        """
+        Drop a single cached element.
+
+        Args:
+            locator (Locator): Cache key.
+        """
+        self._elements.pop(locator, None)
+
+    def invalidate(self) -> None:
+        """Drop every cached element (call after navigating)."""
+        if self._elements:
+            self.stats.invalidations += 1
+        self._elements.clear()
@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.dom_scripts import DOM_HELPERS_JS
+
+Locator = Tuple[str, str]
+
+# Arguments: {name: [by, value]}, attribute names.
+# Returns {name: [state, ...]} for every element matched by each locator.
+_SNAPSHOT_SCRIPT = DOM_HELPERS_JS + """
+var locators = arguments[0], attributes = arguments[1], result = {};
+Object.keys(locators).forEach(function (name) {
+    result[name] = findAll(locators[name][0], locators[name][1]).map(function (el) {
+        var attrs = {};
+        attributes.forEach(function (attr) { attrs[attr] = el.getAttribute(attr); });
+        return {
+            element: el,
+            selected: !!(el.checked || el.selected),
+            enabled: !el.disabled,
+            displayed: isDisplayed(el),
+            text: (el.innerText || '').trim(),
+            attributes: attrs
+        };
+    });
+});
+return result;
+"""
+
+
+def element_states_many(
+    driver: WebDriver, locators: Dict[str, Locator], attributes: Sequence[str] = ()
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read the state of every element matched by a set of locators in one round trip.
+
+    Each element state is a dict with the keys:
+        element (WebElement): The element itself, for follow-up actions.
+        selected (bool): Checked checkbox/radio or selected option.
+        enabled (bool): Not disabled.
+        displayed (bool): Rendered and visible.
+        text (str): Visible text, stripped.
+        attributes (Dict[str, Optional[str]]): Values of the requested attributes.
+
+    Args:
+        driver (WebDriver): Selenium WebDriver instance.
+        locators (Dict[str, Locator]): Locators by name.
+        attributes (Sequence[str]): Attribute names to read on every element.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Element states by locator name, in document order.
+    """
+    payload = {name: [by, value] for name, (by, value) in locators.items()}
+    return driver.execute_script(_SNAPSHOT_SCRIPT, payload, list(attributes))
+
+
+def element_states(
+    driver: WebDriver, locator: Locator, attributes: Sequence[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Read the state of every element matched by one locator in one round trip.
+
+    See `element_states_many()` for the keys of each state.
+
+    Args:
+        driver (WebDriver): Selenium WebDriver instance.
+        locator (Locator): Element locator.
+        attributes (Sequence[str]): Attribute names to read on every element.
+
+    Returns:
+        List[Dict[str, Any]]: Element states in document order.
+    """
+    return element_states_many(driver, {"elements": locator}, attributes)["elements"]
@@ -0,0 +1,173 @@
+import base64
+import gzip
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.logger import get_logger
+from utils.screenshot_store import ScreenshotStore
+
+Locator = Tuple[str, str]
+
+
+class FailureArtifacts:
+    """
+    Captures the state of a failed test quickly and writes it in the background.
+
+    `capture()` runs on the test's teardown path and only issues the WebDriver
+    commands: the raw (base64) screenshot, page source, current URL and
+    window handles. Decoding, compression and disk writes are done by a
+    worker thread, so the session can go back to the pool (or to the
+    reaper) right away.
+
+    Per failure the worker writes, under `directory`:
+        <name>.png      screenshot (of the failing element only if requested)
+        <name>.html.gz  page source, gzip-compressed
+        <name>.json     URL, window handles, element locator, capture time
+                        and the screenshot's store entry
+    With a store, the screenshot becomes a ScreenshotStore entry and the
+    other two files go to the store's attachment directory, listed in that
+    entry, so the store's retention removes them with the screenshot.
+
+    Attributes:
+        directory (Path): Where artifacts are written.
+        page_source (bool): Also capture the page source.
+        element_region (bool): Screenshot only the element the test last waited
+            for, when it is on the page (full page otherwise).
+        store (Optional[ScreenshotStore]): Content-addressed store screenshots go to.
+    """
+
+    def __init__(self, directory: Path, page_source: bool = True, element_region: bool = False,
+                 store: Optional[ScreenshotStore] = None):
+        """
+        Initialize the capture pipeline and start its worker thread.
+
+        Args:
+            directory (Path): Where artifacts are written.
+            page_source (bool): Also capture the page source. Defaults to True.
+            element_region (bool): Screenshot only the failing element when
+                possible. Defaults to False.
+            store (Optional[ScreenshotStore]): Store deduplicating screenshots.
+                Defaults to None (plain <name>.png files).
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.page_source = page_source
+        self.element_region = element_region
+        self.store = store
+        self.logger = get_logger(self.__class__.__name__)
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="failure-artifacts", daemon=True)
+        self._thread.start()
+
+    def capture(self, drv: WebDriver, name: str, locator: Optional[Locator] = None,
+                test: str = "") -> Dict[str, str]:
+        """
+        Grab the failure state from the browser and queue it for writing.
+
+        Every command is attempted on its own: an open alert or a closed
+        window loses that piece only.
+
+        Args:
+            drv (WebDriver): Session of the failed test.
+            name (str): Base file name (without extension).
+            locator (Optional[Locator]): Element to screenshot when
+                `element_region` is on, e.g. the locator the test last waited for.
+            test (str): Test nodeid, groups screenshots in the store. Defaults to ''.
+
+        Returns:
+            Dict[str, str]: Paths of the files that will be written, by kind
+            ('screenshot', 'page_source', 'metadata'); with a store,
+            'screenshot' is the store index the entry is added to.
+        """
+        start = time.perf_counter()
+        state: Dict[str, Any] = {"name": name, "test": test, "locator": list(locator) if locator else None}
+        state["screenshot"], state["region"] = self._screenshot(drv, locator)
+        if self.page_source:
+            state["page_source"] = _attempt(lambda: drv.page_source)
+        state["url"] = _attempt(lambda: drv.current_url)
+        state["window_handles"] = _attempt(lambda: drv.window_handles)
+        state["captured_at"] = time.time()
+        state["capture_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self._queue.put(state)
+        self.logger.debug("Captured failure state '%s' in %.1fms", name, state["capture_ms"])
+
+        paths = {"metadata": self._sidecar_dir() / f"{name}.json"}
+        if state["screenshot"] is not None:
+            paths["screenshot"] = self.store.index_path if self.store else self.directory / f"{name}.png"
+        if state.get("page_source") is not None:
+            paths["page_source"] = self._sidecar_dir() / f"{name}.html.gz"
+        return {kind: str(path) for kind, path in paths.items()}
+
+    def close(self) -> None:
+        """Write every queued capture, then stop the worker thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self.logger.info("Failure artifact writer closed")
+
+    def _screenshot(self, drv: WebDriver, locator: Optional[Locator]) -> Tuple[Optional[str], str]:
+        """
+        Return the base64 PNG of the failing element (if requested and found) or of the page.
+
+        Returns:
+            Tuple[Optional[str], str]: Base64 data (None if it failed) and 'element' or 'page'.
+        """
+        if self.element_region and locator is not None:
+            elements = _attempt(lambda: drv.find_elements(*locator)) or []
+            if elements:
+                data = _attempt(lambda: elements[0].screenshot_as_base64)
+                if data is not None:
+                    return data, "element"
+        return _attempt(drv.get_screenshot_as_base64), "page"
+
+    def _sidecar_dir(self) -> Path:
+        """Directory of the page source and metadata files (the store's attachments with a store)."""
+        return self.store.attachment_dir if self.store is not None else self.directory
+
+    def _run(self) -> None:
+        """Worker thread body: write captures until the stop sentinel is received."""
+        while True:
+            state = self._queue.get()
+            if state is None:
+                return
+            try:
+                self._write(state)
+            except Exception:
+                # One bad capture (undecodable screenshot, full disk) must not stop the writer
+                self.logger.exception("Could not write failure artifacts for '%s'", state["name"])
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        """Decode, compress and write one capture."""
+        name = state["name"]
+        sidecar_dir = self._sidecar_dir()
+        sidecar_dir.mkdir(parents=True, exist_ok=True)
+        metadata_path = sidecar_dir / f"{name}.json"
+        files = [metadata_path]
+        page_source = state.pop("page_source", None)
+        if page_source is not None:
+            files.append(sidecar_dir / f"{name}.html.gz")
+            files[-1].write_bytes(gzip.compress(page_source.encode("utf-8"), 6))
+
+        screenshot = state.pop("screenshot")
+        if screenshot is not None and self.store is not None:
+            entry = self.store.put(base64.b64decode(screenshot), name, test=state["test"],
+                                   created=state["captured_at"], files=files, region=state["region"])
+            state["screenshot"] = {key: entry[key] for key in ("sha256", "group", "duplicate")}
+        elif screenshot is not None:
+            (self.directory / f"{name}.png").write_bytes(base64.b64decode(screenshot))
+        metadata_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        self.logger.debug("Failure artifacts written: %s.*", sidecar_dir / name)
+
+
+def _attempt(command) -> Any:
+    """Run a WebDriver command, returning None instead of raising."""
+    try:
+        return command()
+    except WebDriverException:
+        return None
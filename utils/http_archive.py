@@ -0,0 +1,671 @@
+"""
+Record-and-replay HTTP cache for the site under test.
+
+The proxy stands in for `base_url`: the browser talks plain HTTP to
+127.0.0.1, and the proxy forwards each request upstream (record) or answers
+it from the archive (replay). Absolute URLs of the upstream site and of the
+configured third-party hosts (e.g. the TinyMCE CDN used by the iframe page)
+are rewritten in HTML/JS/CSS responses to go through the proxy as
+`/__ext__/<scheme>/<host>/<path>`, so those assets are captured too.
+
+Archive layout (content-addressed, deduplicated):
+    <directory>/index.json                 request key -> response metadata + body hash
+    <directory>/blobs/<aa>/<sha256>        response bodies, stored once per content
+
+Stateful pages (the same GET answered differently after a failed login or
+a logout) are told apart by the session cookies listed in 'state_cookies'
+(default: rack.session): their values are hashed into the key. Replay
+serves the recorded Set-Cookie headers, so the browser sends the same
+values back and each state finds its own entry. A request recorded only
+in another state falls back to the latest recording of its URL: a
+'state=*' alias entry pointing at that recording's key (no second copy).
+
+Every replay hit stamps the entry's 'last_used' time; entries not served by
+the latest replay run can be listed and pruned:
+
+    python -m utils.http_archive stats
+    python -m utils.http_archive prune --unused       # not used by the last replay
+    python -m utils.http_archive prune --days 30      # not used for 30 days
+
+Usage from pytest: `pytest --http-archive record|replay` (or the
+'http_archive' section of config.json). In a parallel run only the
+controller runs the proxy; workers find it through PROXY_URL_ENV.
+"""
+import argparse
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.config_loader import CONFIG
+from utils.logger import get_logger
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIRECTORY = PROJECT_ROOT / "http_archive"
+
+RECORD_MODE = "record"
+REPLAY_MODE = "replay"
+
+EXTERNAL_PREFIX = "/__ext__/"
+
+# Set by the controller of a parallel run so workers share its proxy
+PROXY_URL_ENV = "HTTP_ARCHIVE_PROXY_URL"
+DEFAULT_STATE_COOKIES = ("rack.session",)
+# State of the entry holding the latest recording of a request in any state
+ANY_STATE = "*"
+
+# Headers that describe the connection or the encoding, not the resource
+_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+    "transfer-encoding", "upgrade", "content-length", "content-encoding", "strict-transport-security",
+}
+# Conditional request headers: always fetch full responses so a 304 never replaces a recording
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range"}
+_REWRITE_TYPES = ("text/html", "text/css", "javascript", "json")
+_BOUNDARY = re.compile(rb"boundary=([^\s;]+)")
+_LOCK_TIMEOUT = 10.0
+
+logger = get_logger("http_archive")
+
+
+class HttpArchive:
+    """
+    On-disk, content-addressed store of recorded HTTP responses.
+
+    Attributes:
+        directory (Path): Archive root.
+        entries (Dict[str, dict]): Request key -> {method, url, status,
+            headers, sha256, size, recorded, last_used}, or for an alias
+            {alias: <key of the aliased entry>, recorded, last_used}.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_DIRECTORY):
+        """
+        Open (or create) an archive and load its index.
+
+        Args:
+            directory (Path): Archive root. Defaults to <project>/http_archive.
+        """
+        self.directory = Path(directory)
+        self.blob_dir = self.directory / "blobs"
+        self.index_path = self.directory / "index.json"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.entries: Dict[str, dict] = {}
+        self.meta: Dict[str, float] = {}
+        self._blobs: Dict[str, bytes] = {}
+        self._dirty: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    # ----------------------------
+    # Keys and blobs
+    # ----------------------------
+    @staticmethod
+    def key(method: str, url: str, body: bytes = b"", content_type: str = "", state: str = "") -> str:
+        """
+        Return the archive key of a request.
+
+        The multipart boundary is normalised so repeated uploads of the
+        same file map to the same entry.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Absolute upstream URL.
+            body (bytes): Request body.
+            content_type (str): Request Content-Type.
+            state (str): Session state of the request, see `state_of()`. Defaults to ''.
+
+        Returns:
+            str: 'METHOD URL' plus a body hash for requests with a body and
+            the state for requests made in a session.
+        """
+        key = f"{method} {url}"
+        if body:
+            match = _BOUNDARY.search(content_type.encode("latin-1"))
+            if match:
+                body = body.replace(match.group(1).strip(b'"'), b"BOUNDARY")
+            key += f" {hashlib.sha256(body).hexdigest()[:16]}"
+        if state:
+            key += f" state={state}"
+        return key
+
+    @staticmethod
+    def state_of(cookie_header: str, names: Iterable[str] = DEFAULT_STATE_COOKIES) -> str:
+        """
+        Return a short hash of the session cookies of a request ('' without any).
+
+        Args:
+            cookie_header (str): Request Cookie header.
+            names (Iterable[str]): Cookies holding server-side state.
+
+        Returns:
+            str: 12 hex digits, or '' when none of the cookies is sent.
+        """
+        wanted = set(names)
+        pairs = sorted(
+            part.strip() for part in cookie_header.split(";")
+            if part.strip().partition("=")[0] in wanted
+        )
+        return hashlib.sha256("; ".join(pairs).encode("utf-8")).hexdigest()[:12] if pairs else ""
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def put_blob(self, body: bytes) -> str:
+        """
+        Store a body once and return its SHA-256.
+
+        Args:
+            body (bytes): Response body.
+
+        Returns:
+            str: Hex digest (the blob's name).
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        self._blobs[digest] = body
+        return digest
+
+    def get_blob(self, digest: str) -> bytes:
+        """Return a body by digest (served from memory after the first read)."""
+        body = self._blobs.get(digest)
+        if body is None:
+            body = self._blob_path(digest).read_bytes()
+            self._blobs[digest] = body
+        return body
+
+    def preload(self) -> None:
+        """Read every referenced body into memory (replay mode)."""
+        for entry in self.entries.values():
+            if "alias" in entry:
+                continue
+            try:
+                self.get_blob(entry["sha256"])
+            except OSError:
+                logger.warning("Missing blob %s for %s %s", entry["sha256"], entry["method"], entry["url"])
+
+    # ----------------------------
+    # Entries
+    # ----------------------------
+    def record(self, key: str, method: str, url: str, status: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        """Store a response under `key` (replaces an earlier recording)."""
+        entry = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "sha256": self.put_blob(body),
+            "size": len(body),
+            "recorded": time.time(),
+            "last_used": None,
+        }
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty[key] = entry
+
+    def alias(self, key: str, target: str) -> None:
+        """Make `key` resolve to the entry recorded under `target` (replaces an earlier one)."""
+        entry = {"alias": target, "recorded": time.time(), "last_used": None}
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty[key] = entry
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """
+        Return the entry for `key` and stamp it as used, or None on a miss.
+
+        An alias resolves to the entry it points at, and that entry is the
+        one stamped.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and "alias" in entry:
+                key = entry["alias"]
+                entry = self.entries.get(key)
+            if entry is not None:
+                entry["last_used"] = time.time()
+                self._dirty[key] = entry
+            return entry
+
+    def begin_replay(self) -> None:
+        """Mark the start of a replay run (entries not used after it are 'unused')."""
+        self.meta["last_replay"] = time.time()
+        self._dirty.setdefault("__meta__", {})
+
+    def unused(self) -> List[str]:
+        """
+        Return the keys not served since the start of the last replay run.
+
+        Aliases are never listed: `prune()` drops them with the entry they point at.
+        """
+        since = self.meta.get("last_replay")
+        if since is None:
+            return []
+        return [
+            key for key, entry in self.entries.items()
+            if "alias" not in entry and (entry.get("last_used") or 0) < since
+        ]
+
+    def prune(self, keys: Iterable[str]) -> Tuple[int, int]:
+        """
+        Remove entries, the aliases pointing at them and every blob no
+        remaining entry references.
+
+        Args:
+            keys (Iterable[str]): Entries to remove.
+
+        Returns:
+            Tuple[int, int]: Removed entries (aliases included) and removed blobs.
+        """
+        with _IndexLock(self.index_path):
+            self._merge_from_disk()
+            removed = 0
+            for key in list(keys):
+                if self.entries.pop(key, None) is not None:
+                    removed += 1
+            for key, entry in list(self.entries.items()):
+                if "alias" in entry and entry["alias"] not in self.entries:
+                    del self.entries[key]
+                    removed += 1
+            self._write_index()
+        referenced = {entry["sha256"] for entry in self.entries.values() if "alias" not in entry}
+        blobs = 0
+        for path in self.blob_dir.glob("*/*"):
+            if path.name not in referenced:
+                path.unlink()
+                blobs += 1
+        self._dirty.clear()
+        return removed, blobs
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry / blob counts and the bytes saved by deduplication."""
+        logical = sum(entry.get("size", 0) for entry in self.entries.values())
+        stored = sum(path.stat().st_size for path in self.blob_dir.glob("*/*"))
+        return {
+            "entries": sum(1 for entry in self.entries.values() if "alias" not in entry),
+            "aliases": sum(1 for entry in self.entries.values() if "alias" in entry),
+            "blobs": sum(1 for _ in self.blob_dir.glob("*/*")),
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+            "deduplicated_bytes": max(logical - stored, 0),
+            "unused_in_last_replay": len(self.unused()),
+        }
+
+    # ----------------------------
+    # Persistence
+    # ----------------------------
+    def save(self) -> None:
+        """
+        Merge this process' changes into index.json.
+
+        The index is re-read under a lock file first, so several pytest-xdist
+        workers recording or replaying at once do not lose each other's entries.
+        """
+        if not self._dirty:
+            return
+        with _IndexLock(self.index_path):
+            dirty, meta = dict(self._dirty), dict(self.meta)
+            dirty.pop("__meta__", None)
+            self._merge_from_disk()
+            for key, entry in dirty.items():
+                current = self.entries.get(key)
+                if current is not None and current["recorded"] > entry["recorded"]:
+                    continue
+                if current is not None and entry["last_used"] is None:
+                    entry["last_used"] = current.get("last_used")
+                self.entries[key] = entry
+            self.meta.update(meta)
+            self._write_index()
+        self._dirty.clear()
+
+    def _load(self) -> None:
+        if self.index_path.exists():
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            self.entries = data.get("entries", {})
+            self.meta = data.get("meta", {})
+
+    def _merge_from_disk(self) -> None:
+        if not self.index_path.exists():
+            return
+        data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        on_disk = data.get("entries", {})
+        for key, entry in on_disk.items():
+            mine = self.entries.get(key)
+            if mine is None or key not in self._dirty:
+                self.entries[key] = entry
+        for key in set(self.entries) - set(on_disk) - set(self._dirty):
+            # Pruned by another process
+            del self.entries[key]
+        self.meta = {**data.get("meta", {}), **self.meta}
+
+    def _write_index(self) -> None:
+        tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"meta": self.meta, "entries": self.entries}, indent=1), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+
+class _IndexLock:
+    """Cross-platform exclusive lock file guarding index.json."""
+
+    def __init__(self, index_path: Path):
+        self.path = index_path.with_suffix(".lock")
+
+    def __enter__(self) -> "_IndexLock":
+        deadline = time.monotonic() + _LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    # Stale lock left by a killed process
+                    logger.warning("Breaking stale archive lock %s", self.path)
+                    self.path.unlink(missing_ok=True)
+                time.sleep(0.05)
+
+    def __exit__(self, *exc) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class RecordReplayProxy:
+    """
+    Local HTTP server standing in for `upstream`, recording or replaying responses.
+
+    Attributes:
+        upstream (str): Origin of the site under test (scheme://host[:port]).
+        archive (HttpArchive): Response store.
+        mode (str): 'record' or 'replay'.
+        external_hosts (List[str]): Third-party hosts routed through the proxy.
+        url (str): Base URL of the proxy once started.
+        stats (Dict[str, int]): forwarded / hits / misses counters.
+    """
+
+    def __init__(self, upstream: str, archive: HttpArchive, mode: str,
+                 external_hosts: Iterable[str] = (), host: str = "127.0.0.1", port: int = 0,
+                 state_cookies: Iterable[str] = DEFAULT_STATE_COOKIES):
+        """
+        Initialize the proxy (not started yet).
+
+        Args:
+            upstream (str): Base URL of the site under test.
+            archive (HttpArchive): Response store.
+            mode (str): 'record' or 'replay'.
+            external_hosts (Iterable[str]): Third-party hosts to capture.
+            host (str): Interface to bind. Defaults to 127.0.0.1.
+            port (int): Port to bind; 0 picks a free one. Defaults to 0.
+            state_cookies (Iterable[str]): Cookies whose values key stateful
+                responses. Defaults to ('rack.session',).
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in (RECORD_MODE, REPLAY_MODE):
+            raise ValueError(f"Unknown http archive mode '{mode}', expected '{RECORD_MODE}' or '{REPLAY_MODE}'")
+        parts = urlsplit(upstream)
+        self.upstream = f"{parts.scheme}://{parts.netloc}"
+        self.archive = archive
+        self.mode = mode
+        self.external_hosts = [h for h in external_hosts if h != parts.netloc]
+        self.host = host
+        self.port = port
+        self.state_cookies = tuple(state_cookies)
+        self.url = ""
+        self.stats = {"forwarded": 0, "hits": 0, "misses": 0}
+        self.logger = get_logger(self.__class__.__name__)
+        hosts = sorted([parts.netloc, *self.external_hosts], key=len, reverse=True)
+        self._absolute = re.compile(
+            r"(https?:)?//(" + "|".join(re.escape(h) for h in hosts) + r")(?![\w.-])"
+        )
+        self._rewritten: Dict[str, bytes] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """
+        Start serving in a daemon thread.
+
+        Returns:
+            str: Base URL of the proxy, to be used as base_url.
+        """
+        if self.mode == REPLAY_MODE:
+            self.archive.begin_replay()
+            self.archive.preload()
+
+        class Handler(_ProxyHandler):
+            pass
+
+        Handler.proxy = self
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        host, port = self._server.server_address[:2]
+        self.url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="http-archive", daemon=True)
+        self._thread.start()
+        self.logger.info("HTTP archive %s proxy for %s at %s", self.mode, self.upstream, self.url)
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the proxy and save the archive index."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join(timeout=5)
+            self._server = self._thread = None
+        self.archive.save()
+        self.logger.info("HTTP archive proxy stopped | %s", self.stats)
+
+    # ----------------------------
+    # URL mapping and rewriting
+    # ----------------------------
+    def upstream_url(self, path: str) -> str:
+        """Map a proxy path to the absolute upstream URL."""
+        if path.startswith(EXTERNAL_PREFIX):
+            scheme, _, rest = path[len(EXTERNAL_PREFIX):].partition("/")
+            return f"{scheme}://{rest}"
+        return self.upstream + path
+
+    def rewrite(self, text: str) -> str:
+        """Point absolute upstream / third-party URLs at the proxy."""
+        upstream_host = urlsplit(self.upstream).netloc
+        upstream_scheme = urlsplit(self.upstream).scheme
+
+        def replace(match: re.Match) -> str:
+            scheme = (match.group(1) or f"{upstream_scheme}:").rstrip(":")
+            host = match.group(2)
+            if host == upstream_host:
+                return self.url
+            return f"{self.url}{EXTERNAL_PREFIX}{scheme}/{host}"
+
+        return self._absolute.sub(replace, text)
+
+    def response_body(self, entry: dict) -> bytes:
+        """Return an entry's body with URLs rewritten (cached per blob)."""
+        digest = entry["sha256"]
+        body = self._rewritten.get(digest)
+        if body is None:
+            body = self.archive.get_blob(digest)
+            content_type = dict((k.lower(), v) for k, v in entry["headers"]).get("content-type", "")
+            if any(kind in content_type for kind in _REWRITE_TYPES):
+                body = self.rewrite(body.decode("utf-8", "surrogateescape")).encode("utf-8", "surrogateescape")
+            self._rewritten[digest] = body
+        return body
+
+    def response_headers(self, entry: dict) -> List[Tuple[str, str]]:
+        """Return an entry's headers adapted to the proxy origin."""
+        headers = []
+        for name, value in entry["headers"]:
+            lower = name.lower()
+            if lower == "location":
+                value = self.rewrite(value)
+            elif lower == "set-cookie":
+                # The proxy is plain HTTP on 127.0.0.1
+                value = re.sub(r";\s*(domain=[^;]*|secure)(?=;|$)", "", value, flags=re.IGNORECASE)
+            headers.append((name, value))
+        return headers
+
+    # ----------------------------
+    # Upstream
+    # ----------------------------
+    def fetch(self, method: str, url: str, headers: Dict[str, str], body: bytes) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """
+        Forward a request upstream without following redirects.
+
+        Returns:
+            Tuple[int, List[Tuple[str, str]], bytes]: Status, headers (hop-by-hop
+            removed) and the decoded body.
+        """
+        parts = urlsplit(url)
+        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(parts.netloc, timeout=30)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS | _CONDITIONAL_HEADERS | {"host", "accept-encoding"}}
+        headers["Host"] = parts.netloc
+        headers["Accept-Encoding"] = "identity"
+        if "Referer" in headers:
+            headers["Referer"] = headers["Referer"].replace(self.url, self.upstream)
+        try:
+            conn.request(method, path, body=body or None, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            encoding = (response.getheader("Content-Encoding") or "").lower()
+            if encoding == "gzip":
+                data = gzip.decompress(data)
+            elif encoding == "deflate":
+                data = zlib.decompress(data)
+            kept = [(k, v) for k, v in response.getheaders() if k.lower() not in _HOP_HEADERS]
+            return response.status, kept, data
+        finally:
+            conn.close()
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Request handler of RecordReplayProxy (`proxy` is set on a per-server subclass)."""
+
+    proxy: RecordReplayProxy
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self) -> None:
+        proxy = self.proxy
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+        url = proxy.upstream_url(self.path)
+        content_type = self.headers.get("Content-Type", "")
+        state = HttpArchive.state_of(self.headers.get("Cookie", ""), proxy.state_cookies)
+        key = HttpArchive.key(self.command, url, body, content_type, state)
+        # Alias of the latest recording of the request whatever the session state (replay fallback)
+        latest = HttpArchive.key(self.command, url, body, content_type, ANY_STATE)
+
+        if proxy.mode == REPLAY_MODE:
+            entry = proxy.archive.lookup(key)
+            if entry is None:
+                entry = proxy.archive.lookup(latest)
+            if entry is None:
+                proxy.stats["misses"] += 1
+                proxy.logger.warning("Not in archive: %s", key)
+                self._send(504, [("Content-Type", "text/plain")], f"Not recorded: {key}".encode("utf-8"))
+                return
+            proxy.stats["hits"] += 1
+        else:
+            try:
+                status, headers, data = proxy.fetch(self.command, url, dict(self.headers.items()), body)
+            except (OSError, http.client.HTTPException) as exc:
+                proxy.logger.error("Upstream request failed: %s (%s)", key, exc)
+                self._send(502, [("Content-Type", "text/plain")], f"Upstream error: {exc}".encode("utf-8"))
+                return
+            proxy.stats["forwarded"] += 1
+            proxy.archive.record(key, self.command, url, status, headers, data)
+            proxy.archive.alias(latest, key)
+            entry = proxy.archive.entries[key]
+
+        self._send(entry["status"], proxy.response_headers(entry), proxy.response_body(entry))
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = _handle
+
+    def _send(self, status: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        self.proxy.logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def proxy_from_config(mode: Optional[str] = None) -> Optional[RecordReplayProxy]:
+    """
+    Build a proxy for `base_url` from the 'http_archive' section of config.json.
+
+    Settings:
+        mode (str): 'off', 'record' or 'replay'. Defaults to 'off'.
+        directory (str): Archive directory, relative to the project root. Defaults to 'http_archive'.
+        external_hosts (List[str]): Third-party hosts to capture as well.
+        state_cookies (List[str]): Cookies keying stateful responses. Defaults to ['rack.session'].
+
+    Args:
+        mode (Optional[str]): Overrides the configured mode.
+
+    Returns:
+        Optional[RecordReplayProxy]: Proxy (not started), or None when off.
+    """
+    settings = CONFIG.get("http_archive", {})
+    mode = str(mode or settings.get("mode", "off")).lower()
+    if mode == "off":
+        return None
+    archive = HttpArchive(PROJECT_ROOT / settings.get("directory", "http_archive"))
+    return RecordReplayProxy(
+        CONFIG["base_url"], archive, mode, settings.get("external_hosts", []),
+        state_cookies=settings.get("state_cookies", DEFAULT_STATE_COOKIES),
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    settings = CONFIG.get("http_archive", {})
+    parser = argparse.ArgumentParser(description="Inspect or prune the HTTP record/replay archive")
+    parser.add_argument("--directory", default=str(PROJECT_ROOT / settings.get("directory", "http_archive")))
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show archive size, deduplication and unused entries")
+    prune = sub.add_parser("prune", help="Remove unused entries and orphaned blobs")
+    prune.add_argument("--unused", action="store_true", help="Entries not served by the last replay run")
+    prune.add_argument("--days", type=float, help="Entries not used (or recorded) for this many days")
+    args = parser.parse_args(argv)
+
+    archive = HttpArchive(Path(args.directory))
+    if args.command == "stats":
+        for name, value in archive.stats().items():
+            print(f"{name:<24}{value}")
+        return 0
+
+    keys = set(archive.unused()) if args.unused else set()
+    if args.days is not None:
+        cutoff = time.time() - args.days * 86400
+        keys |= {
+            key for key, entry in archive.entries.items()
+            if "alias" not in entry and (entry.get("last_used") or entry["recorded"]) < cutoff
+        }
+    if not args.unused and args.days is None:
+        parser.error("prune needs --unused and/or --days")
+    entries, blobs = archive.prune(keys)
+    print(f"Removed {entries} entries and {blobs} blobs")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
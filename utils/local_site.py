@@ -0,0 +1,256 @@
+"""
+Offline stand-in for the pages of the-internet.herokuapp.com used by the page objects.
+
+The HTML lives in local_site/ at the project root and reproduces the
+elements our locators rely on (ids, classes, button texts, alert texts,
+flash messages). Every response can be delayed per endpoint to imitate
+the live site.
+
+Usage:
+    pytest --local-site                    # run the suite against it
+    python -m utils.local_site [--port N]  # serve it for manual checks
+
+Latency comes from the 'local_site' section of config.json:
+    "local_site": {"latency": {"default": 0, "/dynamic_controls/action": 0.5}}
+Values are seconds; 'default' applies to paths without their own entry.
+"""
+import argparse
+import html
+import re
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from utils.config_loader import CONFIG
+from utils.logger import get_logger
+
+SITE_DIR = Path(__file__).resolve().parent.parent / "local_site"
+
+# Credentials accepted by /authenticate (same as the live site)
+USERNAME = "tomsmith"
+PASSWORD = "SuperSecretPassword!"
+
+# GET path -> (template file, wrapped in layout.html)
+PAGES: Dict[str, Tuple[str, bool]] = {
+    "/": ("index.html", True),
+    "/login": ("login.html", True),
+    "/secure": ("secure.html", True),
+    "/inputs": ("inputs.html", True),
+    "/checkboxes": ("checkboxes.html", True),
+    "/dropdown": ("dropdown.html", True),
+    "/upload": ("upload.html", True),
+    "/javascript_alerts": ("javascript_alerts.html", True),
+    "/frames": ("frames.html", True),
+    "/iframe": ("iframe.html", True),
+    "/tinymce_body": ("tinymce_body.html", False),
+    "/dynamic_controls": ("dynamic_controls.html", True),
+    "/windows": ("windows.html", True),
+    "/windows/new": ("windows_new.html", True),
+    "/drag_and_drop": ("drag_and_drop.html", True),
+}
+
+_FLASH_HTML = '<div id="flash" class="flash {kind}">{message}<a href="#" class="close">&times;</a></div>'
+_FILENAME = re.compile(rb'Content-Disposition:[^\r\n]*filename="([^"]*)"', re.IGNORECASE)
+
+
+class LocalSite:
+    """
+    Threaded HTTP server serving the local stand-in site.
+
+    Attributes:
+        latency (Dict[str, float]): Delay (s) per path; 'default' for the rest.
+        url (str): Base URL once started (e.g. http://127.0.0.1:54321).
+    """
+
+    def __init__(self, latency: Optional[Dict[str, float]] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (not started yet).
+
+        Args:
+            latency (Optional[Dict[str, float]]): Delay (s) per path. Defaults to
+                the 'local_site.latency' setting in config.json.
+            host (str): Interface to bind. Defaults to 127.0.0.1.
+            port (int): Port to bind; 0 picks a free one. Defaults to 0.
+        """
+        if latency is None:
+            latency = CONFIG.get("local_site", {}).get("latency", {})
+        self.latency = {path: float(seconds) for path, seconds in latency.items()}
+        self.host = host
+        self.port = port
+        self.url = ""
+        self.logger = get_logger(self.__class__.__name__)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """
+        Start serving in a daemon thread.
+
+        Returns:
+            str: Base URL of the running site.
+        """
+        site = self
+
+        class Handler(_SiteHandler):
+            pass
+
+        Handler.site = site
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        host, port = self._server.server_address[:2]
+        self.url = f"http://{host}:{port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-site", daemon=True)
+        self._thread.start()
+        self.logger.info("Local site serving %s at %s", SITE_DIR, self.url)
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+        self._server = self._thread = None
+        self.logger.info("Local site stopped")
+
+    def delay_for(self, path: str) -> float:
+        """
+        Return the configured latency of a path.
+
+        Args:
+            path (str): Request path without query string.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        return self.latency.get(path, self.latency.get("default", 0.0))
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """Request handler of LocalSite (`site` is set on a per-server subclass)."""
+
+    site: LocalSite
+    protocol_version = "HTTP/1.1"
+
+    # ----------------------------
+    # HTTP methods
+    # ----------------------------
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path.rstrip("/") or "/"
+        self._delay(path)
+
+        if path == "/dynamic_controls/action":
+            self._send(200, b'{"ok": true}', "application/json")
+        elif path == "/logout":
+            self._redirect("/login", ("success", "You logged out of the secure area!"))
+        elif path == "/secure" and self._cookie("session") != USERNAME:
+            self._redirect("/login", ("error", "You must login to view the secure area!"))
+        elif path in PAGES:
+            self._render(*PAGES[path])
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        self._delay(path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+
+        if path == "/authenticate":
+            form = {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()}
+            if form.get("username") != USERNAME:
+                self._redirect("/login", ("error", "Your username is invalid!"))
+            elif form.get("password") != PASSWORD:
+                self._redirect("/login", ("error", "Your password is invalid!"))
+            else:
+                self._redirect("/secure", ("success", "You logged into a secure area!"), session=USERNAME)
+        elif path == "/upload":
+            match = _FILENAME.search(body)
+            filename = match.group(1).decode("utf-8", "replace") if match else ""
+            self._render("uploaded.html", True, filename=html.escape(filename))
+        else:
+            self._send(404, b"Not Found", "text/plain")
+
+    def log_message(self, format: str, *args) -> None:
+        self.site.logger.debug("%s - %s", self.address_string(), format % args)
+
+    # ----------------------------
+    # Helpers
+    # ----------------------------
+    def _delay(self, path: str) -> None:
+        """Sleep for the configured latency of `path`."""
+        seconds = self.site.delay_for(path)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _render(self, template: str, wrapped: bool, **values: str) -> None:
+        """Render a template from SITE_DIR (flash message taken from the cookie)."""
+        flash = self._cookie("flash")
+        if flash:
+            kind, _, message = unquote(flash).partition(":")
+            values.setdefault("flash", _FLASH_HTML.format(kind=kind, message=html.escape(message)))
+        values.setdefault("flash", "")
+
+        content = Template((SITE_DIR / template).read_text(encoding="utf-8")).safe_substitute(values)
+        if wrapped:
+            layout = (SITE_DIR / "layout.html").read_text(encoding="utf-8")
+            content = Template(layout).safe_substitute(content=content)
+        # The flash message is shown once
+        self._send(200, content.encode("utf-8"), "text/html; charset=utf-8",
+                   cookies={"flash": ""} if flash else None)
+
+    def _redirect(self, location: str, flash: Tuple[str, str], session: Optional[str] = None) -> None:
+        """Answer with a 303 redirect carrying a flash message (and optionally a session)."""
+        cookies = {"flash": quote(f"{flash[0]}:{flash[1]}")}
+        if session is not None:
+            cookies["session"] = session
+        self.send_response(303)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._send_cookies(cookies)
+        self.end_headers()
+
+    def _send(self, status: int, body: bytes, content_type: str, cookies: Optional[Dict[str, str]] = None) -> None:
+        """Send a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self._send_cookies(cookies or {})
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_cookies(self, cookies: Dict[str, str]) -> None:
+        """Set (or clear, for empty values) cookies on the current response."""
+        for name, value in cookies.items():
+            max_age = "" if value else "; Max-Age=0"
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/{max_age}")
+
+    def _cookie(self, name: str) -> str:
+        """Return a request cookie's value, or '' if it is not set."""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[name].value if name in cookie else ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the local stand-in for the-internet.herokuapp.com")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    args = parser.parse_args()
+
+    site = LocalSite(host=args.host, port=args.port)
+    print(f"Serving on {site.start()} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
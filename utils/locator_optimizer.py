@@ -0,0 +1,165 @@
+"""
+Suggest faster, equivalent locators for slow or ambiguous ones.
+
+Two sources of suggestions:
+    - `xpath_to_css()` rewrites simple XPath expressions (tag / attribute
+      steps) into CSS selectors without touching the browser.
+    - `candidate_selectors()` asks the browser for CSS selectors that
+      describe an element (id, distinctive attributes, classes, a path from
+      the nearest ancestor with an id). This covers XPath that CSS cannot
+      express, such as text() matches.
+
+A suggestion is only kept by `suggest_locators()` once it resolves to
+exactly the same element(s) as the original locator.
+"""
+import re
+from typing import List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+Locator = Tuple[str, str]
+
+# One XPath location step: axis separator, tag, and optional [@attr='value'] predicates
+_STEP = re.compile(r"(//|/)([A-Za-z][\w-]*|\*)((?:\[@[\w-]+=(?:'[^']*'|\"[^\"]*\")\])*)")
+_PREDICATE = re.compile(r"\[@([\w-]+)=(?:'([^']*)'|\"([^\"]*)\")\]")
+
+# Arguments: target element. Returns CSS selectors describing it, most specific first.
+_CANDIDATES_SCRIPT = """
+var el = arguments[0], tag = el.tagName.toLowerCase(), out = [];
+function quote(v) { return '"' + v.replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"') + '"'; }
+function step(node) {
+    var name = node.tagName.toLowerCase(), index = 1, sib = node;
+    while ((sib = sib.previousElementSibling)) { if (sib.tagName === node.tagName) { index++; } }
+    return name + ':nth-of-type(' + index + ')';
+}
+if (el.id) { out.push('#' + CSS.escape(el.id)); }
+['data-testid', 'data-test', 'name', 'onclick', 'for', 'aria-label', 'title', 'type', 'value', 'href']
+    .forEach(function (attr) {
+        var v = el.getAttribute(attr);
+        if (v) { out.push(tag + '[' + attr + '=' + quote(v) + ']'); }
+    });
+if (el.classList.length) {
+    out.push(tag + Array.prototype.map.call(el.classList, function (c) { return '.' + CSS.escape(c); }).join(''));
+}
+var path = [], node = el;
+while (node && node.nodeType === 1 && node !== document.documentElement) {
+    if (node !== el && node.id) {
+        out.push('#' + CSS.escape(node.id) + ' ' + tag);
+        path.unshift('#' + CSS.escape(node.id));
+        break;
+    }
+    path.unshift(step(node));
+    node = node.parentElement;
+}
+out.push(path.join(' > '));
+return out;
+"""
+
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Translate a simple XPath into an equivalent CSS selector.
+
+    Handles absolute and descendant steps with tag names and exact
+    attribute predicates, e.g. `//div[@id='x']//button[@type='submit']`.
+    Anything else (text(), contains(), positions, axes) returns None.
+
+    Args:
+        xpath (str): XPath expression.
+
+    Returns:
+        Optional[str]: CSS selector, or None if there is no direct equivalent.
+    """
+    parts, pos = [], 0
+    for match in _STEP.finditer(xpath):
+        if match.start() != pos:
+            return None
+        pos = match.end()
+        separator, tag, predicates = match.groups()
+        selector = "" if tag == "*" else tag
+        for attr, single, double in _PREDICATE.findall(predicates):
+            value = single or double
+            if attr == "id" and re.fullmatch(r"[A-Za-z][\w-]*", value):
+                selector += f"#{value}"
+            else:
+                selector += f"[{attr}=\"{value}\"]"
+        if not parts and separator == "/":
+            # Absolute path: the first step is the document root
+            selector += ":root"
+        parts.append((separator, selector or "*"))
+    if pos != len(xpath) or not parts:
+        return None
+
+    css = parts[0][1]
+    for separator, selector in parts[1:]:
+        css += (" > " if separator == "/" else " ") + selector
+    return css
+
+
+def candidate_selectors(driver: WebDriver, element: WebElement) -> List[str]:
+    """
+    Ask the browser for CSS selectors describing an element.
+
+    Args:
+        driver (WebDriver): Selenium WebDriver instance.
+        element (WebElement): Target element.
+
+    Returns:
+        List[str]: Candidate selectors, most specific first (not yet verified).
+    """
+    return driver.execute_script(_CANDIDATES_SCRIPT, element)
+
+
+def suggest_locators(driver: WebDriver, locator: Locator) -> List[Locator]:
+    """
+    Return faster locators that resolve to the same element(s) as `locator`.
+
+    Candidates come from `xpath_to_css()` (for XPath) and
+    `candidate_selectors()` (for the first matched element). Each one is
+    verified against the current page: it must match exactly the same
+    elements, in the same order, as the original locator.
+
+    Args:
+        driver (WebDriver): Selenium WebDriver instance, on the page the locator belongs to.
+        locator (Locator): Locator to improve.
+
+    Returns:
+        List[Locator]: Verified alternatives (ID first when possible); empty if
+        the locator matches nothing or no equivalent was found.
+    """
+    original = driver.find_elements(*locator)
+    if not original:
+        return []
+
+    candidates: List[Locator] = []
+    if locator[0] == By.XPATH:
+        css = xpath_to_css(locator[1])
+        if css:
+            candidates.append((By.CSS_SELECTOR, css))
+    try:
+        candidates.extend((By.CSS_SELECTOR, css) for css in candidate_selectors(driver, original[0]))
+    except WebDriverException:
+        pass
+
+    verified: List[Locator] = []
+    for candidate in candidates:
+        if candidate == tuple(locator) or candidate in verified:
+            continue
+        try:
+            if driver.find_elements(*candidate) == original:
+                verified.append(_prefer_id(candidate))
+        except WebDriverException:
+            # Selector the browser cannot parse
+            continue
+    return verified
+
+
+def _prefer_id(locator: Locator) -> Locator:
+    """Turn a bare '#id' CSS selector into a By.ID locator."""
+    by, value = locator
+    if by == By.CSS_SELECTOR and re.fullmatch(r"#[A-Za-z][\w-]*", value):
+        return By.ID, value[1:]
+    return locator
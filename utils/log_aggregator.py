@@ -0,0 +1,309 @@
+"""
+One log file for parallel (pytest-xdist) runs.
+
+Without it every worker process would open its own RotatingFileHandler on
+logs/run.log: rotations race and lines interleave or get lost. Instead the
+controller runs a LogAggregator on a local TCP socket and owns the only
+file handler; each process forwards its records to it (ForwardingHandler,
+installed by utils.logger when the aggregator address is set).
+
+Records are sent as JSON lines. The aggregator holds them for a short
+window and writes them in timestamp order, so lines of different workers
+appear as they happened. Forwarding never blocks a worker: records that
+do not fit in the send buffer (aggregator slow or gone) are dropped and
+counted, and the counts are reported at the end of the run.
+"""
+import heapq
+import itertools
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import WORKER_ID, make_file_handler
+
+# LogRecord attributes sent over the wire (the message is already merged with its arguments)
+RECORD_FIELDS = (
+    "name", "levelno", "levelname", "pathname", "filename", "module", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread", "threadName", "process", "processName",
+    "msg", "exc_text", "stack_info", "worker", "nodeid",
+)
+
+
+class LogAggregator:
+    """
+    Collects records from every process of a run and writes them to one rotated log.
+
+    Attributes:
+        window (float): Seconds records are held back for ordering.
+        address (str): "host:port" once started.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, window: float = 0.5,
+                 handler: Optional[logging.Handler] = None):
+        """
+        Initialize the aggregator (not started yet).
+
+        Args:
+            host (str): Interface to bind. Defaults to 127.0.0.1.
+            port (int): Port to bind; 0 picks a free one. Defaults to 0.
+            window (float): Seconds records are held back so late arrivals
+                from other workers can still be put in order. Defaults to 0.5.
+            handler (Optional[logging.Handler]): Output. Defaults to the
+                rotating handler on logs/run.log.
+        """
+        self.host = host
+        self.port = port
+        self.window = window
+        self.address = ""
+        self._handler = handler
+        self._pending: List[Tuple[float, int, logging.LogRecord]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        # Serialises writers (writer thread, flush(), stop()) so batches never interleave
+        self._write_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._last_written = 0.0
+        self._received: Counter = Counter()
+        self._dropped: Dict[str, int] = {}
+        self._late = 0
+        self._connections = 0
+        self._idle = threading.Condition(self._lock)
+        self._server: Optional[socketserver.ThreadingTCPServer] = None
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> str:
+        """
+        Start accepting connections and writing records in background threads.
+
+        Returns:
+            str: "host:port" to pass to utils.logger.use_aggregator().
+        """
+        aggregator = self
+
+        class Handler(_ConnectionHandler):
+            pass
+
+        Handler.aggregator = aggregator
+        if self._handler is None:
+            self._handler = make_file_handler()
+        self._server = socketserver.ThreadingTCPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        host, port = self._server.server_address[:2]
+        self.address = f"{host}:{port}"
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name="log-aggregator", daemon=True),
+            threading.Thread(target=self._write_loop, name="log-aggregator-writer", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self.address
+
+    def stop(self) -> None:
+        """Stop accepting records, write everything still held back and close the log."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._write(flush=True)
+        self._handler.close()
+        self._server = None
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """
+        Write every record received so far, ignoring the ordering window.
+
+        Waits first for open connections to close (workers close theirs once
+        their logging is stopped), so their last records are included.
+
+        Args:
+            timeout (float): Maximum seconds to wait for connections. Defaults to 2.0.
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: self._connections == 0, timeout=timeout)
+        self._write(flush=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return per-worker counters.
+
+        Returns:
+            Dict[str, Any]: {received: {worker: n}, dropped: {worker: n}, late: n};
+            'late' counts records that arrived after newer ones were already written.
+        """
+        with self._lock:
+            return {"received": dict(self._received), "dropped": dict(self._dropped), "late": self._late}
+
+    # ----------------------------
+    # Receiving and writing
+    # ----------------------------
+    def receive(self, data: Dict[str, Any]) -> None:
+        """
+        Accept one decoded line from a worker.
+
+        Args:
+            data (Dict[str, Any]): A record (RECORD_FIELDS plus 'dropped'), or a
+                {'type': 'stats', 'worker', 'dropped'} line sent on close.
+        """
+        worker = data.get("worker", "?")
+        with self._lock:
+            self._dropped[worker] = max(self._dropped.get(worker, 0), int(data.get("dropped", 0)))
+            if data.get("type") == "stats":
+                return
+            record = logging.makeLogRecord({key: data.get(key) for key in RECORD_FIELDS})
+            heapq.heappush(self._pending, (record.created, next(self._sequence), record))
+            self._received[worker] += 1
+
+    def _connection_opened(self) -> None:
+        with self._idle:
+            self._connections += 1
+
+    def _connection_closed(self) -> None:
+        with self._idle:
+            self._connections -= 1
+            self._idle.notify_all()
+
+    def _write_loop(self) -> None:
+        """Writer thread: write records once they are older than the ordering window."""
+        while not self._stopped.wait(self.window / 2):
+            self._write()
+
+    def _write(self, flush: bool = False) -> None:
+        """Write held-back records in timestamp order (all of them if `flush`)."""
+        with self._write_lock:
+            cutoff = float("inf") if flush else time.time() - self.window
+            with self._lock:
+                ready = []
+                while self._pending and self._pending[0][0] <= cutoff:
+                    ready.append(heapq.heappop(self._pending)[2])
+            for record in ready:
+                if record.created < self._last_written:
+                    with self._lock:
+                        self._late += 1
+                self._last_written = max(self._last_written, record.created)
+                self._handler.handle(record)
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """One worker connection: JSON lines until the worker disconnects."""
+
+    aggregator: LogAggregator
+
+    def handle(self) -> None:
+        self.aggregator._connection_opened()
+        try:
+            for line in self.rfile:
+                try:
+                    self.aggregator.receive(json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+        finally:
+            self.aggregator._connection_closed()
+
+
+class ForwardingHandler(logging.Handler):
+    """
+    Sends records to a LogAggregator without ever blocking.
+
+    Runs in the logging listener thread. Encoded records go to a bounded
+    buffer that is written with non-blocking sends; when the buffer is full
+    or the aggregator cannot be reached, records are dropped and counted.
+    The count travels with every record and in a final 'stats' line.
+
+    Attributes:
+        dropped (int): Records dropped so far.
+    """
+
+    def __init__(self, address: str, max_buffer: int = 1_000_000, reconnect_delay: float = 1.0):
+        """
+        Initialize the handler; the connection is opened on the first record.
+
+        Args:
+            address (str): "host:port" of the aggregator.
+            max_buffer (int): Unsent bytes kept before records are dropped. Defaults to 1MB.
+            reconnect_delay (float): Seconds between connection attempts. Defaults to 1.0.
+        """
+        super().__init__()
+        host, _, port = address.rpartition(":")
+        self.target = (host, int(port))
+        self.max_buffer = max_buffer
+        self.reconnect_delay = reconnect_delay
+        self.dropped = 0
+        self._buffer = bytearray()
+        self._sock: Optional[socket.socket] = None
+        self._next_attempt = 0.0
+        # Formats tracebacks into exc_text before sending
+        self._formatter = logging.Formatter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self._formatter.formatException(record.exc_info)
+            data = {key: getattr(record, key, None) for key in RECORD_FIELDS}
+            data["msg"] = record.getMessage()
+            data["dropped"] = self.dropped
+            line = json.dumps(data, default=str).encode("utf-8") + b"\n"
+        except Exception:
+            self.handleError(record)
+            return
+
+        if len(self._buffer) + len(line) > self.max_buffer or not self._connected():
+            self.dropped += 1
+            return
+        self._buffer += line
+        self._send()
+
+    def close(self) -> None:
+        """Send what is buffered (waiting at most 2 seconds), then the final drop count."""
+        try:
+            if self._connected():
+                self._buffer += json.dumps(
+                    {"type": "stats", "worker": WORKER_ID, "dropped": self.dropped}
+                ).encode("utf-8") + b"\n"
+                self._sock.settimeout(2)
+                self._sock.sendall(self._buffer)
+                self._buffer.clear()
+        except OSError:
+            self.dropped += self._buffer.count(b"\n")
+            self._buffer.clear()
+        finally:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+            super().close()
+
+    def _connected(self) -> bool:
+        """Return whether a connection is open, trying to open one at most every `reconnect_delay`."""
+        if self._sock is not None:
+            return True
+        now = time.monotonic()
+        if now < self._next_attempt:
+            return False
+        self._next_attempt = now + self.reconnect_delay
+        try:
+            self._sock = socket.create_connection(self.target, timeout=1)
+            self._sock.setblocking(False)
+        except OSError:
+            self._sock = None
+        return self._sock is not None
+
+    def _send(self) -> None:
+        """Send as much of the buffer as the socket takes right now."""
+        try:
+            sent = self._sock.send(self._buffer)
+            del self._buffer[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            # Aggregator gone: what was buffered is lost
+            self.dropped += self._buffer.count(b"\n")
+            self._buffer.clear()
+            self._sock.close()
+            self._sock = None
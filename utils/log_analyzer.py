@@ -0,0 +1,374 @@
+"""
+Step latencies from logs/run.log and its rotations.
+
+The log files are memory-mapped and scanned line by line, oldest backup
+first, so even 10 rotations of 10MB are never loaded into memory. One
+pass builds:
+
+    - an offset index by test: byte ranges of each test's lines per file,
+      used to print a single test without scanning again;
+    - per-step durations: the gap between two consecutive lines of the
+      same test (and worker), keyed by both messages with their variable
+      part removed, e.g. "Clicked JS Alert button -> Retrieved alert text".
+
+Lines written before records carried a nodeid (older log layout) are
+attributed to the test named in the last "WebDriver started for test:"
+line, up to the driver quitting or a new driver starting.
+
+`read_segments()` reads a test's lines from the byte ranges recorded in
+reports/result.json (see utils.logger.log_segments()).
+
+Usage:
+    python -m utils.log_analyzer slowest [--top N] [--test TEXT] [--min-count N]
+    python -m utils.log_analyzer tests
+    python -m utils.log_analyzer show NODEID
+"""
+import argparse
+import heapq
+import math
+import mmap
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import LOG_FILE, PROJECT_ROOT
+
+# "2026-01-31 12:00:00,123 | LEVEL | rest"
+_LINE = re.compile(rb"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),(\d{3}) \| ([A-Z]+) \| (.*)$")
+_WHERE = re.compile(rb"^\S+:\d+$")
+_DIGITS = re.compile(r"\d+")
+_TEST_STARTED = "WebDriver started for test: "
+_TEST_ENDED = ("WebDriver quit successfully", "Initializing WebDriver")
+_NO_TEST = ""
+
+# (file, start offset, end offset)
+Span = Tuple[str, int, int]
+
+
+def log_files(path: Path = Path(LOG_FILE)) -> List[Path]:
+    """
+    Return a log and its existing rotations, oldest first.
+
+    Args:
+        path (Path): Current log file (backups are path.1 ... path.N).
+
+    Returns:
+        List[Path]: Existing files, e.g. [run.log.3, run.log.2, run.log.1, run.log].
+    """
+    backups = []
+    for candidate in path.parent.glob(path.name + ".*"):
+        suffix = candidate.name[len(path.name) + 1:]
+        if suffix.isdigit():
+            backups.append((int(suffix), candidate))
+    files = [candidate for _, candidate in sorted(backups, reverse=True)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def iter_lines(path: Path) -> Iterator[Tuple[int, int, bytes]]:
+    """
+    Yield the lines of a file through a memory map.
+
+    Args:
+        path (Path): File to scan.
+
+    Yields:
+        Tuple[int, int, bytes]: Start offset, end offset (after the newline) and the line without newline.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start, size = 0, len(mapped)
+            while start < size:
+                end = mapped.find(b"\n", start)
+                end = size if end < 0 else end + 1
+                yield start, end, mapped[start:end].rstrip(b"\r\n")
+                start = end
+
+
+def read_segments(segments: List[Dict[str, Any]], nodeid: str = "", root: Path = Path(PROJECT_ROOT)) -> List[str]:
+    """
+    Read a test's lines from the byte ranges stored in the JSON report.
+
+    Only the ranges are read. A range whose first line does not belong to
+    `nodeid` (the log rotated since the report was written) is skipped.
+
+    Args:
+        segments (List[Dict[str, Any]]): [{file, start, end}, ...] from the report's 'log' entry.
+        nodeid (str): Test the lines must belong to; '' skips the check.
+        root (Path): Directory the file names are relative to. Defaults to the project root.
+
+    Returns:
+        List[str]: The lines, without newlines.
+    """
+    lines: List[str] = []
+    for segment in segments:
+        path = root / segment["file"]
+        try:
+            with open(path, "rb") as file:
+                file.seek(segment["start"])
+                chunk = file.read(segment["end"] - segment["start"])
+        except OSError:
+            continue
+        chunk_lines = chunk.decode("utf-8", "replace").splitlines()
+        first = parse_line(chunk_lines[0].encode("utf-8")) if chunk_lines else None
+        if nodeid and (first is None or first["nodeid"] != nodeid):
+            continue
+        lines.extend(chunk_lines)
+    return lines
+
+
+class _Timestamps:
+    """Parses log timestamps, caching the expensive part per second."""
+
+    def __init__(self):
+        self._seconds: Dict[bytes, float] = {}
+
+    def parse(self, seconds: bytes, millis: bytes) -> float:
+        epoch = self._seconds.get(seconds)
+        if epoch is None:
+            epoch = datetime.strptime(seconds.decode("ascii"), "%Y-%m-%d %H:%M:%S").timestamp()
+            self._seconds[seconds] = epoch
+        return epoch + int(millis) / 1000
+
+
+def parse_line(line: bytes, timestamps: Optional[_Timestamps] = None) -> Optional[Dict[str, Any]]:
+    """
+    Split a log line into its fields.
+
+    Understands the current layout (time | level | worker | nodeid | logger |
+    file:line | message) and the older one without worker and nodeid.
+
+    Args:
+        line (bytes): One line without newline.
+        timestamps (Optional[_Timestamps]): Shared timestamp cache.
+
+    Returns:
+        Optional[Dict[str, Any]]: {time, level, worker, nodeid, logger, where, message},
+        nodeid None for the older layout; None for continuation lines (tracebacks).
+    """
+    match = _LINE.match(line)
+    if match is None:
+        return None
+    seconds, millis, level, rest = match.groups()
+    fields = rest.split(b" | ", 4)
+    if len(fields) == 5 and _WHERE.match(fields[3]):
+        worker, nodeid, logger, where, message = fields
+    else:
+        fields = rest.split(b" | ", 2)
+        if len(fields) < 3:
+            return None
+        worker, nodeid = b"main", None
+        logger, where, message = fields
+    return {
+        "time": (timestamps or _Timestamps()).parse(seconds, millis),
+        "level": level.decode("ascii"),
+        "worker": worker.decode("utf-8", "replace"),
+        "nodeid": nodeid.decode("utf-8", "replace") if nodeid is not None else None,
+        "logger": logger.decode("utf-8", "replace"),
+        "where": where.decode("utf-8", "replace"),
+        "message": message.decode("utf-8", "replace"),
+    }
+
+
+def step_template(message: str) -> str:
+    """
+    Reduce a message to its constant part so the same step matches across runs.
+
+    Everything after the first ': ' (values, URLs, texts) is dropped and
+    numbers are replaced with '#'.
+
+    Args:
+        message (str): Log message.
+
+    Returns:
+        str: Template, at most 80 characters.
+    """
+    head, sep, _ = message.partition(": ")
+    return _DIGITS.sub("#", head + (":" if sep else ""))[:80]
+
+
+class LogIndex:
+    """
+    One-pass index of a log and its rotations.
+
+    Attributes:
+        files (List[Path]): Scanned files, oldest first.
+        tests (Dict[str, List[Span]]): Byte ranges of each test's lines (consecutive lines merged).
+        steps (Dict[str, Dict[str, Any]]): Per step: count, total, max and the
+            durations (seconds), plus the slowest occurrences.
+    """
+
+    def __init__(self, files: List[Path], keep_slowest: int = 5):
+        """
+        Scan the files and build the index.
+
+        Args:
+            files (List[Path]): Log files, oldest first (see `log_files()`).
+            keep_slowest (int): Slowest occurrences kept per step. Defaults to 5.
+        """
+        self.files = files
+        self.keep_slowest = keep_slowest
+        self.tests: Dict[str, List[Span]] = {}
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._timestamps = _Timestamps()
+        # worker -> (test, time, template) of its previous line
+        self._previous: Dict[str, Tuple[str, float, str]] = {}
+        # worker -> test named by the last "WebDriver started for test:" (older layout)
+        self._legacy_test: Dict[str, str] = {}
+        for path in files:
+            self._scan(path)
+
+    def _scan(self, path: Path) -> None:
+        name = str(path)
+        test = _NO_TEST
+        for start, end, line in iter_lines(path):
+            fields = parse_line(line, self._timestamps)
+            if fields is not None:
+                test = self._test_of(fields)
+                self._add_step(fields, test, name, start)
+            # Continuation lines (tracebacks) stay with the line above
+            if test != _NO_TEST:
+                self._add_span(test, name, start, end)
+
+    def _test_of(self, fields: Dict[str, Any]) -> str:
+        """Return the test a line belongs to."""
+        if fields["nodeid"] is not None:
+            return fields["nodeid"]
+        message, worker = fields["message"], fields["worker"]
+        if message.startswith(_TEST_STARTED):
+            self._legacy_test[worker] = message[len(_TEST_STARTED):].split(" | ")[0]
+        test = self._legacy_test.get(worker, _NO_TEST)
+        if message.startswith(_TEST_ENDED):
+            self._legacy_test.pop(worker, None)
+            # "Initializing WebDriver" already belongs to the next test's setup
+            if message.startswith(_TEST_ENDED[1]):
+                return _NO_TEST
+        return test
+
+    def _add_span(self, test: str, name: str, start: int, end: int) -> None:
+        """Extend the test's last span if the line follows it directly, else open a new one."""
+        spans = self.tests.setdefault(test, [])
+        if spans and spans[-1][0] == name and spans[-1][2] == start:
+            spans[-1] = (name, spans[-1][1], end)
+        else:
+            spans.append((name, start, end))
+
+    def _add_step(self, fields: Dict[str, Any], test: str, name: str, offset: int) -> None:
+        """Record the gap since the previous line of the same worker and test."""
+        worker, now, template = fields["worker"], fields["time"], step_template(fields["message"])
+        previous = self._previous.get(worker)
+        self._previous[worker] = (test, now, template)
+        if previous is None or test == _NO_TEST or previous[0] != test:
+            return
+        duration = now - previous[1]
+        if duration < 0:
+            return
+        step = self.steps.setdefault(
+            f"{previous[2]} -> {template}",
+            {"count": 0, "total": 0.0, "max": 0.0, "durations": [], "slowest": []},
+        )
+        step["count"] += 1
+        step["total"] += duration
+        step["max"] = max(step["max"], duration)
+        step["durations"].append(duration)
+        occurrence = (duration, test, name, offset)
+        if len(step["slowest"]) < self.keep_slowest:
+            heapq.heappush(step["slowest"], occurrence)
+        else:
+            heapq.heappushpop(step["slowest"], occurrence)
+
+    # ----------------------------
+    # Queries
+    # ----------------------------
+    def slowest_steps(self, top: int = 20, test: str = "", min_count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Return the steps with the highest maximum duration.
+
+        Args:
+            top (int): Number of steps. Defaults to 20.
+            test (str): Only steps with an occurrence in a test whose nodeid
+                contains this text. Defaults to '' (all).
+            min_count (int): Ignore steps seen fewer times. Defaults to 1.
+
+        Returns:
+            List[Dict[str, Any]]: {step, count, mean, p95, max, where} per step
+            (seconds); 'where' is "file@offset (test)" of the slowest occurrence.
+        """
+        rows = []
+        for step, stats in self.steps.items():
+            if stats["count"] < min_count:
+                continue
+            slowest = [item for item in stats["slowest"] if test in item[1]]
+            if not slowest:
+                continue
+            durations = sorted(stats["durations"])
+            worst = max(slowest)
+            rows.append({
+                "step": step,
+                "count": stats["count"],
+                "mean": stats["total"] / stats["count"],
+                "p95": durations[max(0, math.ceil(0.95 * len(durations)) - 1)],
+                "max": worst[0],
+                "where": f"{Path(worst[2]).name}@{worst[3]} ({worst[1]})",
+            })
+        rows.sort(key=lambda row: row["max"], reverse=True)
+        return rows[:top]
+
+    def test_lines(self, test: str) -> Iterator[str]:
+        """
+        Yield a test's lines, read through the index.
+
+        Args:
+            test (str): Nodeid (or test name for the older layout).
+
+        Yields:
+            str: Lines without newline.
+        """
+        for name, start, end in self.tests.get(test, []):
+            with open(name, "rb") as file:
+                file.seek(start)
+                for line in file.read(end - start).splitlines():
+                    yield line.decode("utf-8", "replace")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Step latencies from logs/run.log and its rotations")
+    parser.add_argument("--log", default=LOG_FILE, help="Current log file (default: logs/run.log)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    slowest = sub.add_parser("slowest", help="Slowest steps across all runs in the logs")
+    slowest.add_argument("--top", type=int, default=20, help="Number of steps (default: 20)")
+    slowest.add_argument("--test", default="", help="Only tests whose nodeid contains this text")
+    slowest.add_argument("--min-count", type=int, default=1, help="Ignore steps seen fewer times")
+    sub.add_parser("tests", help="Tests found in the logs, with their line ranges")
+    show = sub.add_parser("show", help="Print the lines of one test")
+    show.add_argument("test", help="Nodeid (or test name in older logs)")
+    args = parser.parse_args(argv)
+
+    files = log_files(Path(args.log))
+    if not files:
+        parser.error(f"No log files found for {args.log}")
+    index = LogIndex(files)
+
+    if args.command == "slowest":
+        print(f"{'max':>9}{'p95':>9}{'mean':>9}{'count':>7}  step")
+        for row in index.slowest_steps(args.top, args.test, args.min_count):
+            print(f"{row['max']:>8.3f}s{row['p95']:>8.3f}s{row['mean']:>8.3f}s{row['count']:>7}  {row['step']}")
+            print(f"{'':>35}at {row['where']}")
+    elif args.command == "tests":
+        for test, spans in sorted(index.tests.items()):
+            size = sum(end - start for _, start, end in spans)
+            print(f"{test}  spans={len(spans)} bytes={size}")
+    else:
+        if args.test not in index.tests:
+            parser.error(f"Test not found in the logs: {args.test}")
+        for line in index.test_lines(args.test):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
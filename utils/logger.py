@@ -1,7 +1,11 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Mapping, Optional
 
 # Define the project root directory (two levels above this file)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -9,20 +13,123 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 # Define the directory for log files and ensure it exists
 LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
+LOG_FILE = os.path.join(LOG_DIR, "run.log")
 
+# Line layout of logs/run.log; every record is tagged with its worker and test
+FILE_FORMAT = "%(asctime)s | %(levelname)s | %(worker)s | %(nodeid)s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
 
-def get_logger(name: str = "tests", level_str: str = "INFO") -> logging.Logger:
+# Set by the controller of a parallel run: "host:port" of its LogAggregator
+AGGREGATOR_ENV = "LOG_AGGREGATOR_ADDRESS"
+
+# pytest-xdist worker id ('gw0', 'gw1', ...) or 'main' outside a parallel run
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+_TEST_NODEID = ""
+
+# Levels from config.json 'logging' (see configure_levels()); INFO until the config is loaded
+_DEFAULT_LEVEL = logging.INFO
+_LEVELS: Dict[str, int] = {}
+# Loggers created by get_logger() -> the level their caller asked for (None: configured level)
+_REQUESTED: Dict[str, Optional[int]] = {}
+
+# nodeid -> [[rotation, start, end], ...]: where each test's lines are in the log files;
+# rotation 0 is run.log, n is run.log.n (shifted on every rollover)
+_SEGMENTS: Dict[str, List[List[int]]] = {}
+_SEGMENTS_LOCK = threading.Lock()
+
+
+class _SegmentedFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that remembers the byte range of every test's lines."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            start = self.stream.tell()
+            logging.StreamHandler.emit(self, record)
+            nodeid = getattr(record, "nodeid", "")
+            if nodeid:
+                _add_segment(nodeid, start, self.stream.tell())
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        # run.log became run.log.1, run.log.1 became run.log.2, ...; the oldest was deleted
+        with _SEGMENTS_LOCK:
+            for nodeid in list(_SEGMENTS):
+                kept = [[index + 1, start, end] for index, start, end in _SEGMENTS[nodeid] if index < self.backupCount]
+                if kept:
+                    _SEGMENTS[nodeid] = kept
+                else:
+                    del _SEGMENTS[nodeid]
+
+
+def _add_segment(nodeid: str, start: int, end: int) -> None:
+    """Add a written line to a test's segments, extending the last one when contiguous."""
+    with _SEGMENTS_LOCK:
+        segments = _SEGMENTS.setdefault(nodeid, [])
+        if segments and segments[-1][0] == 0 and segments[-1][2] == start:
+            segments[-1][2] = end
+        else:
+            segments.append([0, start, end])
+
+
+class _ListenerQueueHandler(QueueHandler):
     """
-    Create and configure a logger instance with console and file handlers.
+    QueueHandler tuned for an in-process listener.
+
+    The message is merged with its arguments in the caller (arguments may
+    change later), but the record is neither copied nor formatted there:
+    timestamps, tracebacks and the line layout are formatted by the
+    listener. The listener is (re)started if a record arrives after
+    `stop_logging()` has finished (`_start_listener()` waits for it).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        record.worker = WORKER_ID
+        record.nodeid = _TEST_NODEID
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait(record)
+        if _LISTENER is None:
+            _start_listener()
+
+
+# Records travel from every logger to the listener thread through this queue
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_QUEUE_HANDLER = _ListenerQueueHandler(_LOG_QUEUE)
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+
+def get_logger(name: str = "tests", level_str: Optional[str] = None) -> logging.Logger:
+    """
+    Create and configure a logger instance that logs through the shared queue.
 
     Features:
-        - Console logging with simple format.
-        - File logging with detailed format and rotation (max 10MB per file, 10 backups).
-        - Logging level can be specified via `level_str`, default is INFO.
+        - Log calls only put the record on an in-memory queue; formatting
+          and disk I/O happen in one background listener thread.
+        - The listener owns the only console handler (simple format) and the
+          only file handler on logs/run.log (detailed format, rotation at
+          10MB, 10 backups), whatever the number of loggers.
+        - In a parallel run the file handler is replaced by a connection to
+          the controller's LogAggregator (see utils.log_aggregator), which
+          writes one log for all workers.
+        - Records are tagged with the worker id and the running test.
+        - The level comes from config.json 'logging': 'levels' per logger name
+          (a dotted name also matches its children), then `level_str`, then
+          'level'. See configure_levels().
 
     Args:
         name (str): Name of the logger. Defaults to "tests".
-        level_str (str): Logging level as string (e.g., "DEBUG", "INFO"). Defaults to "INFO".
+        level_str (Optional[str]): Logging level as string (e.g., "DEBUG", "INFO")
+            used when config.json has no level for this logger. Defaults to None
+            (the configured default level).
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -33,35 +140,199 @@ def get_logger(name: str = "tests", level_str: str = "INFO") -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # Determine logging level
-    level = getattr(logging, level_str.upper(), logging.INFO)
-    logger.setLevel(level)
-
-    # Console formatter and handler
-    console_fmt = logging.Formatter("%(levelname)s | %(message)s")
-    ch = logging.StreamHandler(stream=sys.stdout)
-    ch.setLevel(level)
-    ch.setFormatter(console_fmt)
-
-    # File formatter and handler with rotation
-    file_fmt = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
-    )
-    log_file = os.path.join(LOG_DIR, "run.log")
-    fh = RotatingFileHandler(
-        log_file, 
-        maxBytes=10_000_000, 
-        backupCount=10, 
-        encoding="utf-8"
-        )
-    fh.setLevel(level)
-    fh.setFormatter(file_fmt)
+    # Determine logging level; the shared handlers accept everything the logger lets through
+    requested = getattr(logging, level_str.upper(), logging.INFO) if level_str else None
+    _REQUESTED[name] = requested
+    logger.setLevel(level_for(name, requested))
 
-    # Attach handlers
-    logger.addHandler(ch)
-    logger.addHandler(fh)
+    _start_listener()
+    logger.addHandler(_QUEUE_HANDLER)
 
     # Prevent messages from propagating to the root logger
     logger.propagate = False
 
     return logger
+
+
+def configure_levels(default: Optional[str] = None, levels: Optional[Mapping[str, str]] = None) -> None:
+    """
+    Set the default level and per-logger levels, also for loggers that already exist.
+
+    Called with the 'logging' section of config.json when the config is
+    loaded, and again by conftest for --logger-level overrides.
+
+    Args:
+        default (Optional[str]): Level of loggers without their own entry (e.g. "DEBUG").
+            None keeps the current default.
+        levels (Optional[Mapping[str, str]]): Logger name -> level; merged into
+            the levels set before. A dotted name also applies to its children.
+
+    Raises:
+        ValueError: If a level name is unknown.
+    """
+    global _DEFAULT_LEVEL
+    if default is not None:
+        _DEFAULT_LEVEL = parse_level(default)
+    for name, level in (levels or {}).items():
+        _LEVELS[name] = parse_level(level)
+    # setLevel() also clears the per-logger isEnabledFor() caches
+    for name, requested in _REQUESTED.items():
+        logging.getLogger(name).setLevel(level_for(name, requested))
+
+
+def level_for(name: str, requested: Optional[int] = None) -> int:
+    """
+    Return the level of a logger: its configured level (or its nearest configured
+    parent's), else `requested`, else the default level.
+
+    Args:
+        name (str): Logger name.
+        requested (Optional[int]): Level asked for by the code creating the logger.
+
+    Returns:
+        int: Logging level.
+    """
+    probe = name
+    while probe:
+        if probe in _LEVELS:
+            return _LEVELS[probe]
+        probe = probe.rpartition(".")[0]
+    return requested if requested is not None else _DEFAULT_LEVEL
+
+
+def parse_level(level: str) -> int:
+    """
+    Convert a level name such as "debug" or "WARNING" to its number.
+
+    Args:
+        level (str): Level name.
+
+    Returns:
+        int: Logging level.
+
+    Raises:
+        ValueError: If the name is not a logging level.
+    """
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
+
+
+def set_test_context(nodeid: str = "") -> None:
+    """
+    Tag the records logged from now on with a test nodeid.
+
+    Args:
+        nodeid (str): Running test, or '' between tests.
+    """
+    global _TEST_NODEID
+    _TEST_NODEID = nodeid
+
+
+def use_aggregator(address: Optional[str]) -> None:
+    """
+    Send the file output of this process (and of workers started later) to a LogAggregator.
+
+    Args:
+        address (Optional[str]): "host:port" of the aggregator, or None to
+            write logs/run.log directly again.
+    """
+    if address:
+        os.environ[AGGREGATOR_ENV] = address
+    else:
+        os.environ.pop(AGGREGATOR_ENV, None)
+    # The next record starts a listener with the new output
+    stop_logging()
+
+
+def make_file_handler() -> RotatingFileHandler:
+    """
+    Create the rotating handler on logs/run.log (10MB per file, 10 backups).
+
+    The handler records where each test's lines are written (see `log_segments()`).
+
+    Returns:
+        RotatingFileHandler: Handler with the detailed file format.
+    """
+    fh = _SegmentedFileHandler(
+        LOG_FILE,
+        maxBytes=10_000_000,
+        backupCount=10,
+        encoding="utf-8"
+        )
+    fh.setFormatter(logging.Formatter(FILE_FORMAT, defaults={"worker": WORKER_ID, "nodeid": ""}))
+    return fh
+
+
+def log_segments() -> Dict[str, List[Dict[str, object]]]:
+    """
+    Return where each test's lines are in the log files written by this process.
+
+    Only the process owning the file handler knows the ranges: the pytest
+    process, or the controller of a parallel run (through its LogAggregator).
+    Call `stop_logging()` (and flush the aggregator) first so queued records
+    are included. Ranges refer to the file names at the time of the call;
+    later rotations shift them.
+
+    Returns:
+        Dict[str, List[Dict[str, object]]]: nodeid -> [{file, start, end}, ...],
+        'file' relative to the project root (e.g. 'logs/run.log.1'), oldest first.
+    """
+    base = os.path.relpath(LOG_FILE, PROJECT_ROOT).replace(os.sep, "/")
+    with _SEGMENTS_LOCK:
+        return {
+            nodeid: [
+                {"file": base if index == 0 else f"{base}.{index}", "start": start, "end": end}
+                for index, start, end in segments
+            ]
+            for nodeid, segments in _SEGMENTS.items()
+        }
+
+
+def stop_logging() -> None:
+    """
+    Write out every queued record and stop the listener thread.
+
+    Called when the pytest run ends (while its output capture is still
+    open) and again at interpreter exit. Logging again afterwards starts a
+    new listener.
+    """
+    global _LISTENER
+    # The listener stays published until it has stopped: a record logged
+    # meanwhile is only queued (and written by the next listener), it never
+    # starts a second listener that could take this one's stop sentinel.
+    with _LISTENER_LOCK:
+        if _LISTENER is None:
+            return
+        _LISTENER.stop()
+        for handler in _LISTENER.handlers:
+            handler.close()
+        _LISTENER = None
+
+
+def _start_listener() -> None:
+    """Start the listener thread with the console and file (or aggregator) handlers, once."""
+    global _LISTENER
+    with _LISTENER_LOCK:
+        if _LISTENER is not None:
+            return
+
+        # Console formatter and handler
+        console_fmt = logging.Formatter("%(levelname)s | %(message)s")
+        ch = logging.StreamHandler(stream=sys.stdout)
+        ch.setFormatter(console_fmt)
+
+        # File handler, or the connection to the aggregator writing the file for everyone
+        address = os.environ.get(AGGREGATOR_ENV)
+        if address:
+            from utils.log_aggregator import ForwardingHandler
+            output = ForwardingHandler(address)
+        else:
+            output = make_file_handler()
+
+        _LISTENER = QueueListener(_LOG_QUEUE, ch, output)
+        _LISTENER.start()
+
+
+atexit.register(stop_logging)
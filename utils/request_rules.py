@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import List, Sequence
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.cdp import execute_cdp
+from utils.config_loader import CONFIG
+from utils.logger import get_logger
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TINYMCE_STUB = "local_site/vendor/tinymce_stub.js"
+
+logger = get_logger("request_rules")
+
+
+def blocked_url_patterns(extra_patterns: Sequence[str] = ()) -> List[str]:
+    """
+    Return every URL pattern a session should block.
+
+    Chromium keeps a single blocked-URL list per target, so all sources are
+    merged here: the caller's patterns (e.g. web fonts from the browser
+    profile), 'request_rules.blocked_hosts' from config.json, and the TinyMCE
+    CDN when the 'request_rules.tinymce.stub' stand-in replaces it.
+
+    Args:
+        extra_patterns (Sequence[str]): Additional patterns ('*' wildcards).
+
+    Returns:
+        List[str]: Patterns without duplicates, in a stable order.
+    """
+    rules = CONFIG.get("request_rules", {})
+    patterns = [*extra_patterns, *rules.get("blocked_hosts", [])]
+    tinymce = rules.get("tinymce", {})
+    if tinymce.get("stub", False):
+        patterns.extend(tinymce.get("cdn_patterns", []))
+    return list(dict.fromkeys(patterns))
+
+
+def tinymce_stub_script() -> str:
+    """
+    Return the TinyMCE stub injected in place of the CDN editor, or '' when off.
+
+    Off by default ('request_rules.tinymce.stub'): the iframe test then runs
+    against the real editor from the CDN. The stub only mimics the editor's
+    DOM, for runs that must not depend on Tiny Cloud's load quota. Reads
+    'request_rules.tinymce.stub_script' (a path relative to the project
+    root); defaults to local_site/vendor/tinymce_stub.js.
+
+    Returns:
+        str: JavaScript source.
+
+    Raises:
+        RuntimeError: If the configured script does not exist.
+    """
+    tinymce = CONFIG.get("request_rules", {}).get("tinymce", {})
+    if not tinymce.get("stub", False):
+        return ""
+    path = PROJECT_ROOT / tinymce.get("stub_script", DEFAULT_TINYMCE_STUB)
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise RuntimeError(f"config.json: TinyMCE stub script not found: {path}") from exc
+
+
+def apply_request_rules(drv: WebDriver, browser: str, extra_patterns: Sequence[str] = ()) -> None:
+    """
+    Block non-essential requests and, when enabled, swap the TinyMCE CDN for the stub.
+
+    Uses the DevTools Network and Page domains, so it only applies to Edge
+    and Chrome; Firefox sessions are left untouched. Requests matching the
+    blocked patterns fail immediately instead of waiting on the network.
+    The TinyMCE stub, when enabled, is registered to run before any page
+    script, so `tinymce.init()` on the iframe page finds it while the CDN
+    request is blocked.
+
+    Args:
+        drv (WebDriver): Newly created session.
+        browser (str): Browser name from config.json.
+        extra_patterns (Sequence[str]): Additional URL patterns to block.
+    """
+    patterns = blocked_url_patterns(extra_patterns)
+    script = tinymce_stub_script()
+    if not patterns and not script:
+        return
+    if browser not in ("edge", "chrome"):
+        logger.debug("Request rules need DevTools; skipped for %s", browser)
+        return
+
+    try:
+        if patterns:
+            execute_cdp(drv, "Network.enable")
+            execute_cdp(drv, "Network.setBlockedURLs", {"urls": patterns})
+            logger.debug("Blocking %d URL pattern(s)", len(patterns))
+        if script:
+            execute_cdp(drv, "Page.addScriptToEvaluateOnNewDocument", {"source": script})
+            logger.debug("TinyMCE stub registered")
+    except WebDriverException:
+        logger.warning("Could not install request rules through DevTools", exc_info=True)
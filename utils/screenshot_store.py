@@ -0,0 +1,501 @@
+"""
+Content-addressed store for failure screenshots.
+
+Every PNG is stored once under blobs/<aa>/<sha256>.png; repeated failures
+producing the same image only add an index entry referencing the existing
+blob. Each entry also carries a perceptual hash (dHash), so near-identical
+screenshots of the same test (a moving cursor, a clock) are grouped even
+when their bytes differ.
+
+    screenshots/
+        blobs/ab/ab12....png
+        attachments/          files stored with a screenshot (e.g. the page
+                              source and metadata of a failure), listed in
+                              its entry's 'files'
+        index.jsonl           one JSON entry per stored screenshot
+
+The index is append-only while tests run, so pytest-xdist workers can add
+to it concurrently; retention rewrites it. Each store keeps the index in
+memory and only reads the lines appended since its last look.
+
+Retention ('screenshot_store' in config.json) runs at the end of each
+pytest run and from the CLI:
+    max_age_days     drop entries older than this
+    keep_per_group   newest entries kept per near-duplicate group
+    max_megabytes    then drop the oldest entries until the blobs fit
+The attachments of dropped entries are deleted with them; attachments no
+entry lists (a failure without a screenshot) once older than max_age_days.
+
+Usage:
+    python -m utils.screenshot_store stats
+    python -m utils.screenshot_store prune
+    python -m utils.screenshot_store import   # move loose PNGs of screenshots/ into the store
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.config_loader import CONFIG
+from utils.logger import get_logger
+
+# Optional import: Pillow (in requirements.txt) hashes a screenshot in milliseconds;
+# the built-in PNG reader is a fallback that takes most of a second per screenshot
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIRECTORY = PROJECT_ROOT / "screenshots"
+
+# <test>_<browser>_<headless|gui>_<YYYYmmdd>_<HHMMSS>.png, as named by the driver fixture
+_LEGACY_NAME = re.compile(r"^(?P<test>.+)_[a-z]+_(?:headless|gui)_(?P<stamp>\d{8}_\d{6})$")
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+logger = get_logger("screenshot_store")
+
+
+class ScreenshotStore:
+    """
+    On-disk, content-addressed store of screenshots with a JSON-lines index.
+
+    Attributes:
+        directory (Path): Store root.
+        near_duplicate_distance (int): Maximum dHash Hamming distance between
+            two screenshots of the same test that are grouped together.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_DIRECTORY, near_duplicate_distance: int = 6):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory (Path): Store root. Defaults to <project>/screenshots.
+            near_duplicate_distance (int): Grouping threshold (0-64 bits). Defaults to 6.
+        """
+        self.directory = Path(directory)
+        self.blob_dir = self.directory / "blobs"
+        self.attachment_dir = self.directory / "attachments"
+        self.index_path = self.directory / "index.jsonl"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.near_duplicate_distance = near_duplicate_distance
+        self._lock = threading.Lock()
+        # In-memory copy of index.jsonl, file order, and how much of which file it holds
+        self._entries: List[Dict[str, Any]] = []
+        self._index_offset = 0
+        self._index_inode = 0
+
+    @classmethod
+    def from_config(cls) -> "ScreenshotStore":
+        """Open the store configured in config.json 'screenshot_store'."""
+        settings = CONFIG.get("screenshot_store", {})
+        return cls(
+            PROJECT_ROOT / settings.get("directory", "screenshots"),
+            near_duplicate_distance=int(settings.get("near_duplicate_distance", 6)),
+        )
+
+    # ----------------------------
+    # Adding and reading
+    # ----------------------------
+    def put(self, png: bytes, name: str, test: str = "", created: Optional[float] = None,
+            files: Iterable[Path] = (), **metadata: Any) -> Dict[str, Any]:
+        """
+        Store a screenshot (the blob only if its content is new) and index it.
+
+        Args:
+            png (bytes): PNG data.
+            name (str): Human-readable name, e.g. the old timestamped file name.
+            test (str): Test nodeid (or name). Defaults to ''.
+            created (Optional[float]): Capture time. Defaults to now.
+            files (Iterable[Path]): Attachments (under `attachment_dir`) kept
+                and pruned with this entry.
+            **metadata: Extra JSON-serialisable fields stored in the entry.
+
+        Returns:
+            Dict[str, Any]: The index entry ({sha256, name, test, created, size,
+            phash, group, duplicate, files, ...metadata}); 'duplicate' is True
+            when the blob already existed.
+        """
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.blob_path(digest)
+        duplicate = path.exists()
+        if not duplicate:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(png)
+            os.replace(tmp, path)
+
+        phash = perceptual_hash(png)
+        with self._lock:
+            self._refresh()
+            entry = {
+                "sha256": digest,
+                "name": name,
+                "test": test,
+                "created": created if created is not None else time.time(),
+                "size": len(png),
+                "phash": phash,
+                "group": self._group_for(test, digest, phash),
+                "duplicate": duplicate,
+                "files": [Path(path).relative_to(self.directory).as_posix() for path in files],
+                **metadata,
+            }
+            with open(self.index_path, "a", encoding="utf-8") as index:
+                index.write(json.dumps(entry) + "\n")
+        return entry
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Return every index entry, oldest first.
+
+        Returns:
+            List[Dict[str, Any]]: Entries as written by `put()`.
+        """
+        with self._lock:
+            self._refresh()
+            return sorted(self._entries, key=lambda entry: entry["created"])
+
+    def latest_by_test(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the newest entry of each test, with the size of its near-duplicate group.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: test -> entry plus 'group_size'.
+        """
+        entries = self.entries()
+        group_sizes: Dict[str, int] = {}
+        for entry in entries:
+            group_sizes[entry["group"]] = group_sizes.get(entry["group"], 0) + 1
+        latest = {}
+        for entry in entries:
+            latest[entry["test"]] = {**entry, "group_size": group_sizes[entry["group"]]}
+        return latest
+
+    def blob_path(self, digest: str) -> Path:
+        """Return the file holding the blob with this SHA-256."""
+        return self.blob_dir / digest[:2] / f"{digest}.png"
+
+    def _refresh(self) -> None:
+        """
+        Bring the in-memory index up to date. Caller must hold the lock.
+
+        Only complete lines appended since the last call are parsed; a
+        replaced (pruned) or truncated index is reloaded from the start.
+        """
+        try:
+            stat = self.index_path.stat()
+        except FileNotFoundError:
+            self._entries, self._index_offset, self._index_inode = [], 0, 0
+            return
+        if stat.st_ino != self._index_inode or stat.st_size < self._index_offset:
+            self._entries, self._index_offset, self._index_inode = [], 0, stat.st_ino
+        if stat.st_size == self._index_offset:
+            return
+        with open(self.index_path, "rb") as index:
+            index.seek(self._index_offset)
+            data = index.read(stat.st_size - self._index_offset)
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            try:
+                self._entries.append(json.loads(line))
+            except ValueError:
+                continue
+        self._index_offset += complete
+
+    def _group_for(self, test: str, digest: str, phash: Optional[str]) -> str:
+        """
+        Return the group of the newest same-test entry within the distance
+        threshold, else a new one. Caller must hold the lock (index refreshed).
+        """
+        for entry in reversed(self._entries):
+            if entry["test"] != test:
+                continue
+            if entry["sha256"] == digest:
+                return entry["group"]
+            if phash and entry.get("phash") and _distance(phash, entry["phash"]) <= self.near_duplicate_distance:
+                return entry["group"]
+        # New group, named per test so the same image in another test is grouped apart
+        return hashlib.sha256(f"{test}\n{digest}".encode("utf-8")).hexdigest()[:16]
+
+    # ----------------------------
+    # Retention
+    # ----------------------------
+    def prune(self, max_age_days: Optional[float] = None, keep_per_group: Optional[int] = None,
+              max_bytes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Apply the retention policy, then delete blobs no entry references
+        and the attachments of dropped entries.
+
+        Args:
+            max_age_days (Optional[float]): Drop entries older than this.
+            keep_per_group (Optional[int]): Keep only the newest N entries per near-duplicate group.
+            max_bytes (Optional[int]): Then drop the oldest entries until the
+                referenced blobs fit in this size.
+
+        Returns:
+            Dict[str, int]: Removed 'entries', 'blobs' and 'attachments', and 'freed_bytes'.
+        """
+        cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+        with self._lock:
+            self._refresh()
+            entries = sorted(self._entries, key=lambda entry: entry["created"])
+            kept = list(entries)
+            if cutoff is not None:
+                kept = [entry for entry in kept if entry["created"] >= cutoff]
+            if keep_per_group is not None:
+                seen: Dict[str, int] = {}
+                newest_first = []
+                for entry in reversed(kept):
+                    seen[entry["group"]] = seen.get(entry["group"], 0) + 1
+                    if seen[entry["group"]] <= keep_per_group:
+                        newest_first.append(entry)
+                kept = list(reversed(newest_first))
+            if max_bytes is not None:
+                sizes = {entry["sha256"]: entry["size"] for entry in kept}
+                total = sum(sizes.values())
+                while kept and total > max_bytes:
+                    dropped = kept.pop(0)
+                    if all(entry["sha256"] != dropped["sha256"] for entry in kept):
+                        total -= sizes[dropped["sha256"]]
+
+            if len(kept) < len(entries):
+                tmp = self.index_path.with_suffix(".tmp")
+                tmp.write_text("".join(json.dumps(entry) + "\n" for entry in kept), encoding="utf-8")
+                os.replace(tmp, self.index_path)
+
+            referenced = {entry["sha256"] for entry in kept}
+            blobs = freed = 0
+            for path in self.blob_dir.glob("*/*.png"):
+                if path.stem not in referenced:
+                    freed += path.stat().st_size
+                    path.unlink()
+                    blobs += 1
+
+            kept_files = {name for entry in kept for name in entry.get("files", [])}
+            dropped_files = {name for entry in entries for name in entry.get("files", [])} - kept_files
+            attachments = 0
+            for path in self.attachment_dir.glob("*"):
+                name = path.relative_to(self.directory).as_posix()
+                if name in kept_files:
+                    continue
+                stat = path.stat()
+                if name in dropped_files or (cutoff is not None and stat.st_mtime < cutoff):
+                    freed += stat.st_size
+                    path.unlink()
+                    attachments += 1
+        removed = {
+            "entries": len(entries) - len(kept), "blobs": blobs,
+            "attachments": attachments, "freed_bytes": freed,
+        }
+        if any(removed.values()):
+            logger.info("Screenshot store pruned: %s", removed)
+        return removed
+
+    def apply_retention(self) -> Dict[str, int]:
+        """
+        Prune with the policy from config.json 'screenshot_store'.
+
+        Returns:
+            Dict[str, int]: See `prune()`.
+        """
+        settings = CONFIG.get("screenshot_store", {})
+        max_megabytes = settings.get("max_megabytes")
+        return self.prune(
+            max_age_days=settings.get("max_age_days"),
+            keep_per_group=settings.get("keep_per_group"),
+            max_bytes=int(max_megabytes * 1_000_000) if max_megabytes is not None else None,
+        )
+
+    def import_loose_files(self) -> int:
+        """
+        Move timestamped PNGs lying in the store directory into the store.
+
+        Returns:
+            int: Number of files imported.
+        """
+        imported = 0
+        for path in sorted(self.directory.glob("*.png")):
+            match = _LEGACY_NAME.match(path.stem)
+            test = match.group("test") if match else path.stem
+            created = path.stat().st_mtime
+            if match:
+                created = time.mktime(time.strptime(match.group("stamp"), "%Y%m%d_%H%M%S"))
+            self.put(path.read_bytes(), path.stem, test=test, created=created)
+            path.unlink()
+            imported += 1
+        return imported
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry, blob, attachment and group counts and the bytes saved by deduplication."""
+        entries = self.entries()
+        logical = sum(entry["size"] for entry in entries)
+        stored = sum(path.stat().st_size for path in self.blob_dir.glob("*/*.png"))
+        return {
+            "entries": len(entries),
+            "blobs": sum(1 for _ in self.blob_dir.glob("*/*.png")),
+            "attachments": sum(1 for _ in self.attachment_dir.glob("*")),
+            "near_duplicate_groups": len({entry["group"] for entry in entries}),
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+            "deduplicated_bytes": max(logical - stored, 0),
+        }
+
+
+# ----------------------------
+# Perceptual hash
+# ----------------------------
+def perceptual_hash(png: bytes) -> Optional[str]:
+    """
+    Return the 64-bit difference hash (dHash) of a PNG as 16 hex digits.
+
+    The image is reduced to 9x8 grey levels; each bit tells whether a cell
+    is brighter than its right neighbour, so small pixel changes keep most
+    bits while different screens differ in many.
+
+    Args:
+        png (bytes): PNG data.
+
+    Returns:
+        Optional[str]: Hash, or None if the image could not be decoded.
+    """
+    grid = _grey_grid(png, 9, 8)
+    if grid is None:
+        return None
+    bits = 0
+    for row in grid:
+        for left, right in zip(row, row[1:]):
+            bits = (bits << 1) | (left > right)
+    return f"{bits:016x}"
+
+
+def _distance(a: str, b: str) -> int:
+    """Hamming distance between two hex hashes."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def _grey_grid(png: bytes, columns: int, rows: int) -> Optional[List[List[float]]]:
+    """Average grey level of each cell of a columns x rows grid laid over the image."""
+    if Image is not None:
+        import io
+        try:
+            with Image.open(io.BytesIO(png)) as image:
+                small = image.convert("L").resize((columns, rows), Image.BOX)
+                values = list(small.getdata())
+        except (OSError, ValueError, SyntaxError):
+            return None
+        return [values[y * columns:(y + 1) * columns] for y in range(rows)]
+
+    decoded = decode_png(png)
+    if decoded is None:
+        return None
+    width, height, channels, pixels = decoded
+    sums = [[0.0] * columns for _ in range(rows)]
+    counts = [[0] * columns for _ in range(rows)]
+    # Every other pixel and row is enough for a 9x8 summary
+    for y in range(0, height, 2):
+        cell_y = y * rows // height
+        row = pixels[y]
+        for x in range(0, width, 2):
+            offset = x * channels
+            if channels >= 3:
+                grey = (row[offset] * 299 + row[offset + 1] * 587 + row[offset + 2] * 114) / 1000
+            else:
+                grey = row[offset]
+            cell_x = x * columns // width
+            sums[cell_y][cell_x] += grey
+            counts[cell_y][cell_x] += 1
+    return [[s / c if c else 0.0 for s, c in zip(sum_row, count_row)] for sum_row, count_row in zip(sums, counts)]
+
+
+def decode_png(png: bytes):
+    """
+    Minimal PNG decoder for 8-bit, non-interlaced grey/RGB(A) images (what browsers produce).
+
+    Returns:
+        Optional[Tuple[int, int, int, List[bytearray]]]: width, height, channels
+        and the unfiltered rows; None for anything else.
+    """
+    if not png.startswith(_PNG_SIGNATURE):
+        return None
+    position, idat = len(_PNG_SIGNATURE), []
+    width = height = channels = 0
+    while position + 8 <= len(png):
+        length, kind = struct.unpack(">I4s", png[position:position + 8])
+        data = png[position + 8:position + 8 + length]
+        position += 12 + length
+        if kind == b"IHDR":
+            if len(data) != 13:
+                return None
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", data)
+            channels = {0: 1, 2: 3, 4: 2, 6: 4}.get(color, 0)
+            if depth != 8 or interlace or not channels:
+                return None
+        elif kind == b"IDAT":
+            idat.append(data)
+        elif kind == b"IEND":
+            break
+    try:
+        raw = zlib.decompress(b"".join(idat))
+    except zlib.error:
+        return None
+
+    stride = width * channels
+    if not channels or len(raw) < height * (stride + 1):
+        # Missing header or truncated image data
+        return None
+    rows: List[bytearray] = []
+    previous = bytearray(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        kind, row = raw[start], bytearray(raw[start + 1:start + 1 + stride])
+        if kind == 1:
+            for i in range(channels, stride):
+                row[i] = (row[i] + row[i - channels]) & 0xFF
+        elif kind == 2:
+            row = bytearray((a + b) & 0xFF for a, b in zip(row, previous))
+        elif kind == 3:
+            for i in range(stride):
+                left = row[i - channels] if i >= channels else 0
+                row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                a = row[i - channels] if i >= channels else 0
+                b = previous[i]
+                c = previous[i - channels] if i >= channels else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                row[i] = (row[i] + (a if pa <= pb and pa <= pc else b if pb <= pc else c)) & 0xFF
+        rows.append(row)
+        previous = row
+    return width, height, channels, rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or prune the screenshot store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show entries, blobs, near-duplicate groups and deduplication")
+    sub.add_parser("prune", help="Apply the retention policy from config.json")
+    sub.add_parser("import", help="Move loose PNGs of the store directory into the store")
+    args = parser.parse_args(argv)
+
+    store = ScreenshotStore.from_config()
+    if args.command == "stats":
+        for name, value in store.stats().items():
+            print(f"{name:<24}{value}")
+    elif args.command == "prune":
+        print(store.apply_retention())
+    else:
+        print(f"Imported {store.import_loose_files()} file(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from selenium.webdriver.common.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Attribute holding a session's profile until the first test using it reports it
+_PROFILE_ATTR = "_startup_profile"
+
+
+class StartupProfile:
+    """
+    Time spent in each phase of creating one WebDriver session.
+
+    Phases can nest; each phase is charged only its own time, so the time
+    of a nested phase (e.g. the driver service starting inside the browser
+    constructor) is not counted twice.
+
+    Attributes:
+        browser (str): Browser the session was created for.
+        phases (Dict[str, float]): Exclusive seconds per phase, in start order.
+    """
+
+    def __init__(self, browser: str):
+        """
+        Initialize an empty profile; the total clock starts now.
+
+        Args:
+            browser (str): Browser the session is created for.
+        """
+        self.browser = browser
+        self.phases: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._total: Optional[float] = None
+        self._nested: List[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase (the time of phases nested inside it is excluded).
+
+        Args:
+            name (str): Phase name; repeated phases are summed.
+        """
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def timed_service(self, service: Service) -> Service:
+        """
+        Make `service.start()` record a 'service_start' phase.
+
+        Args:
+            service (Service): Driver service not yet started.
+
+        Returns:
+            Service: The same service.
+        """
+        start = service.start
+
+        def timed_start() -> None:
+            with self.phase("service_start"):
+                start()
+
+        service.start = timed_start
+        return service
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Stop the total clock.
+
+        Returns:
+            Dict[str, Any]: See `as_dict()`.
+        """
+        if self._total is None:
+            self._total = time.perf_counter() - self._started
+        return self.as_dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the profile in milliseconds; time outside any phase is reported as 'other'.
+
+        Returns:
+            Dict[str, Any]: {browser, total_ms, phases: {name: ms}}
+        """
+        total = self._total if self._total is not None else time.perf_counter() - self._started
+        phases = {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+        phases["other"] = round(max(0.0, total - sum(self.phases.values())) * 1000, 3)
+        return {"browser": self.browser, "total_ms": round(total * 1000, 3), "phases": phases}
+
+
+def attach_profile(drv: WebDriver, profile: StartupProfile) -> None:
+    """
+    Store a finished profile on its session.
+
+    Args:
+        drv (WebDriver): Session the profile belongs to.
+        profile (StartupProfile): Profile of its creation.
+    """
+    setattr(drv, _PROFILE_ATTR, profile.finish())
+
+
+def take_profile(drv: WebDriver) -> Optional[Dict[str, Any]]:
+    """
+    Return a session's startup profile once; pooled sessions report it only for their first test.
+
+    Args:
+        drv (WebDriver): Session handed to a test.
+
+    Returns:
+        Optional[Dict[str, Any]]: The profile, or None if already taken or never recorded.
+    """
+    profile = getattr(drv, _PROFILE_ATTR, None)
+    if profile is not None:
+        setattr(drv, _PROFILE_ATTR, None)
+    return profile
+
+
+def aggregate(profiles: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    Summarise many startup profiles per phase.
+
+    Args:
+        profiles (List[Dict[str, Any]]): Profiles from `take_profile()`.
+
+    Returns:
+        Dict[str, Dict[str, float]]: {phase: {sessions, mean_ms, p50_ms, max_ms, share}},
+        with 'total' first and phases ordered by mean time; 'share' is the
+        phase's part of the summed total time.
+    """
+    by_phase: Dict[str, List[float]] = {"total": [p["total_ms"] for p in profiles]}
+    for profile in profiles:
+        for name, ms in profile["phases"].items():
+            by_phase.setdefault(name, []).append(ms)
+
+    grand_total = sum(by_phase["total"]) or 1.0
+    summary = {}
+    for name, values in by_phase.items():
+        values.sort()
+        summary[name] = {
+            "sessions": len(values),
+            "mean_ms": round(sum(values) / len(values), 1),
+            "p50_ms": round(values[(len(values) - 1) // 2], 1),
+            "max_ms": round(values[-1], 1),
+            "share": round(sum(values) / grand_total, 3),
+        }
+    total = summary.pop("total")
+    ordered = sorted(summary.items(), key=lambda item: item[1]["mean_ms"], reverse=True)
+    return {"total": total, **dict(ordered)}
@@ -0,0 +1,458 @@
+"""
+Visual regression checks of page objects against baseline screenshots.
+
+Baselines are kept per browser, page object and window size:
+
+    visual_baselines/<browser>/<PageClass>/<width>x<height>[_<name>].png
+
+A check takes a screenshot, compares it with the baseline and, when too
+many pixels changed, writes a diff heatmap (changed pixels in red over the
+dimmed baseline) and the actual screenshot to reports/visual/. A check
+without a baseline does not pass (status 'missing_baseline'; the test
+suite reports it as xfail): baselines are recorded, or re-recorded, only
+with `--update-baselines`.
+
+The comparison is vectorized with NumPy and never loops over pixels:
+    1. Identical PNG bytes: match, nothing is decoded.
+    2. Optional perceptual pre-filter, off by default ('prefilter_distance'
+       -1): with a distance >= 0, images whose 64-bit dHashes differ by at
+       most that many bits pass without a full diff. The hash only sees a
+       9x8 grid of average grey levels (each cell ~150x96 px), so moved or
+       relabelled controls often keep it unchanged: enable it only where
+       a missed small change is acceptable.
+    3. Full diff: per-pixel maximum channel difference, pixels above
+       'tolerance' count as changed unless inside an ignore region; the check
+       fails when the changed share exceeds 'max_diff_ratio'.
+
+Ignore regions come from the page object's VISUAL_IGNORE locators (e.g. a
+clock or an ad) plus any rectangles passed to `check()`, all in viewport
+coordinates: the screenshot shows the viewport, wherever the page is scrolled.
+
+NumPy is needed for comparisons. PNGs are decoded with Pillow (in
+requirements.txt); the built-in reader is a much slower fallback. Decoded
+baselines are cached, so a check decodes only the new screenshot.
+"""
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.config_loader import CONFIG
+from utils.logger import get_logger
+from utils.screenshot_store import decode_png
+
+# Optional import: NumPy does the pixel work; without it checks cannot run
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional import: Pillow decodes screenshots much faster than decode_png()
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# (x, y, width, height) in CSS pixels, relative to the viewport (what a screenshot shows)
+Rect = Tuple[float, float, float, float]
+
+# Arguments: none. Returns the CSS-to-screenshot pixel ratio.
+_PIXEL_RATIO_SCRIPT = "return window.devicePixelRatio || 1;"
+
+# Arguments: elements. Returns their [x, y, width, height] relative to the viewport, in CSS pixels.
+_VIEWPORT_RECTS_SCRIPT = (
+    "return Array.prototype.map.call(arguments[0], function (element) {"
+    " var r = element.getBoundingClientRect(); return [r.left, r.top, r.width, r.height]; });"
+)
+
+# ITU-R 601 luma weights, per mille
+_LUMA = (299, 587, 114)
+
+
+class VisualRegression:
+    """
+    Compares page screenshots with per-page, per-window-size baselines.
+
+    Attributes:
+        baseline_dir (Path): Root of the baselines.
+        output_dir (Path): Where heatmaps and actual screenshots of failed checks go.
+        tolerance (int): Channel difference (0-255) a pixel may have and still match.
+        max_diff_ratio (float): Share of changed pixels tolerated.
+        prefilter_distance (int): dHash bits two images may differ by for the
+            full diff to be skipped; negative (the default) disables the pre-filter.
+        update (bool): Record every screenshot as the new baseline.
+    """
+
+    def __init__(self, baseline_dir: Path, output_dir: Path, tolerance: int = 16,
+                 max_diff_ratio: float = 0.001, prefilter_distance: int = -1, update: bool = False):
+        """
+        Initialize the checker.
+
+        Args:
+            baseline_dir (Path): Root of the baselines.
+            output_dir (Path): Where heatmaps of failed checks are written.
+            tolerance (int): Per-channel difference ignored (anti-aliasing). Defaults to 16.
+            max_diff_ratio (float): Share of changed pixels tolerated. Defaults to 0.001.
+            prefilter_distance (int): dHash pre-filter threshold; -1 disables it. Defaults to -1.
+            update (bool): Re-record baselines instead of comparing. Defaults to False.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("Visual regression checks require NumPy (pip install numpy)")
+        self.baseline_dir = Path(baseline_dir)
+        self.output_dir = Path(output_dir)
+        self.tolerance = tolerance
+        self.max_diff_ratio = max_diff_ratio
+        self.prefilter_distance = prefilter_distance
+        self.update = update
+        self.logger = get_logger(self.__class__.__name__)
+        # path -> (PNG sha256, decoded image, dHash)
+        self._baselines: Dict[Path, Tuple[str, Any, int]] = {}
+
+    @classmethod
+    def from_config(cls, update: bool = False) -> "VisualRegression":
+        """
+        Build the checker from config.json 'visual_regression'.
+
+        Args:
+            update (bool): Re-record baselines. Defaults to False.
+
+        Returns:
+            VisualRegression: Configured checker.
+        """
+        settings = CONFIG.get("visual_regression", {})
+        return cls(
+            PROJECT_ROOT / settings.get("baseline_dir", "visual_baselines"),
+            PROJECT_ROOT / settings.get("output_dir", "reports/visual"),
+            tolerance=int(settings.get("tolerance", 16)),
+            max_diff_ratio=float(settings.get("max_diff_ratio", 0.001)),
+            prefilter_distance=int(settings.get("prefilter_distance", -1)),
+            update=update,
+        )
+
+    def baseline_path(self, page: str, size: Tuple[int, int], name: str = "") -> Path:
+        """
+        Return the baseline file of a page at a window size.
+
+        Args:
+            page (str): Page object class name.
+            size (Tuple[int, int]): Window width and height.
+            name (str): Optional state of the page, e.g. 'after_login'. Defaults to ''.
+
+        Returns:
+            Path: <baseline_dir>/<browser>/<page>/<width>x<height>[_<name>].png
+        """
+        browser = str(CONFIG.get("browser", "edge")).lower()
+        suffix = f"_{name}" if name else ""
+        return self.baseline_dir / browser / page / f"{size[0]}x{size[1]}{suffix}.png"
+
+    def check(self, page: Any, name: str = "", ignore: Iterable[Rect] = ()) -> Dict[str, Any]:
+        """
+        Screenshot a page object's browser and compare it with its baseline.
+
+        Args:
+            page (Any): Page object (uses its `driver` and optional VISUAL_IGNORE locators).
+            name (str): Optional state of the page, part of the baseline name. Defaults to ''.
+            ignore (Iterable[Rect]): Extra regions to ignore, in CSS pixels of the viewport.
+
+        Returns:
+            Dict[str, Any]: 'passed', 'status' ('baseline_created',
+            'missing_baseline', 'identical', 'prefiltered', 'compared' or
+            'size_mismatch'), 'baseline', the comparison counters of
+            `compare()` and, when failed, 'actual' and (after a diff) 'heatmap'.
+        """
+        drv: WebDriver = page.driver
+        window = drv.get_window_size()
+        size = (window["width"], window["height"])
+        path = self.baseline_path(type(page).__name__, size, name)
+        png = drv.get_screenshot_as_png()
+
+        if self.update:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(png)
+            self._baselines.pop(path, None)
+            self.logger.info("Visual baseline recorded: %s", path)
+            return {"passed": True, "status": "baseline_created", "baseline": str(path)}
+        if not path.exists():
+            actual_path = self._write_actual(path, png)
+            self.logger.warning("No visual baseline %s (record it with --update-baselines)", path)
+            return {"passed": False, "status": "missing_baseline", "baseline": str(path), "actual": actual_path}
+
+        regions = list(ignore) + _locator_rects(drv, getattr(page, "VISUAL_IGNORE", ()))
+        result = self.compare_png(png, path, regions, _pixel_ratio(drv) if regions else 1.0)
+        result["baseline"] = str(path)
+        if not result["passed"]:
+            result["actual"] = self._write_actual(path, png)
+            if result.get("_delta") is not None:
+                heatmap_path = self.output_dir / f"{_output_stem(path)}.diff.png"
+                heatmap_path.write_bytes(encode_png(heatmap(self._baselines[path][1], result["_delta"],
+                                                            result["_changed"])))
+                result["heatmap"] = str(heatmap_path)
+            self.logger.warning("Visual regression on %s: %s", path, _public(result))
+        return _public(result)
+
+    def compare_png(self, png: bytes, baseline: Path, ignore: Iterable[Rect] = (),
+                    scale: float = 1.0) -> Dict[str, Any]:
+        """
+        Compare a PNG with a baseline file, using the cheapest test that decides.
+
+        Args:
+            png (bytes): Actual screenshot.
+            baseline (Path): Baseline file.
+            ignore (Iterable[Rect]): Regions to ignore, in CSS pixels.
+            scale (float): Screenshot pixels per CSS pixel. Defaults to 1.0.
+
+        Returns:
+            Dict[str, Any]: As `compare()`, plus 'status' and 'elapsed_ms'.
+        """
+        start = time.perf_counter()
+        digest, expected, expected_hash = self._baseline(baseline)
+        if hashlib.sha256(png).hexdigest() == digest:
+            result = {"passed": True, "status": "identical", "changed_pixels": 0, "diff_ratio": 0.0}
+        else:
+            actual = decode(png)
+            if actual.shape != expected.shape:
+                result = {"passed": False, "status": "size_mismatch", "changed_pixels": None,
+                          "diff_ratio": 1.0, "size": [actual.shape[1], actual.shape[0]],
+                          "baseline_size": [expected.shape[1], expected.shape[0]]}
+            elif (self.prefilter_distance >= 0
+                  and bin(dhash(actual) ^ expected_hash).count("1") <= self.prefilter_distance):
+                result = {"passed": True, "status": "prefiltered", "changed_pixels": 0, "diff_ratio": 0.0}
+            else:
+                mask = ignore_mask(expected.shape[:2], ignore, scale)
+                result = compare(actual, expected, self.tolerance, mask, keep_delta=True)
+                result["passed"] = result["diff_ratio"] <= self.max_diff_ratio
+                result["status"] = "compared"
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    def _write_actual(self, baseline: Path, png: bytes) -> str:
+        """Write the screenshot of a failed check next to the report and return its path."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        actual_path = self.output_dir / f"{_output_stem(baseline)}.actual.png"
+        actual_path.write_bytes(png)
+        return str(actual_path)
+
+    def _baseline(self, path: Path) -> Tuple[str, Any, int]:
+        """Return the sha256, decoded image and dHash of a baseline, decoding it once."""
+        if path not in self._baselines:
+            png = path.read_bytes()
+            image = decode(png)
+            self._baselines[path] = (hashlib.sha256(png).hexdigest(), image, dhash(image))
+        return self._baselines[path]
+
+
+# ----------------------------
+# Vectorized image operations
+# ----------------------------
+def compare(actual: "np.ndarray", expected: "np.ndarray", tolerance: int = 16,
+            mask: Optional["np.ndarray"] = None, keep_delta: bool = False) -> Dict[str, Any]:
+    """
+    Count the pixels whose largest channel difference exceeds `tolerance`.
+
+    Works on uint8 arrays without widening them: |a - b| is computed as
+    max(a, b) - min(a, b), which cannot overflow, and the channel maximum
+    with element-wise maximums (a reduction over the 3-wide axis is ~30x slower).
+
+    Args:
+        actual (np.ndarray): HxWx3 uint8 image.
+        expected (np.ndarray): HxWx3 uint8 image of the same shape.
+        tolerance (int): Channel difference still considered equal. Defaults to 16.
+        mask (Optional[np.ndarray]): HxW bool, True where pixels are compared. Defaults to all.
+        keep_delta (bool): Also return the per-pixel difference ('_delta') and
+            changed map ('_changed') for a heatmap. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: 'changed_pixels', 'diff_ratio' (of compared pixels),
+        'max_delta' and 'bbox' ([x, y, width, height] of the changes, or None).
+    """
+    difference = np.maximum(actual, expected) - np.minimum(actual, expected)
+    delta = np.maximum(np.maximum(difference[..., 0], difference[..., 1]), difference[..., 2])
+    changed = delta > tolerance
+    if mask is not None:
+        changed &= mask
+    compared = int(mask.sum()) if mask is not None else changed.size
+    count = int(np.count_nonzero(changed))
+
+    bbox = None
+    if count:
+        rows = np.flatnonzero(changed.any(axis=1))
+        columns = np.flatnonzero(changed.any(axis=0))
+        bbox = [int(columns[0]), int(rows[0]), int(columns[-1] - columns[0] + 1), int(rows[-1] - rows[0] + 1)]
+    result = {
+        "changed_pixels": count,
+        "diff_ratio": count / compared if compared else 0.0,
+        "max_delta": int(delta[changed].max()) if count else 0,
+        "bbox": bbox,
+    }
+    if keep_delta:
+        result["_delta"], result["_changed"] = delta, changed
+    return result
+
+
+def dhash(image: "np.ndarray") -> int:
+    """
+    Return the 64-bit difference hash of an image (same scheme as utils.screenshot_store).
+
+    Every fourth row and column is averaged into a 9x8 grid of grey levels;
+    each bit tells whether a cell is brighter than its right neighbour.
+
+    Args:
+        image (np.ndarray): HxWx3 uint8 image.
+
+    Returns:
+        int: Hash.
+    """
+    sample = image[::4, ::4].astype(np.uint32)
+    grey = sample[..., 0] * _LUMA[0] + sample[..., 1] * _LUMA[1] + sample[..., 2] * _LUMA[2]
+    height, width = grey.shape
+    row_edges = np.arange(8) * height // 8
+    column_edges = np.arange(9) * width // 9
+    sums = np.add.reduceat(np.add.reduceat(grey, row_edges, axis=0), column_edges, axis=1)
+    counts = np.outer(np.diff(np.append(row_edges, height)), np.diff(np.append(column_edges, width)))
+    cells = sums / counts
+    bits = (cells[:, :-1] > cells[:, 1:]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def ignore_mask(shape: Tuple[int, int], regions: Iterable[Rect], scale: float = 1.0) -> Optional["np.ndarray"]:
+    """
+    Build the comparison mask of an image, False inside the ignored regions.
+
+    Args:
+        shape (Tuple[int, int]): Image height and width.
+        regions (Iterable[Rect]): Regions in CSS pixels.
+        scale (float): Screenshot pixels per CSS pixel. Defaults to 1.0.
+
+    Returns:
+        Optional[np.ndarray]: HxW bool mask, or None when nothing is ignored.
+    """
+    regions = list(regions)
+    if not regions:
+        return None
+    mask = np.ones(shape, dtype=bool)
+    for x, y, width, height in regions:
+        left, top = max(int(x * scale), 0), max(int(y * scale), 0)
+        # Clamped: a region scrolled above or left of the viewport must not become a negative index
+        right, bottom = max(int((x + width) * scale + 0.5), 0), max(int((y + height) * scale + 0.5), 0)
+        mask[top:bottom, left:right] = False
+    return mask
+
+
+def heatmap(expected: "np.ndarray", delta: "np.ndarray", changed: "np.ndarray") -> "np.ndarray":
+    """
+    Draw changed pixels in red (brighter for larger differences) over the dimmed baseline.
+
+    Args:
+        expected (np.ndarray): HxWx3 uint8 baseline.
+        delta (np.ndarray): HxW uint8 largest channel difference.
+        changed (np.ndarray): HxW bool changed pixels.
+
+    Returns:
+        np.ndarray: HxWx3 uint8 image.
+    """
+    out = expected // 3 + 170
+    out[changed] = 0
+    out[changed, 0] = 128 + delta[changed] // 2
+    return out
+
+
+def decode(png: bytes) -> "np.ndarray":
+    """
+    Decode a PNG to an HxWx3 uint8 array (alpha dropped, grey expanded).
+
+    Args:
+        png (bytes): PNG data.
+
+    Returns:
+        np.ndarray: Image.
+
+    Raises:
+        ValueError: If the PNG cannot be decoded.
+    """
+    if Image is not None:
+        import io
+        with Image.open(io.BytesIO(png)) as image:
+            return np.asarray(image.convert("RGB"))
+    decoded = decode_png(png)
+    if decoded is None:
+        raise ValueError("Unsupported PNG (install Pillow to decode it)")
+    width, height, channels, rows = decoded
+    image = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(height, width, channels)
+    if channels < 3:
+        return np.repeat(image[..., :1], 3, axis=2)
+    return np.ascontiguousarray(image[..., :3])
+
+
+def encode_png(image: "np.ndarray") -> bytes:
+    """
+    Encode an HxWx3 uint8 array as PNG (no filtering, zlib level 6).
+
+    Args:
+        image (np.ndarray): Image.
+
+    Returns:
+        bytes: PNG data.
+    """
+    import struct
+    import zlib
+
+    height, width = image.shape[:2]
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b""))
+
+
+# ----------------------------
+# Helpers
+# ----------------------------
+def _locator_rects(drv: WebDriver, locators: Iterable[Tuple[str, str]]) -> List[Rect]:
+    """
+    Viewport rectangles (CSS pixels) of every element matching the locators; missing ones are skipped.
+
+    getBoundingClientRect() is relative to the viewport the screenshot shows,
+    unlike WebElement.rect, which is relative to the page and off by the scroll offset.
+    """
+    elements = []
+    for locator in locators:
+        try:
+            elements.extend(drv.find_elements(*locator))
+        except WebDriverException:
+            continue
+    if not elements:
+        return []
+    try:
+        return [tuple(rect) for rect in drv.execute_script(_VIEWPORT_RECTS_SCRIPT, elements)]
+    except WebDriverException:
+        return []
+
+
+def _pixel_ratio(drv: WebDriver) -> float:
+    """Screenshot pixels per CSS pixel of the current window."""
+    try:
+        return float(drv.execute_script(_PIXEL_RATIO_SCRIPT) or 1)
+    except WebDriverException:
+        return 1.0
+
+
+def _output_stem(baseline: Path) -> str:
+    """'<browser>_<page>_<size>' name of a baseline's output files."""
+    return f"{baseline.parent.parent.name}_{baseline.parent.name}_{baseline.stem}"
+
+
+def _public(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the arrays kept for the heatmap (not JSON-serialisable)."""
+    return {key: value for key, value in result.items() if not key.startswith("_")}
@@ -0,0 +1,332 @@
+from typing import Any, List, Optional, Tuple
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.config_loader import CONFIG
+from utils.dom_scripts import DOM_HELPERS_JS
+
+Locator = Tuple[str, str]
+
+# Default polling interval (s); WebDriverWait's own default is 0.5
+DEFAULT_POLL_FREQUENCY = 0.1
+
+# Wait modes: 'poll' probes over WebDriver every poll_frequency seconds,
+# 'observer' waits inside the browser with a MutationObserver (one round trip)
+POLL_MODE = "poll"
+OBSERVER_MODE = "observer"
+
+# Async script behind the 'observer' mode. Arguments: condition kind,
+# locator strategy, locator value, extra argument, timeout (ms), callback.
+# findAll() and isDisplayed() come from utils.dom_scripts.
+# Resolves with {ok: true, value: ...} as soon as the condition holds, or
+# {ok: false} when the timeout expires. A slow interval re-check covers
+# changes no mutation reports (e.g. CSS transitions finishing).
+_OBSERVER_SCRIPT = DOM_HELPERS_JS + """
+var kind = arguments[0], by = arguments[1], value = arguments[2],
+    extra = arguments[3], timeoutMs = arguments[4],
+    done = arguments[arguments.length - 1];
+
+function check() {
+    var els = findAll(by, value);
+    var shown = els.filter(isDisplayed);
+    switch (kind) {
+        case 'present': return els.length ? {value: els[0]} : null;
+        case 'visible': return shown.length ? {value: shown[0]} : null;
+        case 'all_visible': return els.length && shown.length === els.length ? {value: els} : null;
+        case 'clickable':
+            var ready = shown.filter(function (el) { return !el.disabled; });
+            return ready.length ? {value: ready[0]} : null;
+        case 'invisible': return shown.length ? null : {value: true};
+        case 'absent': return els.length ? null : {value: true};
+        case 'has_attribute':
+            return els.length && els[0].getAttribute(extra) !== null ? {value: els[0].getAttribute(extra)} : null;
+        case 'lacks_attribute':
+            return els.length && els[0].getAttribute(extra) === null ? {value: els[0]} : null;
+        case 'text_contains':
+            return els.length && (els[0].innerText || els[0].textContent || '').indexOf(extra) !== -1
+                ? {value: els[0]} : null;
+    }
+    throw new Error('Unsupported wait condition: ' + kind);
+}
+
+var finished = false, observer = null, timer = null, interval = null;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(interval);
+    done(result);
+}
+function probe() {
+    var hit = check();
+    if (hit) { finish({ok: true, value: hit.value}); }
+}
+
+probe();
+if (!finished) {
+    observer = new MutationObserver(probe);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(probe, 250);
+    timer = setTimeout(function () { finish({ok: false}); }, timeoutMs);
+}
+"""
+
+# Returned by _observe() when the observer could not run and polling must take over
+_FALLBACK = object()
+
+
+class WaitEngine(WebDriverWait):
+    """
+    Central wait engine used by every page object.
+
+    Extends WebDriverWait, so `until()` / `until_not()` keep working, and
+    adds named positive and negative conditions. It is meant to run with
+    implicit waits turned off (`implicit_wait: 0` in config.json): every
+    probe is then a single round trip, negative conditions succeed as soon
+    as the element is gone, and `is_present()` / `is_visible()` answer
+    immediately instead of paying the implicit wait on a miss.
+
+    In 'observer' mode the named conditions are evaluated inside the browser:
+    a MutationObserver installed through `execute_async_script` resolves as
+    soon as the DOM satisfies the condition, so a whole wait costs a single
+    round trip. If the script cannot run (e.g. the page navigates away while
+    waiting), the condition falls back to polling.
+
+    Attributes:
+        driver (WebDriver): Selenium WebDriver instance.
+        timeout (float): Maximum time (s) a condition is waited for.
+        mode (str): 'poll' or 'observer'.
+        last_locator (Optional[Locator]): Locator of the last named condition
+            (used to screenshot the failing element).
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float,
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY,
+        mode: str = POLL_MODE,
+    ):
+        """
+        Initialize the WaitEngine.
+
+        Args:
+            driver (WebDriver): Selenium WebDriver instance.
+            timeout (float): Maximum time (s) a condition is waited for.
+            poll_frequency (float): Interval (s) between probes. Defaults to 0.1.
+            mode (str): 'poll' or 'observer'. Defaults to 'poll'.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        if mode not in (POLL_MODE, OBSERVER_MODE):
+            raise ValueError(f"Unknown wait mode '{mode}', expected '{POLL_MODE}' or '{OBSERVER_MODE}'")
+        super().__init__(
+            driver,
+            timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        )
+        self.driver = driver
+        self.timeout = timeout
+        self.mode = mode
+        self.last_locator: Optional[Locator] = None
+
+    @classmethod
+    def wrap(cls, wait: WebDriverWait) -> "WaitEngine":
+        """
+        Return `wait` itself if it is already a WaitEngine, else an equivalent engine.
+
+        Args:
+            wait (WebDriverWait): Wait passed to a page object.
+
+        Returns:
+            WaitEngine: Engine with the same driver and timeout.
+        """
+        if isinstance(wait, cls):
+            return wait
+        return cls.from_config(wait._driver, wait._timeout)
+
+    @classmethod
+    def from_config(cls, driver: WebDriver, timeout: float) -> "WaitEngine":
+        """
+        Build an engine using 'poll_frequency' and 'wait_mode' from config.json.
+
+        Args:
+            driver (WebDriver): Selenium WebDriver instance.
+            timeout (float): Maximum time (s) a condition is waited for.
+
+        Returns:
+            WaitEngine: Configured engine.
+        """
+        return cls(
+            driver,
+            timeout,
+            poll_frequency=float(CONFIG.get("poll_frequency", DEFAULT_POLL_FREQUENCY)),
+            mode=str(CONFIG.get("wait_mode", POLL_MODE)).lower(),
+        )
+
+    # ----------------------------
+    # Positive conditions
+    # ----------------------------
+    def present(self, locator: Locator) -> WebElement:
+        """Wait until an element is in the DOM and return it."""
+        result = self._observe("present", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(EC.presence_of_element_located(locator))
+
+    def visible(self, locator: Locator) -> WebElement:
+        """Wait until an element is displayed and return it."""
+        result = self._observe("visible", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(EC.visibility_of_element_located(locator))
+
+    def all_visible(self, locator: Locator) -> List[WebElement]:
+        """Wait until every element matching the locator is displayed and return them."""
+        result = self._observe("all_visible", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(EC.visibility_of_all_elements_located(locator))
+
+    def clickable(self, locator: Locator) -> WebElement:
+        """Wait until an element is displayed and enabled and return it."""
+        result = self._observe("clickable", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(EC.element_to_be_clickable(locator))
+
+    def has_attribute(self, locator: Locator, name: str) -> str:
+        """Wait until an element has the attribute `name` and return its value."""
+        result = self._observe("has_attribute", locator, name)
+        if result is not _FALLBACK:
+            return result
+        def condition(d):
+            value = d.find_element(*locator).get_attribute(name)
+            # Wrapped so a present but empty attribute (disabled="") still ends the wait
+            return (value,) if value is not None else False
+        return self.until(condition)[0]
+
+    def text_contains(self, locator: Locator, text: str) -> WebElement:
+        """Wait until an element's text contains `text` and return the element."""
+        result = self._observe("text_contains", locator, text)
+        if result is not _FALLBACK:
+            return result
+        def condition(d):
+            element = d.find_element(*locator)
+            return element if text in element.text else False
+        return self.until(condition)
+
+    def window_count_above(self, count: int) -> bool:
+        """Wait until more than `count` browser windows are open."""
+        return self.until(lambda d: len(d.window_handles) > count)
+
+    # ----------------------------
+    # Negative conditions
+    # ----------------------------
+    def invisible(self, locator: Locator) -> bool:
+        """
+        Wait until no element matching the locator is displayed.
+
+        Succeeds on the first probe that finds no element, without waiting.
+        """
+        result = self._observe("invisible", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(lambda d: not self._any_displayed(d, locator))
+
+    def absent(self, locator: Locator) -> bool:
+        """
+        Wait until no element matching the locator is in the DOM.
+
+        Succeeds on the first probe that finds no element, without waiting.
+        """
+        result = self._observe("absent", locator)
+        if result is not _FALLBACK:
+            return result
+        return self.until(lambda d: not d.find_elements(*locator))
+
+    def lacks_attribute(self, locator: Locator, name: str) -> WebElement:
+        """Wait until an element no longer has the attribute `name` and return it."""
+        result = self._observe("lacks_attribute", locator, name)
+        if result is not _FALLBACK:
+            return result
+        def condition(d):
+            element = d.find_element(*locator)
+            return element if element.get_attribute(name) is None else False
+        return self.until(condition)
+
+    # ----------------------------
+    # In-browser observer
+    # ----------------------------
+    def _observe(self, kind: str, locator: Locator, extra: Optional[str] = None) -> Any:
+        """
+        Wait for a condition inside the browser with a MutationObserver.
+
+        Args:
+            kind (str): Condition name understood by the observer script.
+            locator (Locator): Element locator.
+            extra (Optional[str]): Attribute name or text, depending on `kind`.
+
+        Returns:
+            Any: The condition's value, or `_FALLBACK` when not in observer
+            mode or when the script could not run.
+
+        Raises:
+            TimeoutException: If the condition does not hold within the timeout.
+        """
+        self.last_locator = locator
+        if self.mode != OBSERVER_MODE:
+            return _FALLBACK
+        by, value = locator
+        try:
+            result = self.driver.execute_async_script(
+                _OBSERVER_SCRIPT, kind, by, value, extra, int(self.timeout * 1000)
+            )
+        except TimeoutException as exc:
+            # The driver's script timeout is shorter than this wait
+            raise TimeoutException(f"Timed out waiting for '{kind}' on {locator}") from exc
+        except (JavascriptException, WebDriverException):
+            # Navigation or unsupported page: let polling finish the wait
+            return _FALLBACK
+        if not result or not result.get("ok"):
+            raise TimeoutException(f"Timed out after {self.timeout}s waiting for '{kind}' on {locator}")
+        return result.get("value")
+
+    # ----------------------------
+    # Instant probes (no waiting)
+    # ----------------------------
+    def is_present(self, locator: Locator) -> bool:
+        """Return whether an element is in the DOM right now."""
+        return len(self.driver.find_elements(*locator)) > 0
+
+    def is_visible(self, locator: Locator) -> bool:
+        """Return whether an element is displayed right now."""
+        return self._any_displayed(self.driver, locator)
+
+    @staticmethod
+    def _any_displayed(driver: WebDriver, locator: Locator) -> bool:
+        """
+        Return whether any element matching the locator is displayed.
+
+        Elements that go stale while being checked count as not displayed.
+        """
+        for element in driver.find_elements(*locator):
+            try:
+                if element.is_displayed():
+                    return True
+            except StaleElementReferenceException:
+                continue
+        return False